@@ -0,0 +1,574 @@
+import os
+import json
+import importlib.util
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SQLITE_MAX_PARAMS = 500
+INDEX_TYPES = ("hnsw", "ivf")
+QUANTIZATIONS = ("none", "fp16", "sq8", "pq")
+TRAINING_POINTS_PER_CENTROID = 39
+MAX_TRAINING_ROWS = 100000
+
+
+def _require_faiss() -> None:
+    if importlib.util.find_spec("faiss") is None:
+        raise ImportError(
+            "vectorstore.type 'faiss' needs the optional faiss-cpu package; install it with `pip install faiss-cpu`"
+        )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class AnnVectorStore(VectorStore):
+    """FAISS-backed vectorstore whose files can be shared by several processes.
+
+    A collection directory holds three things:
+
+    * ``docstore.sqlite3`` - chunk id, text and metadata per vector row, plus
+      the collection's ``dim``, ``generation`` and ``indexed_rows``.
+    * ``vectors.<generation>.f32`` - the normalized float32 vectors, appended
+      row by row and read through ``np.memmap``.
+    * ``index.<generation>.faiss`` - an HNSW or IVF index over the first
+      ``indexed_rows`` rows, loaded memory-mapped and read-only.
+
+    Inserts only append to the vectors file and docstore, so they are cheap and
+    immediately searchable: rows past ``indexed_rows`` are scanned exactly.
+    Once ``fold_every`` such rows pile up they are added to the index, which is
+    written to a temporary file and swapped in with ``os.replace``.
+    ``compact`` drops deleted rows and rebuilds everything under a new
+    generation. Writers serialize on a lock file; readers notice a new index or
+    generation on their next search and remap. Similarities are cosine.
+
+    With ``quantization`` (``fp16``, ``sq8`` or ``pq``) the index keeps only
+    compressed codes. It returns ``rescore_factor`` times more candidates,
+    which are re-scored exactly against the memory-mapped float32 rows, so
+    resident memory shrinks without losing ranking quality at the top. Changing
+    the quantization takes effect on the next ``compact``.
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        persist_directory: str = "./data/vectorstore",
+        collection_name: str = "default",
+        index_type: str = "hnsw",
+        hnsw_m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        nlist: int = 1024,
+        nprobe: int = 16,
+        fold_every: int = 10000,
+        read_only: bool = False,
+        quantization: str = "none",
+        pq_m: int = 16,
+        rescore_factor: int = 4,
+    ) -> None:
+        _require_faiss()
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unsupported ANN index type: {index_type}")
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unsupported quantization: {quantization}")
+        self._embedding = embedding
+        self.directory = os.path.join(persist_directory, collection_name)
+        self.index_type = index_type
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.fold_every = fold_every
+        self.read_only = read_only
+        self.quantization = quantization
+        self.pq_m = pq_m
+        self.rescore_factor = max(1, rescore_factor)
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = self._connect(os.path.join(self.directory, "docstore.sqlite3"))
+        self._lock_file = None if read_only else open(os.path.join(self.directory, "write.lock"), "a+")
+        self._loaded: Tuple[Optional[int], int] = (None, 0)
+        self._index = None
+        self._vectors: Optional[np.ndarray] = None
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (id TEXT PRIMARY KEY, row INTEGER NOT NULL, "
+            "content TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_row ON chunks(row)")
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0), ('indexed_rows', 0)")
+        return conn
+
+    def _meta(self) -> Dict[str, int]:
+        return dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def _vectors_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"vectors.{generation}.f32")
+
+    def _index_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"index.{generation}.faiss")
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        if self.read_only:
+            raise RuntimeError("This AnnVectorStore was opened read-only")
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _batched(self, values: Sequence[Any]) -> Iterable[Sequence[Any]]:
+        for start in range(0, len(values), SQLITE_MAX_PARAMS):
+            yield values[start:start + SQLITE_MAX_PARAMS]
+
+    # ------------------------------------------------------------------ reading
+
+    def _refresh(self) -> Dict[str, int]:
+        """Remap the vectors file and reload the index if another writer changed them."""
+        meta = self._meta()
+        dim, generation, indexed_rows = meta.get("dim"), meta["generation"], meta["indexed_rows"]
+        if dim is None:
+            return meta
+        if self._loaded != (generation, indexed_rows):
+            self._index = self._read_index(self._index_path(generation)) if indexed_rows else None
+            self._vectors = None
+            self._loaded = (generation, indexed_rows)
+        path = self._vectors_path(generation)
+        rows = os.path.getsize(path) // (dim * 4) if os.path.exists(path) else 0
+        if self._vectors is None or len(self._vectors) != rows:
+            self._vectors = np.memmap(path, dtype=np.float32, mode="r", shape=(rows, dim)) if rows else np.empty((0, dim), np.float32)
+        return meta
+
+    def _read_index(self, path: str) -> Any:
+        import faiss
+
+        try:
+            return faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            # Older FAISS builds can only mmap IVF lists; fall back to a private copy.
+            return faiss.read_index(path)
+
+    def _search_index(self, query: np.ndarray, fetch: int, rescore: bool = True) -> Dict[int, float]:
+        """Top rows from the ANN index; compressed scores are replaced by exact float32 ones."""
+        if self._index is None or not self._index.ntotal:
+            return {}
+        quantized = self.quantization != "none"
+        fetch = fetch * self.rescore_factor if quantized else fetch
+        self._set_search_params(self._index, fetch)
+        scores, rows = self._index.search(query.reshape(1, -1), fetch)
+        found = {int(row): float(score) for row, score in zip(rows[0], scores[0]) if row >= 0}
+        if not (quantized and rescore and found):
+            return found
+        candidates = np.fromiter(found, dtype=np.int64)
+        exact = self._vectors[np.sort(candidates)] @ query
+        return dict(zip(np.sort(candidates).tolist(), exact.tolist()))
+
+    def _search_rows(self, query: np.ndarray, fetch: int) -> List[Tuple[int, float]]:
+        indexed_rows = self._loaded[1]
+        scored = self._search_index(query, fetch)
+        tail = self._vectors[indexed_rows:]
+        if len(tail):
+            tail_scores = tail @ query
+            top = np.argsort(-tail_scores)[:fetch]
+            scored.update((indexed_rows + int(i), float(tail_scores[i])) for i in top)
+        return sorted(scored.items(), key=lambda item: item[1], reverse=True)
+
+    def _set_search_params(self, index: Any, fetch: int) -> None:
+        import faiss
+
+        if self.index_type == "hnsw":
+            faiss.downcast_index(index).hnsw.efSearch = max(self.ef_search, fetch)
+        else:
+            faiss.extract_index_ivf(index).nprobe = self.nprobe
+
+    def _docs_for_rows(self, rows: Sequence[int], generation: int) -> Optional[Dict[int, Document]]:
+        """Rows mapped to documents, or None when a compaction renumbered rows meanwhile."""
+        docs: Dict[int, Document] = {}
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                if self._meta()["generation"] != generation:
+                    return None
+                for batch in self._batched(list(rows)):
+                    for chunk_id, row, content, metadata in self._conn.execute(
+                        f"SELECT id, row, content, metadata FROM chunks WHERE row IN ({','.join('?' * len(batch))})", batch
+                    ):
+                        docs[row] = Document(id=chunk_id, page_content=content, metadata=json.loads(metadata))
+            finally:
+                self._conn.execute("COMMIT")
+        return docs
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        query = _normalize(np.asarray(embedding, dtype=np.float32).reshape(1, -1))[0]
+        for _ in range(2):
+            with self._lock:
+                meta = self._refresh()
+                if meta.get("dim") is None:
+                    return []
+                # Over-fetch so rows deleted since the last compaction do not shrink the result.
+                scored = self._search_rows(query, max(k * 2, k + 10))
+            docs = self._docs_for_rows([row for row, _ in scored], meta["generation"])
+            if docs is not None:
+                return [(docs[row], score) for row, score in scored if row in docs][:k]
+        return []
+
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self._embedding.embed_query(query), k, **kwargs)
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, **kwargs)]
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Scores are already cosine similarities.
+        return lambda score: score
+
+    def get_by_ids(self, ids: Sequence[str], /) -> List[Document]:
+        found: Dict[str, Document] = {}
+        with self._lock:
+            for batch in self._batched(list(ids)):
+                for chunk_id, content, metadata in self._conn.execute(
+                    f"SELECT id, content, metadata FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch
+                ):
+                    found[chunk_id] = Document(id=chunk_id, page_content=content, metadata=json.loads(metadata))
+        return [found[chunk_id] for chunk_id in ids if chunk_id in found]
+
+    def get_embeddings(self, ids: Sequence[str]) -> Dict[str, List[float]]:
+        """Stored (normalized) vectors by chunk id, read from the memory-mapped vectors file."""
+        with self._lock:
+            meta = self._refresh()
+            if meta.get("dim") is None:
+                return {}
+            rows: Dict[str, int] = {}
+            for batch in self._batched(list(ids)):
+                rows.update(self._conn.execute(
+                    f"SELECT id, row FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch
+                ).fetchall())
+            return {chunk_id: self._vectors[row].tolist() for chunk_id, row in rows.items() if row < len(self._vectors)}
+
+    def list_chunks(self, batch_size: int = 5000) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(id, metadata)`` for every stored chunk."""
+        last_id = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, metadata FROM chunks WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for chunk_id, metadata in rows:
+                yield chunk_id, json.loads(metadata)
+            last_id = rows[-1][0]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            meta = self._refresh()
+            rows = 0 if self._vectors is None else len(self._vectors)
+            return {
+                "type": self.index_type,
+                "chunks": self.count(),
+                "vector_rows": rows,
+                "indexed_rows": meta["indexed_rows"],
+                "pending_rows": rows - meta["indexed_rows"],
+                "generation": meta["generation"],
+                "dim": meta.get("dim"),
+                "disk_bytes": sum(
+                    os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory)
+                ),
+            }
+
+    def memory_footprint(self) -> Dict[str, Any]:
+        """Bytes held by the index versus the float32 vectors it stands in for.
+
+        ``index_bytes`` is what a process keeps resident for search (codes plus
+        graph or inverted lists); the float32 file is only paged in for the
+        rows that get re-scored.
+        """
+        with self._lock:
+            meta = self._refresh()
+            dim = meta.get("dim") or 0
+            index_path = self._index_path(meta["generation"])
+            index_bytes = os.path.getsize(index_path) if meta["indexed_rows"] and os.path.exists(index_path) else 0
+            float32_bytes = meta["indexed_rows"] * dim * 4
+            return {
+                "quantization": self.quantization,
+                "indexed_rows": meta["indexed_rows"],
+                "index_bytes": index_bytes,
+                "index_bytes_per_vector": round(index_bytes / meta["indexed_rows"], 1) if meta["indexed_rows"] else 0.0,
+                "float32_bytes": float32_bytes,
+                "index_to_float32_ratio": round(index_bytes / float32_bytes, 3) if float32_bytes else 0.0,
+                "docstore_bytes": os.path.getsize(os.path.join(self.directory, "docstore.sqlite3")),
+            }
+
+    def evaluate_recall(self, k: int = 10, sample_size: int = 100, seed: int = 0) -> Dict[str, Any]:
+        """Recall@k of the index against exact float32 search, with and without re-scoring.
+
+        Queries are stored vectors sampled from the indexed rows; the ground
+        truth is a brute-force scan of the memory-mapped float32 file.
+        """
+        with self._lock:
+            meta = self._refresh()
+            indexed_rows = meta["indexed_rows"]
+            if not indexed_rows:
+                return {"k": k, "queries": 0, "recall": None, "recall_without_rescore": None}
+            vectors = self._vectors[:indexed_rows]
+            rng = np.random.default_rng(seed)
+            queries = np.ascontiguousarray(vectors[np.sort(rng.choice(indexed_rows, min(sample_size, indexed_rows), replace=False))])
+            best = np.empty((len(queries), 0), dtype=np.int64)
+            best_scores = np.empty((len(queries), 0), dtype=np.float32)
+            for start in range(0, indexed_rows, 50000):
+                scores = queries @ np.asarray(vectors[start:start + 50000]).T
+                merged_scores = np.concatenate([best_scores, scores], axis=1)
+                merged_rows = np.concatenate([best, np.broadcast_to(np.arange(start, start + scores.shape[1]), scores.shape)], axis=1)
+                top = np.argsort(-merged_scores, axis=1)[:, :k]
+                best_scores = np.take_along_axis(merged_scores, top, axis=1)
+                best = np.take_along_axis(merged_rows, top, axis=1)
+            hits = {True: 0, False: 0}
+            for query, truth in zip(queries, best):
+                for rescore in (True, False):
+                    found = self._search_index(query, k, rescore=rescore)
+                    top_rows = sorted(found, key=found.get, reverse=True)[:k]
+                    hits[rescore] += len(set(top_rows) & set(truth.tolist()))
+        total = k * len(queries)
+        return {
+            "k": k,
+            "queries": len(queries),
+            "quantization": self.quantization,
+            "recall": round(hits[True] / total, 4),
+            "recall_without_rescore": round(hits[False] / total, 4),
+        }
+
+    # ------------------------------------------------------------------ writing
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        return self.add_vectors(self._embedding.embed_documents(texts), texts, metadatas, ids)
+
+    def add_vectors(
+        self,
+        vectors: Sequence[Sequence[float]],
+        texts: Sequence[str],
+        metadatas: Optional[Sequence[dict]] = None,
+        ids: Optional[Sequence[str]] = None,
+    ) -> List[str]:
+        """Append precomputed vectors; an existing id is re-pointed at its new row."""
+        import uuid
+
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        metadatas = list(metadatas) if metadatas else [{} for _ in texts]
+        with self._write_lock():
+            meta = self._meta()
+            dim = meta.get("dim")
+            if dim is None:
+                dim = matrix.shape[1]
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('dim', ?)", (dim,))
+            elif matrix.shape[1] != dim:
+                raise ValueError(f"Vector dimension {matrix.shape[1]} does not match collection dimension {dim}")
+            path = self._vectors_path(meta["generation"])
+            with open(path, "ab") as f:
+                first_row = f.tell() // (dim * 4)
+                f.write(matrix.tobytes())
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO chunks (id, row, content, metadata) VALUES (?, ?, ?, ?)",
+                    [
+                        (chunk_id, first_row + offset, text, json.dumps(metadata, default=str))
+                        for offset, (chunk_id, text, metadata) in enumerate(zip(ids, texts, metadatas))
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            if first_row + len(ids) - meta["indexed_rows"] >= self.fold_every:
+                self._fold(meta["generation"], first_row + len(ids))
+        return ids
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        """Drop ids from the docstore; their vectors stay as dead rows until ``compact``."""
+        if not ids:
+            return False
+        with self._write_lock():
+            for batch in self._batched(list(ids)):
+                self._conn.execute(f"DELETE FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch)
+        return True
+
+    def flush(self) -> None:
+        """Fold every appended row into the index now."""
+        with self._write_lock():
+            meta = self._meta()
+            if meta.get("dim") is None:
+                return
+            rows = os.path.getsize(self._vectors_path(meta["generation"])) // (meta["dim"] * 4)
+            if rows > meta["indexed_rows"]:
+                self._fold(meta["generation"], rows)
+
+    def _min_training_rows(self) -> int:
+        # Product quantization learns 256 centroids per sub-vector.
+        return 256 * TRAINING_POINTS_PER_CENTROID if self.quantization == "pq" else 1
+
+    def _index_spec(self, dim: int, rows: int) -> str:
+        if self.quantization == "pq" and dim % self.pq_m:
+            raise ValueError(f"pq_m={self.pq_m} must divide the vector dimension {dim}")
+        encoding = {"none": "Flat", "fp16": "SQfp16", "sq8": "SQ8", "pq": f"PQ{self.pq_m}"}[self.quantization]
+        if self.index_type == "hnsw":
+            return f"HNSW{self.hnsw_m}" if encoding == "Flat" else f"HNSW{self.hnsw_m},{encoding}"
+        # Keep roughly 40 training points per list so small collections still train.
+        nlist = max(1, min(self.nlist, rows // TRAINING_POINTS_PER_CENTROID))
+        return f"IVF{nlist},{encoding}"
+
+    def _new_index(self, dim: int, vectors: np.ndarray) -> Any:
+        import faiss
+
+        index = faiss.index_factory(dim, self._index_spec(dim, len(vectors)), faiss.METRIC_INNER_PRODUCT)
+        if self.index_type == "hnsw":
+            faiss.downcast_index(index).hnsw.efConstruction = self.ef_construction
+        if not index.is_trained:
+            sample = np.sort(np.random.default_rng(0).choice(len(vectors), min(len(vectors), MAX_TRAINING_ROWS), replace=False))
+            index.train(np.ascontiguousarray(vectors[sample]))
+        return index
+
+    def _load_writable_index(self, generation: int, indexed_rows: int, dim: int, vectors: np.ndarray) -> Any:
+        import faiss
+
+        if indexed_rows:
+            index = faiss.read_index(self._index_path(generation))
+            if self.index_type == "hnsw":
+                faiss.downcast_index(index).hnsw.efConstruction = self.ef_construction
+            return index
+        return self._new_index(dim, vectors)
+
+    def _fold(self, generation: int, rows: int) -> None:
+        """Add rows ``indexed_rows..rows`` to the index and atomically replace the index file."""
+        import faiss
+
+        meta = self._meta()
+        dim, indexed_rows = meta["dim"], meta["indexed_rows"]
+        if not indexed_rows and rows < self._min_training_rows():
+            logger.debug(f"Waiting for {self._min_training_rows()} rows before training the index ({rows} so far)")
+            return
+        vectors = np.memmap(self._vectors_path(generation), dtype=np.float32, mode="r", shape=(rows, dim))
+        index = self._load_writable_index(generation, indexed_rows, dim, vectors)
+        for start in range(indexed_rows, rows, 50000):
+            index.add(np.ascontiguousarray(vectors[start:min(rows, start + 50000)]))
+        path = self._index_path(generation)
+        faiss.write_index(index, path + ".tmp")
+        os.replace(path + ".tmp", path)
+        self._conn.execute("UPDATE meta SET value = ? WHERE key = 'indexed_rows'", (rows,))
+        logger.info(f"Indexed {rows - indexed_rows} new vectors into {path} ({rows} total)")
+
+    def compact(self) -> Dict[str, int]:
+        """Rewrite live rows into a new generation and rebuild the index from scratch."""
+        import faiss
+
+        with self._write_lock():
+            meta = self._meta()
+            dim, generation = meta.get("dim"), meta["generation"]
+            if dim is None:
+                return {"live_rows": 0, "dropped_rows": 0}
+            old_path = self._vectors_path(generation)
+            old_rows = os.path.getsize(old_path) // (dim * 4)
+            old = np.memmap(old_path, dtype=np.float32, mode="r", shape=(old_rows, dim)) if old_rows else None
+            live = self._conn.execute("SELECT id, row FROM chunks ORDER BY row").fetchall()
+            new_generation = generation + 1
+            new_path = self._vectors_path(new_generation)
+            with open(new_path + ".tmp", "wb") as f:
+                for start in range(0, len(live), 50000):
+                    rows = [row for _, row in live[start:start + 50000]]
+                    f.write(np.ascontiguousarray(old[rows]).tobytes())
+            os.replace(new_path + ".tmp", new_path)
+            indexed_rows = len(live) if len(live) >= max(1, self._min_training_rows()) else 0
+            if indexed_rows:
+                vectors = np.memmap(new_path, dtype=np.float32, mode="r", shape=(len(live), dim))
+                index = self._new_index(dim, vectors)
+                for start in range(0, len(live), 50000):
+                    index.add(np.ascontiguousarray(vectors[start:start + 50000]))
+                index_path = self._index_path(new_generation)
+                faiss.write_index(index, index_path + ".tmp")
+                os.replace(index_path + ".tmp", index_path)
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE chunks SET row = ? WHERE id = ?", [(row, chunk_id) for row, (chunk_id, _) in enumerate(live)]
+                )
+                self._conn.execute("UPDATE meta SET value = ? WHERE key = 'generation'", (new_generation,))
+                self._conn.execute("UPDATE meta SET value = ? WHERE key = 'indexed_rows'", (indexed_rows,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            # Readers still holding the old generation keep their mappings until they notice the switch.
+            for path in (old_path, self._index_path(generation)):
+                if os.path.exists(path):
+                    os.remove(path)
+        logger.info(f"Compacted {self.directory}: kept {len(live)} of {old_rows} vector rows")
+        return {"live_rows": len(live), "dropped_rows": old_rows - len(live)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._index = self._vectors = None
+            self._conn.close()
+            if self._lock_file is not None:
+                self._lock_file.close()
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> "AnnVectorStore":
+        store = cls(embedding, **kwargs)
+        store.add_texts(texts, metadatas=metadatas, ids=ids)
+        return store
@@ -0,0 +1,129 @@
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from omegaconf import DictConfig
+from langchain_core.documents import Document
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundIndexer:
+    """Single writer thread that commits chunks to the persistent stores in batches.
+
+    Request threads hand over chunk lists with ``submit`` and return at once.
+    The writer drains the bounded queue into batches of up to ``batch_size``
+    chunks, waiting at most ``max_wait_ms`` for a batch to fill, drops
+    repeated ids and calls ``write`` once per batch. Only this thread writes,
+    so concurrent requests never contend on the vectorstore. When the queue is
+    full ``submit`` returns False and the caller should write inline.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Document]], Any],
+        max_queue_size: int = 64,
+        batch_size: int = 256,
+        max_wait_ms: float = 200.0,
+    ) -> None:
+        self.write = write
+        self.batch_size = max(1, batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self._queue: "queue.Queue[Optional[List[Document]]]" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._stats = {"submitted": 0, "rejected": 0, "batches": 0, "chunks_written": 0, "failed_batches": 0}
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="background-indexer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(
+        cls,
+        write: Callable[[List[Document]], Any],
+        config: Optional[Union[DictConfig, Dict[str, Any]]] = None,
+    ) -> "BackgroundIndexer":
+        config = ensure_config_dict(config or {})
+        return cls(
+            write,
+            max_queue_size=config.get("max_queue_size", 64),
+            batch_size=config.get("batch_size", 256),
+            max_wait_ms=config.get("max_wait_ms", 200.0),
+        )
+
+    def submit(self, documents: List[Document]) -> bool:
+        """Queue ``documents`` for writing; False if the queue is full or the indexer is closed."""
+        if not documents:
+            return True
+        if not self._thread.is_alive():
+            return False
+        try:
+            self._queue.put_nowait(list(documents))
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["rejected"] += 1
+            return False
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+        return True
+
+    def _collect(self, first: List[Document]) -> Tuple[List[List[Document]], bool]:
+        items = [first]
+        size = len(first)
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while size < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return items, True
+            items.append(item)
+            size += len(item)
+        return items, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                return
+            items, stop = self._collect(first)
+            batch: Dict[str, Document] = {}
+            for item in items:
+                for doc in item:
+                    batch.setdefault(doc.id, doc)
+            try:
+                self.write(list(batch.values()))
+                with self._stats_lock:
+                    self._stats["batches"] += 1
+                    self._stats["chunks_written"] += len(batch)
+            except Exception as e:
+                logger.warning(f"Background indexing of {len(batch)} chunks failed: {e}")
+                with self._stats_lock:
+                    self._stats["failed_batches"] += 1
+            for _ in range(len(items) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until every chunk queued so far has been written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def close(self) -> None:
+        """Write everything still queued, then stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
@@ -1,9 +1,18 @@
-from typing import Any, Dict, Optional, Sequence
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, Optional, Sequence, Tuple, Union
 
 from langchain.agents import create_agent
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from omegaconf import DictConfig
 
-from utils.llm_output import preprocess_response
+from base.cache import PersistentLRUCache
+from utils.config import ensure_config_dict
+from utils.llm_output import ThinkTagFilter, get_text_from_response, preprocess_response
 from langgraph.typing import InputT, OutputT, StateT
 from langchain.agents.middleware.types import (
     AgentMiddleware,
@@ -16,6 +25,8 @@ from langchain.agents.middleware.types import (
     _OutputAgentState,
 )
 
+logger = logging.getLogger(__name__)
+
 valid_agent_arg_list = [
     "middleware",
     "response_format",
@@ -30,6 +41,128 @@ valid_agent_arg_list = [
     "cache"
 ]
 
+_HASHABLE_PRIMITIVES = (str, int, float, bool, bytes, type(None))
+
+
+class AgentGraphCache:
+    """Bounded LRU cache of compiled agent graphs.
+
+    ``create_agent`` compiles a new LangGraph state graph on every call, so
+    constructing an agent per request repeats that work. Graphs are keyed by
+    model identity, system prompt, tools and agent kwargs; objects that are
+    keyed by ``id()`` are kept alive by the cache entry so ids cannot be reused
+    while the entry exists. Compiled graphs are stateless and safe to share.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._graphs: "OrderedDict[Hashable, Tuple[Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _freeze(value: Any) -> Hashable:
+        if isinstance(value, _HASHABLE_PRIMITIVES):
+            return value
+        if isinstance(value, (list, tuple)):
+            return tuple(AgentGraphCache._freeze(v) for v in value)
+        return ("id", id(value))
+
+    @classmethod
+    def make_key(
+        cls,
+        model: BaseChatModel,
+        system_prompt: Optional[str],
+        tools: Optional[Sequence[Any]],
+        agent_kwargs: Dict[str, Any],
+    ) -> Hashable:
+        return (
+            id(model),
+            system_prompt,
+            cls._freeze(list(tools or [])),
+            tuple(sorted((name, cls._freeze(value)) for name, value in agent_kwargs.items())),
+        )
+
+    def get_or_build(self, key: Hashable, refs: Any, builder: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._graphs.get(key)
+            if entry is not None:
+                self._graphs.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        graph = builder()
+        with self._lock:
+            self.misses += 1
+            self._graphs[key] = (refs, graph)
+            while len(self._graphs) > self.max_size:
+                self._graphs.popitem(last=False)
+        return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._graphs), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+agent_graph_cache = AgentGraphCache()
+
+_llm_response_cache: Optional[PersistentLRUCache] = None
+
+
+def set_llm_response_cache(cache: Optional[PersistentLRUCache]) -> None:
+    """Install (or remove, with ``None``) the process-wide LLM response cache used by ``BaseAgent``."""
+    global _llm_response_cache
+    _llm_response_cache = cache
+
+
+def get_llm_response_cache() -> Optional[PersistentLRUCache]:
+    return _llm_response_cache
+
+
+def configure_llm_response_cache(config: Union[DictConfig, Dict[str, Any]]) -> Optional[PersistentLRUCache]:
+    """Build the response cache from the ``llm_cache`` section of the app config and install it."""
+    cache_config = ensure_config_dict(config).get("llm_cache", {}) or {}
+    cache = PersistentLRUCache.from_config(cache_config, table_name="llm_responses") if cache_config.get("enabled", False) else None
+    set_llm_response_cache(cache)
+    return cache
+
+
+def _model_identity(model: BaseChatModel) -> str:
+    try:
+        params = model._identifying_params
+    except Exception:
+        params = {}
+    return f"{type(model).__name__}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+def _is_deterministic(model: BaseChatModel) -> bool:
+    # An unset temperature means the provider default (usually 1.0), i.e. sampled replies.
+    temperature = getattr(model, "temperature", None)
+    return temperature is not None and temperature == 0
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Extract the text of a streamed message chunk (string or content-block list)."""
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block if isinstance(block, str) else str(block.get("text", ""))
+            for block in content
+            if isinstance(block, str) or (isinstance(block, dict) and block.get("type") == "text")
+        )
+    return ""
+
+
+# Agent kwargs that do not change single-turn behaviour, so they do not
+# prevent the direct model fast path.
+fast_path_compatible_arg_list = ["name", "debug"]
+
 
 class BaseAgent:
 
@@ -45,16 +178,30 @@ class BaseAgent:
         self._system_prompt = system_prompt
         self._tools = tools
         self._agent_kwargs = {k: v for k, v in kwargs.items() if k in valid_agent_arg_list}
-        self._agent = self._build_agent()
+        self._use_fast_path = kwargs.get("use_fast_path", True) and self._supports_fast_path()
+        self._agent = None if self._use_fast_path else self._build_agent()
         self.exclude_think = kwargs.get("exclude_think", True)
         self.jsonalize_output = kwargs.get("jsonalize_output", True)
+        self.use_cache = kwargs.get("use_cache", True)
+
+    def _supports_fast_path(self) -> bool:
+        """Whether a call is exactly one model turn, i.e. no tools and no graph-level options."""
+        if self._tools:
+            return False
+        return all(k in fast_path_compatible_arg_list for k in self._agent_kwargs)
 
     def _build_agent(self):
-        return create_agent(
-            model=self._model,
-            tools=self._tools,
-            system_prompt=self._system_prompt,
-            **self._agent_kwargs,
+        key = agent_graph_cache.make_key(self._model, self._system_prompt, self._tools, self._agent_kwargs)
+        refs = (self._model, self._tools, dict(self._agent_kwargs))
+        return agent_graph_cache.get_or_build(
+            key,
+            refs,
+            lambda: create_agent(
+                model=self._model,
+                tools=self._tools,
+                system_prompt=self._system_prompt,
+                **self._agent_kwargs,
+            ),
         )
 
     def set_prompts(self, system_prompt: Optional[str] = None, task_prompt: Optional[str] = None) -> None:
@@ -63,7 +210,7 @@ class BaseAgent:
             self._system_prompt = system_prompt
         if task_prompt is not None:
             self._task_prompt = task_prompt
-        self._agent = self._build_agent()
+        self._agent = None if self._use_fast_path else self._build_agent()
 
     def _build_prompt(self, variables: Dict[str, Any], task_prompt: Optional[str] = None) -> _InputAgentState:
         """Build chat messages for model call."""
@@ -77,11 +224,123 @@ class BaseAgent:
         }
         return prompt
 
-    def invoke(self, input_dict: dict, task_prompt: Optional[str] = None) -> Any:
-        """Invoke the agent with the given input text."""
-        input_prompt = self._build_prompt(input_dict, task_prompt=task_prompt)
-        raw_output = self._agent.invoke(input_prompt)
+    def _build_model_messages(self, input_prompt: _InputAgentState) -> list:
+        """Prepend the system prompt the same way ``create_agent`` does."""
+        messages = list(input_prompt["messages"])
+        if self._system_prompt:
+            messages.insert(0, {"role": "system", "content": self._system_prompt})
+        return messages
+
+    def _run(self, input_prompt: _InputAgentState) -> Dict[str, Any]:
+        """Run one agent call and return a state dict with a ``messages`` list."""
+        if not self._use_fast_path:
+            return self._agent.invoke(input_prompt)
+        messages = self._build_model_messages(input_prompt)
+        return {"messages": [*messages, self._model.invoke(messages)]}
+
+    async def _arun(self, input_prompt: _InputAgentState) -> Dict[str, Any]:
+        if not self._use_fast_path:
+            return await self._agent.ainvoke(input_prompt)
+        messages = self._build_model_messages(input_prompt)
+        return {"messages": [*messages, await self._model.ainvoke(messages)]}
+
+    def _cache_key(self, input_prompt: _InputAgentState) -> Optional[str]:
+        """Content hash of (model, system prompt, formatted task prompt), or None when caching does not apply."""
+        if not self.use_cache or _llm_response_cache is None or self._tools or not _is_deterministic(self._model):
+            return None
+        payload = json.dumps(
+            [_model_identity(self._model), self._system_prompt, input_prompt["messages"]],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _postprocess(self, raw_output: Any, cache_key: Optional[str]) -> Any:
         output = preprocess_response(
             raw_output, only_text=True, exclude_think=self.exclude_think, json_output=self.jsonalize_output
         )
+        # Store only responses that post-processed cleanly so a malformed reply is retried next time.
+        if cache_key is not None and _llm_response_cache is not None:
+            text = get_text_from_response(raw_output)
+            if isinstance(text, str):
+                _llm_response_cache.set(cache_key, text)
         return output
+
+    def _cached_output(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if cache_key is None or _llm_response_cache is None:
+            return None
+        text = _llm_response_cache.get(cache_key)
+        if text is None:
+            return None
+        return {"messages": [AIMessage(content=text)]}
+
+    def invoke(self, input_dict: dict, task_prompt: Optional[str] = None) -> Any:
+        """Invoke the agent with the given input text."""
+        input_prompt = self._build_prompt(input_dict, task_prompt=task_prompt)
+        cache_key = self._cache_key(input_prompt)
+        cached = self._cached_output(cache_key)
+        if cached is not None:
+            return preprocess_response(
+                cached, only_text=True, exclude_think=self.exclude_think, json_output=self.jsonalize_output
+            )
+        raw_output = self._run(input_prompt)
+        return self._postprocess(raw_output, cache_key)
+
+    async def ainvoke(self, input_dict: dict, task_prompt: Optional[str] = None) -> Any:
+        """Asynchronously invoke the agent without blocking the event loop."""
+        input_prompt = self._build_prompt(input_dict, task_prompt=task_prompt)
+        cache_key = self._cache_key(input_prompt)
+        cached = self._cached_output(cache_key)
+        if cached is not None:
+            return preprocess_response(
+                cached, only_text=True, exclude_think=self.exclude_think, json_output=self.jsonalize_output
+            )
+        raw_output = await self._arun(input_prompt)
+        return self._postprocess(raw_output, cache_key)
+
+    def _stream_chunks(self, input_prompt: _InputAgentState) -> Iterator[str]:
+        if self._use_fast_path:
+            for chunk in self._model.stream(self._build_model_messages(input_prompt)):
+                yield _chunk_text(chunk)
+            return
+        for message, _ in self._agent.stream(input_prompt, stream_mode="messages"):
+            if isinstance(message, AIMessageChunk):
+                yield _chunk_text(message)
+
+    async def _astream_chunks(self, input_prompt: _InputAgentState) -> AsyncIterator[str]:
+        if self._use_fast_path:
+            async for chunk in self._model.astream(self._build_model_messages(input_prompt)):
+                yield _chunk_text(chunk)
+            return
+        async for message, _ in self._agent.astream(input_prompt, stream_mode="messages"):
+            if isinstance(message, AIMessageChunk):
+                yield _chunk_text(message)
+
+    def stream(self, input_dict: dict, task_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream the reply as text deltas, stripping ``<think>`` blocks on the fly.
+
+        Streaming yields raw text, so JSON post-processing and the response cache do not apply.
+        """
+        input_prompt = self._build_prompt(input_dict, task_prompt=task_prompt)
+        think_filter = ThinkTagFilter() if self.exclude_think else None
+        for text in self._stream_chunks(input_prompt):
+            text = think_filter.feed(text) if think_filter else text
+            if text:
+                yield text
+        if think_filter:
+            tail = think_filter.flush()
+            if tail:
+                yield tail
+
+    async def astream(self, input_dict: dict, task_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """Async counterpart of :meth:`stream`."""
+        input_prompt = self._build_prompt(input_dict, task_prompt=task_prompt)
+        think_filter = ThinkTagFilter() if self.exclude_think else None
+        async for text in self._astream_chunks(input_prompt):
+            text = think_filter.feed(text) if think_filter else text
+            if text:
+                yield text
+        if think_filter:
+            tail = think_filter.flush()
+            if tail:
+                yield tail
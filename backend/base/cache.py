@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+from omegaconf import DictConfig
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentLRUCache:
+    """Two-tier key/value cache: an in-memory LRU backed by an optional SQLite file.
+
+    Values must be JSON-serializable. Entries expire after ``ttl_seconds``
+    (``None`` disables expiry) and each tier is bounded by entry count; the
+    disk tier evicts by last access time, so it behaves as an LRU as well.
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_memory_entries: int = 512,
+        max_disk_entries: Optional[int] = 10000,
+        ttl_seconds: Optional[float] = None,
+        table_name: str = "cache",
+    ) -> None:
+        self.path = path
+        self.max_memory_entries = max(0, int(max_memory_entries))
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        self.table_name = table_name
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expired": 0}
+        if path:
+            self._conn = self._connect(path)
+
+    @classmethod
+    def from_config(cls, config: Union[DictConfig, Dict[str, Any]], **overrides: Any) -> "PersistentLRUCache":
+        config = {**ensure_config_dict(config or {}), **overrides}
+        return cls(
+            path=config.get("path"),
+            max_memory_entries=config.get("max_memory_entries", 512),
+            max_disk_entries=config.get("max_disk_entries", 10000),
+            ttl_seconds=config.get("ttl_seconds"),
+            table_name=config.get("table_name", "cache"),
+        )
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_accessed ON {self.table_name}(accessed_at)")
+        return conn
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _remember(self, key: str, value: Any, stored_at: float) -> None:
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = (value, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if not self._is_expired(stored_at, now):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["expired"] += 1
+            if self._conn is not None:
+                row = self._conn.execute(
+                    f"SELECT value, stored_at FROM {self.table_name} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if not self._is_expired(row[1], now):
+                        self._conn.execute(
+                            f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        value = json.loads(row[0])
+                        self._remember(key, value, row[1])
+                        self._stats["disk_hits"] += 1
+                        return value
+                    self._conn.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                    self._stats["expired"] += 1
+            self._stats["misses"] += 1
+            return default
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self._stats["sets"] += 1
+            if self._conn is not None:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table_name} (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now),
+                )
+                self._evict_disk_overflow()
+
+    def _evict_disk_overflow(self) -> None:
+        if self.max_disk_entries is None:
+            return
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+        overflow = count - int(self.max_disk_entries)
+        if overflow > 0:
+            self._conn.execute(
+                f"DELETE FROM {self.table_name} WHERE key IN "
+                f"(SELECT key FROM {self.table_name} ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._stats["evictions"] += overflow
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._conn is not None:
+                self._conn.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers and return how many disk rows were removed."""
+        if self.ttl_seconds is None:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for key in [k for k, (_, stored_at) in self._memory.items() if stored_at < cutoff]:
+                del self._memory[key]
+            if self._conn is None:
+                return 0
+            removed = self._conn.execute(f"DELETE FROM {self.table_name} WHERE stored_at < ?", (cutoff,)).rowcount
+            self._stats["expired"] += removed
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute(f"DELETE FROM {self.table_name}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            hits = stats["memory_hits"] + stats["disk_hits"]
+            lookups = hits + stats["misses"]
+            stats["hits"] = hits
+            stats["hit_ratio"] = round(hits / lookups, 4) if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+            if self._conn is not None:
+                stats["disk_entries"] = self._conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+            return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
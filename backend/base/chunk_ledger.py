@@ -0,0 +1,143 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+SQLITE_MAX_PARAMS = 500
+
+
+class ChunkLedger:
+    """SQLite ledger of indexed chunks: source, fetch time and retrieval hits.
+
+    The vectorstore only holds vectors and text; eviction decisions are made
+    from this table instead. Re-fetching a page whose chunks are unchanged
+    moves their ``fetched_at`` forward. Retrieval hits are counted in memory
+    and written in one statement every ``flush_interval`` seconds or
+    ``flush_size`` ids, so the request path does not pay for a write per hit.
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = 5.0, flush_size: int = 256) -> None:
+        self.path = path or ":memory:"
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._lock = threading.RLock()
+        self._conn = self._connect(self.path)
+        self._pending_hits: Counter = Counter()
+        self._last_flush = time.monotonic()
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (id TEXT PRIMARY KEY, source TEXT, fetched_at REAL NOT NULL, "
+            "indexed_at REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0, last_hit_at REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ledger_fetched ON chunks(fetched_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ledger_recency ON chunks(COALESCE(last_hit_at, indexed_at), hits)")
+        return conn
+
+    def _batched(self, values: Sequence[str]) -> Iterable[Sequence[str]]:
+        for start in range(0, len(values), SQLITE_MAX_PARAMS):
+            yield values[start:start + SQLITE_MAX_PARAMS]
+
+    def record_added(self, documents: Sequence[Document]) -> None:
+        """Register chunks by ``id``, taking ``source`` and ``fetched_at`` from their metadata."""
+        now = time.time()
+        rows = [
+            (doc.id, (doc.metadata or {}).get("source"), float((doc.metadata or {}).get("fetched_at") or now), now)
+            for doc in documents
+            if doc.id
+        ]
+        self.record_entries(rows)
+
+    def record_entries(self, rows: Sequence[Tuple[str, Optional[str], float, float]]) -> None:
+        """Upsert ``(id, source, fetched_at, indexed_at)`` rows, keeping the newest ``fetched_at``."""
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO chunks (id, source, fetched_at, indexed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET fetched_at = MAX(fetched_at, excluded.fetched_at)",
+                rows,
+            )
+
+    def record_hits(self, ids: Sequence[str]) -> None:
+        with self._lock:
+            self._pending_hits.update(chunk_id for chunk_id in ids if chunk_id)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            if due or len(self._pending_hits) >= self.flush_size:
+                self.flush_hits()
+
+    def flush_hits(self) -> None:
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending_hits:
+                return
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE chunks SET hits = hits + ?, last_hit_at = ? WHERE id = ?",
+                [(count, now, chunk_id) for chunk_id, count in self._pending_hits.items()],
+            )
+            self._pending_hits.clear()
+
+    def expired(self, max_age_seconds: float) -> List[str]:
+        """Ids of chunks whose page was last fetched more than ``max_age_seconds`` ago."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM chunks WHERE fetched_at < ?", (time.time() - max_age_seconds,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def least_recently_used(self, count: int, exclude: Sequence[str] = ()) -> List[str]:
+        """The ``count`` chunks retrieved longest ago (never-retrieved ones by index time), fewest hits first."""
+        if count <= 0:
+            return []
+        excluded = set(exclude)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM chunks ORDER BY COALESCE(last_hit_at, indexed_at), hits LIMIT ?",
+                (count + len(excluded),),
+            ).fetchall()
+        return [row[0] for row in rows if row[0] not in excluded][:count]
+
+    def delete(self, ids: Sequence[str]) -> None:
+        with self._lock:
+            for batch in self._batched(list(ids)):
+                self._conn.execute(f"DELETE FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self.flush_hits()
+            chunks, hits, never_hit, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0), COALESCE(SUM(hits = 0), 0), MIN(fetched_at), MAX(fetched_at) "
+                "FROM chunks"
+            ).fetchone()
+            sources = self._conn.execute("SELECT COUNT(DISTINCT source) FROM chunks").fetchone()[0]
+        return {
+            "chunks": chunks,
+            "sources": sources,
+            "retrieval_hits": hits,
+            "never_retrieved": never_hit,
+            "oldest_fetched_at": oldest,
+            "newest_fetched_at": newest,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush_hits()
+            self._conn.close()
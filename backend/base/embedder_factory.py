@@ -7,8 +7,12 @@ class EmbedderFactory:
     def create(
         model: str = "sentence-transformers/all-MiniLM-L6-v2", 
         model_provider: Optional[str] = "huggingface",
+        **kwargs,
         ) -> Embeddings:
-        """Create an embedding model instance based on the specified model name."""
+        """Create an embedding model instance based on the specified model name.
+
+        Extra keyword arguments are passed to the ``onnx`` provider (see ``OnnxEmbeddings``).
+        """
         if ':' in model:
             model_provider, model = model.split(':', 1)
         else:
@@ -17,6 +21,9 @@ class EmbedderFactory:
             case "huggingface":
                 from langchain_huggingface import HuggingFaceEmbeddings
                 return HuggingFaceEmbeddings(model_name=model)
+            case "onnx":
+                from base.onnx_embeddings import OnnxEmbeddings
+                return OnnxEmbeddings(model_name=model, **kwargs)
             case "openai":
                 from langchain_openai import OpenAIEmbeddings
                 return OpenAIEmbeddings(model=model)
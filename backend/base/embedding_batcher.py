@@ -0,0 +1,236 @@
+import os
+import time
+import queue
+import logging
+import argparse
+import threading
+from concurrent.futures import Future
+from multiprocessing.managers import BaseManager
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from omegaconf import DictConfig
+from langchain_core.embeddings import Embeddings
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+AUTHKEY_ENV = "EMBEDDING_SERVER_AUTHKEY"
+
+
+class BatchingEmbeddings(Embeddings):
+    """Embeddings wrapper that merges concurrent calls into batched forward passes.
+
+    Callers enqueue their texts and block on a future. A single worker thread
+    takes the first pending request, keeps collecting requests for up to
+    ``max_wait_ms`` or until ``max_batch_size`` texts are queued, embeds them
+    with one ``embed_documents`` call and hands each caller its slice back.
+    Queries and documents are batched separately; queries go through
+    ``embed_documents`` too unless ``batch_queries`` is off, which models that
+    embed queries differently need. Only this thread touches the wrapped model.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        batch_queries: bool = True,
+    ) -> None:
+        self.underlying = underlying
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.batch_queries = batch_queries
+        self._queue: "queue.Queue[Optional[Tuple[str, List[str], Future]]]" = queue.Queue()
+        self._stats = {"requests": 0, "batches": 0, "texts": 0, "max_batch_texts": 0}
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, underlying: Embeddings, config: Union[DictConfig, Dict[str, Any]]) -> "BatchingEmbeddings":
+        config = ensure_config_dict(config or {})
+        return cls(
+            underlying,
+            max_batch_size=config.get("max_batch_size", 64),
+            max_wait_ms=config.get("max_wait_ms", 5.0),
+            batch_queries=config.get("batch_queries", True),
+        )
+
+    def _submit(self, kind: str, texts: List[str]) -> List[List[float]]:
+        if not self._thread.is_alive():
+            raise RuntimeError("BatchingEmbeddings has been closed")
+        future: Future = Future()
+        self._queue.put((kind, list(texts), future))
+        return future.result()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._submit("document", texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._submit("query", [text])[0]
+
+    def _collect(self, first: Tuple[str, List[str], Future]) -> Tuple[List[Tuple[str, List[str], Future]], bool]:
+        """Gather requests arriving within the wait window; returns them and whether to stop afterwards."""
+        requests = [first]
+        size = len(first[1])
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                return requests, True
+            requests.append(request)
+            size += len(request[1])
+        return requests, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            requests, stop = self._collect(first)
+            for kind in ("document", "query"):
+                batch = [request for request in requests if request[0] == kind]
+                if batch:
+                    self._embed_batch(kind, batch)
+            if stop:
+                return
+
+    def _embed_batch(self, kind: str, batch: List[Tuple[str, List[str], Future]]) -> None:
+        texts = [text for _, request_texts, _ in batch for text in request_texts]
+        try:
+            if kind == "query" and (len(texts) == 1 or not self.batch_queries):
+                vectors = [self.underlying.embed_query(text) for text in texts]
+            else:
+                vectors = self.underlying.embed_documents(texts)
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        with self._stats_lock:
+            self._stats["requests"] += len(batch)
+            self._stats["batches"] += 1
+            self._stats["texts"] += len(texts)
+            self._stats["max_batch_texts"] = max(self._stats["max_batch_texts"], len(texts))
+        offset = 0
+        for _, request_texts, future in batch:
+            future.set_result(vectors[offset:offset + len(request_texts)])
+            offset += len(request_texts)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_batch_texts"] = round(stats["texts"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def close(self) -> None:
+        """Finish queued requests and stop the worker thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+
+class _EmbeddingServerManager(BaseManager):
+    pass
+
+
+class _EmbeddingClientManager(BaseManager):
+    pass
+
+
+_EmbeddingClientManager.register("embedder")
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+def _authkey(authkey: Optional[str]) -> bytes:
+    """The shared secret for the manager connection; there is deliberately no default.
+
+    Manager connections unpickle what the peer sends, so anyone holding the key
+    can run code in the server process.
+    """
+    authkey = authkey or os.getenv(AUTHKEY_ENV)
+    if not authkey:
+        raise ValueError(f"The embedding server needs a shared secret: set {AUTHKEY_ENV} or pass authkey.")
+    return authkey.encode("utf-8")
+
+
+def serve_embeddings(embedder: BatchingEmbeddings, address: str, authkey: Optional[str] = None) -> None:
+    """Serve ``embedder`` to other processes until interrupted.
+
+    The manager handles each client connection in its own thread, so calls
+    from every worker on the node land in the same batching queue and share
+    one copy of the model.
+    """
+    _EmbeddingServerManager.register(
+        "embedder", callable=lambda: embedder, exposed=("embed_documents", "embed_query", "stats")
+    )
+    manager = _EmbeddingServerManager(address=_parse_address(address), authkey=_authkey(authkey))
+    logger.info(f"Serving embeddings on {address}")
+    manager.get_server().serve_forever()
+
+
+class RemoteEmbeddings(Embeddings):
+    """Client for an embedding server started with ``python -m base.embedding_batcher``."""
+
+    def __init__(self, address: str, authkey: Optional[str] = None) -> None:
+        self.address = address
+        self._authkey = _authkey(authkey)
+        self._proxy = None
+        self._lock = threading.Lock()
+
+    def _embedder(self) -> Any:
+        with self._lock:
+            if self._proxy is None:
+                manager = _EmbeddingClientManager(address=_parse_address(self.address), authkey=self._authkey)
+                manager.connect()
+                self._proxy = manager.embedder()
+            return self._proxy
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._embedder().embed_documents(list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embedder().embed_query(text)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._embedder().stats()
+
+
+def main() -> None:
+    from config.loader import default_config
+    from base.embedder_factory import EmbedderFactory
+
+    embedding_config = ensure_config_dict(default_config).get("embedding") or {}
+    batching_config = embedding_config.get("batching") or {}
+    parser = argparse.ArgumentParser(description="Serve the configured embedding model to other processes.")
+    parser.add_argument("--address", default=batching_config.get("server_address") or "127.0.0.1:50051")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Fail before loading the model if no shared secret is configured.
+    authkey = _authkey(None).decode("utf-8")
+    model_provider = embedding_config.get("provider", "huggingface")
+    embedder = EmbedderFactory.create(
+        model=embedding_config.get("model_name", "sentence-transformers/all-mpnet-base-v2"),
+        model_provider=model_provider,
+        **(embedding_config.get(model_provider) or {}),
+    )
+    serve_embeddings(BatchingEmbeddings.from_config(embedder, batching_config), args.address, authkey)
+
+
+if __name__ == "__main__":
+    main()
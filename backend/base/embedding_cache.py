@@ -0,0 +1,160 @@
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+
+from omegaconf import DictConfig
+from langchain_core.embeddings import Embeddings
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+SQLITE_MAX_PARAMS = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that caches vectors by (model, text hash).
+
+    Vectors are stored as packed float32 blobs in SQLite, with a small
+    in-memory LRU in front. ``embed_documents`` looks up the whole batch at
+    once and sends only the distinct misses to the wrapped model. Query and
+    document embeddings are cached separately, since some models embed them
+    differently.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        model_name: str,
+        path: Optional[str] = None,
+        max_memory_entries: int = 4096,
+    ) -> None:
+        self.underlying = underlying
+        self.model_name = model_name
+        self.path = path
+        self.max_memory_entries = max(0, int(max_memory_entries))
+        self._memory: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = self._connect(path) if path else None
+        self._stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def from_config(
+        cls,
+        underlying: Embeddings,
+        model_name: str,
+        config: Union[DictConfig, Dict[str, Any]],
+    ) -> "CachedEmbeddings":
+        config = ensure_config_dict(config or {})
+        return cls(
+            underlying,
+            model_name=model_name,
+            path=config.get("path"),
+            max_memory_entries=config.get("max_memory_entries", 4096),
+        )
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "namespace TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, stored_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, text_hash))"
+        )
+        return conn
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, vector: array) -> None:
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, namespace: str, hashes: List[str]) -> Dict[str, array]:
+        found: Dict[str, array] = {}
+        with self._lock:
+            for text_hash in hashes:
+                vector = self._memory.get(f"{namespace}:{text_hash}")
+                if vector is not None:
+                    self._memory.move_to_end(f"{namespace}:{text_hash}")
+                    found[text_hash] = vector
+            pending = [text_hash for text_hash in hashes if text_hash not in found]
+            if self._conn is None or not pending:
+                return found
+            for start in range(0, len(pending), SQLITE_MAX_PARAMS):
+                batch = pending[start:start + SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    (namespace, *batch),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[text_hash] = vector
+                    self._remember(f"{namespace}:{text_hash}", vector)
+        return found
+
+    def _store(self, namespace: str, vectors: Dict[str, array]) -> None:
+        now = time.time()
+        with self._lock:
+            for text_hash, vector in vectors.items():
+                self._remember(f"{namespace}:{text_hash}", vector)
+            if self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (namespace, text_hash, vector, stored_at) VALUES (?, ?, ?, ?)",
+                    [(namespace, text_hash, vector.tobytes(), now) for text_hash, vector in vectors.items()],
+                )
+
+    def _embed(self, namespace: str, texts: List[str], embed_fn) -> List[List[float]]:
+        hashes = [self._hash(text) for text in texts]
+        found = self._lookup(namespace, list(dict.fromkeys(hashes)))
+        misses: Dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in found:
+                misses.setdefault(text_hash, text)
+        with self._lock:
+            self._stats["hits"] += len(texts) - sum(1 for text_hash in hashes if text_hash in misses)
+            self._stats["misses"] += len(misses)
+        if misses:
+            computed = embed_fn(list(misses.values()))
+            new_vectors = {text_hash: array("f", vector) for text_hash, vector in zip(misses, computed)}
+            self._store(namespace, new_vectors)
+            found.update(new_vectors)
+        return [found[text_hash].tolist() for text_hash in hashes]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(f"{self.model_name}:document", list(texts), self.underlying.embed_documents)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(
+            f"{self.model_name}:query", [text], lambda misses: [self.underlying.embed_query(misses[0])]
+        )[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+            if self._conn is not None:
+                stats["disk_entries"] = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,245 @@
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from omegaconf import DictConfig
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the number of unfinished jobs reaches ``max_pending``."""
+
+
+# Tells this process apart from an earlier one that had the same pid.
+_PROCESS_TOKEN = uuid.uuid4().hex
+
+
+def _boot_id() -> str:
+    """Identifies this boot of this machine, so pids recorded before a reboot are never mistaken for live ones."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return socket.gethostname()
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill would terminate the process on Windows; assume it is alive.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobManager:
+    """Run long pipeline calls as background jobs on a bounded worker pool.
+
+    Job state (status, parameters, result or error) is persisted in SQLite so
+    it survives client disconnects and can be polled later. Each job records
+    its owner (boot id, pid and a per-process token), so several workers can share one database:
+    on startup a worker marks as failed only the unfinished jobs whose owner
+    process no longer exists. Cancelling a running job is cooperative: the worker
+    thread finishes, but its result is discarded.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_workers: int = 2,
+        max_pending: int = 100,
+    ) -> None:
+        self.db_path = db_path or ":memory:"
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job-worker")
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+        self._boot_id = _boot_id()
+        self._owner = f"{self._boot_id}:{os.getpid()}:{_PROCESS_TOKEN}"
+        self._conn = self._connect(self.db_path)
+        self._recover_interrupted_jobs()
+
+    @classmethod
+    def from_config(cls, config: Union[DictConfig, Dict[str, Any]]) -> "JobManager":
+        jobs_config = ensure_config_dict(config).get("jobs", {}) or {}
+        return cls(
+            db_path=jobs_config.get("db_path", "data/jobs/jobs.sqlite3"),
+            max_workers=jobs_config.get("max_workers", 2),
+            max_pending=jobs_config.get("max_pending", 100),
+        )
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        if db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, params TEXT, result TEXT, error TEXT, "
+            "created_at REAL NOT NULL, started_at REAL, finished_at REAL, owner TEXT)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "owner" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+        return conn
+
+    def _owner_gone(self, owner: Optional[str]) -> bool:
+        if not owner:
+            return True
+        boot_id, pid, token = owner.rsplit(":", 2)
+        if boot_id != self._boot_id:
+            return True
+        if int(pid) == os.getpid():
+            return token != _PROCESS_TOKEN
+        return not _process_alive(int(pid))
+
+    def _recover_interrupted_jobs(self) -> None:
+        """Fail unfinished jobs whose owner process has exited; other workers' jobs are left alone."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, owner FROM jobs WHERE status IN (?, ?)", (JobStatus.PENDING, JobStatus.RUNNING)
+            ).fetchall()
+            orphaned = [job_id for job_id, owner in rows if self._owner_gone(owner)]
+            now = time.time()
+            updated = sum(
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ? AND status IN (?, ?)",
+                    (JobStatus.FAILED, "Interrupted by server restart", now, job_id, JobStatus.PENDING, JobStatus.RUNNING),
+                ).rowcount
+                for job_id in orphaned
+            )
+        if updated:
+            logger.warning(f"Marked {updated} interrupted jobs as failed")
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError("JobManager has been shut down")
+        return self._conn
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def _status(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args: Any, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> str:
+        """Queue ``fn(*args, **kwargs)`` and return its job id immediately."""
+        with self._lock:
+            unfinished = sum(1 for future in self._futures.values() if not future.done())
+            if unfinished >= self.max_pending:
+                raise JobQueueFullError(f"Too many unfinished jobs ({unfinished}); try again later.")
+            conn = self._connection()
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, created_at, owner) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, JobStatus.PENDING, json.dumps(params or {}, default=str), time.time(), self._owner),
+            )
+            future = self._executor.submit(self._run, job_id, fn, args, kwargs)
+            self._futures[job_id] = future
+            future.add_done_callback(lambda _: self._forget(job_id))
+        return job_id
+
+    def _forget(self, job_id: str) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def _run(self, job_id: str, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        with self._lock:
+            if self._status(job_id) != JobStatus.PENDING:
+                return
+            self._update(job_id, status=JobStatus.RUNNING, started_at=time.time())
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed")
+            with self._lock:
+                if self._status(job_id) != JobStatus.CANCELLED:
+                    self._update(job_id, status=JobStatus.FAILED, error=str(e), finished_at=time.time())
+            return
+        with self._lock:
+            if self._status(job_id) == JobStatus.CANCELLED:
+                return
+            self._update(
+                job_id,
+                status=JobStatus.SUCCEEDED,
+                result=json.dumps(result, default=str),
+                finished_at=time.time(),
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job record without its result, or None if unknown."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT id, kind, status, error, created_at, started_at, finished_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("job_id", "kind", "status", "error", "created_at", "started_at", "finished_at")
+        return dict(zip(keys, row))
+
+    def result(self, job_id: str) -> Any:
+        with self._lock:
+            row = self._connection().execute("SELECT result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """Cancel a job and return its resulting status, or None if unknown."""
+        with self._lock:
+            status = self._status(job_id)
+            if status is None or status in JobStatus.FINISHED:
+                return status
+            future = self._futures.get(job_id)
+            if future is not None:
+                future.cancel()
+            self._update(job_id, status=JobStatus.CANCELLED, finished_at=time.time())
+            return JobStatus.CANCELLED
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids = [row[0] for row in self._connection().execute(
+                "SELECT id FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()]
+        return [job for job in (self.get(job_id) for job_id in ids) if job is not None]
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work; jobs still running are marked failed by the next worker to start."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,174 @@
+import os
+import re
+import math
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+SQLITE_MAX_PARAMS = 500
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9_+#]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; keeps ``_``, ``+`` and ``#`` so names like ``c++`` or ``read_csv`` survive."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class LexicalIndex:
+    """On-disk BM25 inverted index over chunk ids.
+
+    Only postings and chunk lengths are stored; the chunk text itself stays in
+    the vectorstore and is looked up by id, so both indexes share one id space.
+    """
+
+    def __init__(self, path: Optional[str] = None, k1: float = 1.5, b: float = 0.75) -> None:
+        self.path = path or ":memory:"
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._conn = self._connect(self.path)
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS chunks (id TEXT PRIMARY KEY, length INTEGER NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS postings (term TEXT NOT NULL, chunk_id TEXT NOT NULL, tf INTEGER NOT NULL, "
+            "PRIMARY KEY (term, chunk_id)) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_postings_chunk ON postings(chunk_id)")
+        return conn
+
+    def _batched(self, values: Sequence[str]) -> Iterable[Sequence[str]]:
+        for start in range(0, len(values), SQLITE_MAX_PARAMS):
+            yield values[start:start + SQLITE_MAX_PARAMS]
+
+    def missing(self, ids: Sequence[str]) -> List[str]:
+        """Return the ids from ``ids`` that are not indexed yet."""
+        present = set()
+        with self._lock:
+            for batch in self._batched(list(ids)):
+                rows = self._conn.execute(
+                    f"SELECT id FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                present.update(row[0] for row in rows)
+        return [chunk_id for chunk_id in ids if chunk_id not in present]
+
+    def add(self, documents: Sequence[Document]) -> int:
+        """Index documents by their ``id``; already indexed ids are replaced."""
+        rows, postings = [], []
+        for doc in documents:
+            if not doc.id:
+                continue
+            counts = Counter(tokenize(doc.page_content))
+            rows.append((doc.id, sum(counts.values())))
+            postings.extend((term, doc.id, tf) for term, tf in counts.items())
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete_postings([row[0] for row in rows])
+                self._conn.executemany("INSERT OR REPLACE INTO chunks (id, length) VALUES (?, ?)", rows)
+                self._conn.executemany("INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)", postings)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def _delete_postings(self, ids: Sequence[str]) -> None:
+        for batch in self._batched(list(ids)):
+            self._conn.execute(f"DELETE FROM postings WHERE chunk_id IN ({','.join('?' * len(batch))})", batch)
+
+    def delete(self, ids: Sequence[str]) -> None:
+        with self._lock:
+            self._delete_postings(ids)
+            for batch in self._batched(list(ids)):
+                self._conn.execute(f"DELETE FROM chunks WHERE id IN ({','.join('?' * len(batch))})", batch)
+
+    def search(self, query: str, k: int = 10, ids: Optional[Sequence[str]] = None) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(chunk_id, bm25_score)`` pairs, best first, optionally only among ``ids``."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or (ids is not None and not ids):
+            return []
+        placeholders = ",".join("?" * len(terms))
+        id_filter = f" AND p.chunk_id IN ({','.join('?' * len(ids))})" if ids is not None else ""
+        with self._lock:
+            total, avg_length = self._conn.execute("SELECT COUNT(*), AVG(length) FROM chunks").fetchone()
+            if not total:
+                return []
+            document_frequency = dict(self._conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term", terms
+            ).fetchall())
+            rows = self._conn.execute(
+                f"SELECT p.chunk_id, p.term, p.tf, c.length FROM postings p JOIN chunks c ON c.id = p.chunk_id "
+                f"WHERE p.term IN ({placeholders}){id_filter}",
+                [*terms, *(ids or [])],
+            ).fetchall()
+        avg_length = avg_length or 1.0
+        scores: Dict[str, float] = {}
+        for chunk_id, term, tf, length in rows:
+            df = document_frequency.get(term, 0)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            norm = tf + self.k1 * (1 - self.b + self.b * length / avg_length)
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def vacuum(self) -> None:
+        """Rewrite the database file to release pages freed by deletions."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[Hashable, float]]:
+    """Fuse ranked id lists by summing ``weight / (k + rank)``; best first."""
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[Hashable, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def weighted_score_fusion(
+    scored_lists: Sequence[Sequence[Tuple[Hashable, float]]],
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[Hashable, float]]:
+    """Fuse ``(id, score)`` lists by a weighted sum of min-max normalized scores; best first."""
+    weights = weights or [1.0] * len(scored_lists)
+    scores: Dict[Hashable, float] = {}
+    for scored, weight in zip(scored_lists, weights):
+        if not scored:
+            continue
+        values = [score for _, score in scored]
+        low, high = min(values), max(values)
+        for item, score in scored:
+            normalized = (score - low) / (high - low) if high > low else 1.0
+            scores[item] = scores.get(item, 0.0) + weight * normalized
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
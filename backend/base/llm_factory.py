@@ -1,5 +1,9 @@
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Union, Any, Dict
+import threading
+from collections import OrderedDict
+from typing import Optional, Union, Any, Callable, Dict, Hashable, List, Tuple
 from omegaconf import DictConfig, OmegaConf
 from utils.config import ensure_config_dict
 
@@ -11,6 +15,166 @@ load_dotenv(override=True)
 logger = logging.getLogger(__name__)
 
 
+# Providers whose LangChain chat models accept pre-built ``http_client`` /
+# ``http_async_client`` instances (all OpenAI-compatible clients).
+HTTPX_CLIENT_PROVIDERS = {"openai", "azure_openai", "deepseek", "together", "xai"}
+
+
+class LLMClientPool:
+    """Process-wide, thread-safe registry of chat model clients.
+
+    Clients are keyed by (provider, model, temperature, base_url) plus a
+    fingerprint of the API key and any extra kwargs, so requests for the same
+    model share one client and therefore one HTTP connection pool. The
+    registry is bounded; the least recently used client is evicted first.
+    Evicted clients are not closed right away because in-flight requests may
+    still hold them; they are kept aside and their HTTP clients are closed on
+    :meth:`clear` or :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 16,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+    ) -> None:
+        self.max_size = max(1, int(max_size))
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self._clients: "OrderedDict[Hashable, BaseChatModel]" = OrderedDict()
+        self._evicted: List[BaseChatModel] = []
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, **settings: Any) -> None:
+        """Update pool limits; existing clients keep the limits they were built with."""
+        with self._lock:
+            for name in ("max_connections", "max_keepalive_connections", "keepalive_expiry"):
+                if name in settings:
+                    setattr(self, name, settings[name])
+            if settings.get("max_size") is not None:
+                self.max_size = max(1, int(settings["max_size"]))
+                self._evict_overflow()
+
+    @staticmethod
+    def make_key(
+        model_provider: Optional[str],
+        model: str,
+        temperature: float,
+        base_url: Optional[str],
+        api_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Tuple[Any, ...]:
+        key_fingerprint = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] if api_key else None
+        extra = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+        return (model_provider, model, float(temperature), base_url, key_fingerprint, extra)
+
+    def http_client_kwargs(self, model_provider: Optional[str]) -> Dict[str, Any]:
+        """Build pooled sync/async httpx clients for providers that accept them."""
+        if (model_provider or "").lower() not in HTTPX_CLIENT_PROVIDERS:
+            return {}
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        return {
+            "http_client": httpx.Client(limits=limits),
+            "http_async_client": httpx.AsyncClient(limits=limits),
+        }
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], BaseChatModel]) -> BaseChatModel:
+        """Return the pooled client for ``key``, building it with ``factory`` outside the lock.
+
+        If two threads miss at once both build a client; the first one stored
+        wins and the other is closed straight away (it was never shared), so a
+        slow build never blocks lookups of other models.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+        built = factory()
+        with self._lock:
+            self.misses += 1
+            client = self._clients.get(key)
+            if client is None:
+                self._clients[key] = built
+                self._evict_overflow()
+                return built
+            self._clients.move_to_end(key)
+        self._close_http_clients(built)
+        return client
+
+    def _evict_overflow(self) -> None:
+        while len(self._clients) > self.max_size:
+            evicted_key, evicted = self._clients.popitem(last=False)
+            self._evicted.append(evicted)
+            self.evictions += 1
+            logger.debug(f"Evicted LLM client {evicted_key[:2]} from the client pool")
+
+    @staticmethod
+    def _close_http_clients(client: BaseChatModel) -> None:
+        """Close the pooled httpx clients a chat model was built with, if any."""
+        http_client = getattr(client, "http_client", None)
+        if http_client is not None:
+            http_client.close()
+        http_async_client = getattr(client, "http_async_client", None)
+        if http_async_client is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            asyncio.run(http_async_client.aclose())
+        else:
+            loop.create_task(http_async_client.aclose())
+
+    def _take_all(self) -> List[BaseChatModel]:
+        with self._lock:
+            clients = [*self._evicted, *self._clients.values()]
+            self._evicted.clear()
+            self._clients.clear()
+        return clients
+
+    def clear(self) -> None:
+        """Drop every client and close the HTTP clients of pooled and evicted ones."""
+        for client in self._take_all():
+            try:
+                self._close_http_clients(client)
+            except Exception as e:
+                logger.debug(f"Failed to close LLM client: {e}")
+
+    def close(self) -> None:
+        """Release every client's connection pool; call on shutdown."""
+        self.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+llm_client_pool = LLMClientPool()
+
+
 class LLMFactory:
 
     @staticmethod
@@ -20,6 +184,7 @@ class LLMFactory:
         temperature: float = 0,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
+        use_pool: bool = True,
         **kwargs
     ) -> BaseChatModel:
         """Initialize LLM client with model parameters.
@@ -30,7 +195,7 @@ class LLMFactory:
             temperature: Temperature for model responses (default: 0)
             base_url: Custom base URL for API endpoint
             api_key: Custom API key
-            llm: Pre-configured LLM instance (if provided, other params ignored)
+            use_pool: Reuse a cached client from the process-wide client pool (default: True)
             **kwargs: Additional parameters passed to init_chat_model
 
         Raises:
@@ -40,6 +205,31 @@ class LLMFactory:
             model = "claude-3-5-sonnet-20241022"
             model_provider = model_provider or "anthropic"
 
+        if not use_pool:
+            return LLMFactory._init_client(model, model_provider, temperature, base_url, api_key, **kwargs)
+
+        key = llm_client_pool.make_key(model_provider, model, temperature, base_url, api_key, **kwargs)
+        return llm_client_pool.get_or_create(
+            key,
+            lambda: LLMFactory._init_client(
+                model,
+                model_provider,
+                temperature,
+                base_url,
+                api_key,
+                **{**llm_client_pool.http_client_kwargs(model_provider), **kwargs},
+            ),
+        )
+
+    @staticmethod
+    def _init_client(
+        model: str,
+        model_provider: Optional[str],
+        temperature: float,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        **kwargs
+    ) -> BaseChatModel:
         config_kwargs = {
             "model": model,
             "model_provider": model_provider,
@@ -72,14 +262,40 @@ class LLMFactory:
             LLMFactory instance initialized from config
         """
         config = ensure_config_dict(config)
-        return init_chat_model(
+        return cls.create(
             model=config.get("model_name", "deepseek-chat"),
             model_provider=config.get("model_provider", "deepseek"),
             base_url=config.get("base_url", None),
             # api_key=config.api_key,
             temperature=0,  # Always 0 for deterministic results
         )
-    
+
+    @staticmethod
+    def configure_pool(config: Union[DictConfig, OmegaConf, Dict[str, Any]]) -> LLMClientPool:
+        """Apply ``llm.client_pool`` settings from the app config to the shared client pool."""
+        config = ensure_config_dict(config)
+        pool_config = (config.get("llm", {}) or {}).get("client_pool", {}) or {}
+        llm_client_pool.configure(**pool_config)
+        return llm_client_pool
+
+    @classmethod
+    def warmup(cls, config: Union[DictConfig, OmegaConf, Dict[str, Any]]) -> Optional[BaseChatModel]:
+        """Configure the client pool and pre-build the default client so the first request skips construction."""
+        config = ensure_config_dict(config)
+        cls.configure_pool(config)
+        llm_config = config.get("llm", {}) or {}
+        try:
+            llm = cls.create(
+                model=llm_config.get("model_name", "deepseek-chat"),
+                model_provider=llm_config.get("provider", "deepseek"),
+                base_url=llm_config.get("base_url", None),
+            )
+        except Exception as e:
+            logger.warning(f"Skipping LLM client warm-up: {e}")
+            return None
+        logger.info(f"LLM client pool warmed up: {llm_client_pool.stats()}")
+        return llm
+
 
 if __name__ == "__main__":
     llm = LLMFactory.create(
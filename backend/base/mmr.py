@@ -0,0 +1,45 @@
+from typing import List, Sequence
+
+import numpy as np
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def maximal_marginal_relevance(
+    query_embedding: Sequence[float],
+    embeddings: Sequence[Sequence[float]],
+    k: int = 5,
+    lambda_mult: float = 0.5,
+) -> List[int]:
+    """Pick ``k`` candidate indices balancing query relevance and mutual diversity.
+
+    Cosine similarities to the query and between candidates are computed once
+    as matrices; each selection step is then a vectorized update of every
+    candidate's maximum similarity to the already selected set.
+    ``lambda_mult=1`` is pure relevance, ``0`` is pure diversity.
+    """
+    candidates = np.asarray(embeddings, dtype=np.float32)
+    if candidates.ndim != 2 or len(candidates) == 0 or k <= 0:
+        return []
+    candidates = _normalize(candidates)
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32).reshape(1, -1))[0]
+    query_similarity = candidates @ query
+    pairwise_similarity = candidates @ candidates.T
+
+    first = int(np.argmax(query_similarity))
+    selected = [first]
+    max_similarity_to_selected = pairwise_similarity[first].copy()
+    available = np.ones(len(candidates), dtype=bool)
+    available[first] = False
+    while len(selected) < min(k, len(candidates)):
+        scores = lambda_mult * query_similarity - (1 - lambda_mult) * max_similarity_to_selected
+        scores[~available] = -np.inf
+        index = int(np.argmax(scores))
+        selected.append(index)
+        available[index] = False
+        np.maximum(max_similarity_to_selected, pairwise_similarity[index], out=max_similarity_to_selected)
+    return selected
@@ -0,0 +1,113 @@
+import os
+import logging
+import threading
+from typing import Any, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_int8.onnx"
+
+
+class OnnxEmbeddings(Embeddings):
+    """Sentence-transformers model run through an ONNX Runtime CPU session.
+
+    On first use the Hugging Face model is exported to ONNX with ``optimum``
+    into ``cache_dir`` (and, with ``quantize``, dynamically quantized to int8
+    weights); later processes load the exported files directly. Embeddings are
+    mean-pooled over the attention mask and L2-normalized, matching the
+    sentence-transformers pipeline of models such as ``all-mpnet-base-v2``.
+    Texts are sorted by length before batching so each batch pads as little
+    as possible.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-mpnet-base-v2",
+        cache_dir: str = "data/models/onnx",
+        quantize: bool = False,
+        intra_op_threads: Optional[int] = None,
+        batch_size: int = 32,
+        max_length: int = 384,
+        normalize: bool = True,
+    ) -> None:
+        self.model_name = model_name
+        self.model_dir = os.path.join(cache_dir, model_name.replace("/", "__"))
+        self.quantize = quantize
+        self.intra_op_threads = intra_op_threads
+        self.batch_size = max(1, batch_size)
+        self.max_length = max_length
+        self.normalize = normalize
+        self._lock = threading.Lock()
+        self._session = None
+        self._tokenizer = None
+        self._input_names: List[str] = []
+
+    def _export(self) -> None:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        logger.info(f"Exporting {self.model_name} to ONNX in {self.model_dir}")
+        ORTModelForFeatureExtraction.from_pretrained(self.model_name, export=True).save_pretrained(self.model_dir)
+        AutoTokenizer.from_pretrained(self.model_name).save_pretrained(self.model_dir)
+
+    def _quantize(self, source: str, target: str) -> None:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info(f"Quantizing {source} to int8")
+        quantize_dynamic(source, target, weight_type=QuantType.QInt8)
+
+    def _load(self) -> Any:
+        with self._lock:
+            if self._session is not None:
+                return self._session
+            import onnxruntime
+            from transformers import AutoTokenizer
+
+            model_path = os.path.join(self.model_dir, MODEL_FILE)
+            if not os.path.exists(model_path):
+                self._export()
+            if self.quantize:
+                quantized_path = os.path.join(self.model_dir, QUANTIZED_MODEL_FILE)
+                if not os.path.exists(quantized_path):
+                    self._quantize(model_path, quantized_path)
+                model_path = quantized_path
+            options = onnxruntime.SessionOptions()
+            options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if self.intra_op_threads:
+                options.intra_op_num_threads = self.intra_op_threads
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+            session = onnxruntime.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+            self._input_names = [model_input.name for model_input in session.get_inputs()]
+            self._session = session
+            return session
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        session = self._load()
+        encoded = self._tokenizer(
+            texts, padding=True, truncation=True, max_length=self.max_length, return_tensors="np"
+        )
+        inputs = {name: encoded[name].astype(np.int64) for name in self._input_names if name in encoded}
+        hidden = session.run(None, inputs)[0]
+        mask = encoded["attention_mask"][..., None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            for index, vector in zip(batch, self._embed_batch([texts[index] for index in batch])):
+                vectors[index] = vector.tolist()
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
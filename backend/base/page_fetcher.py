@@ -0,0 +1,213 @@
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+import httpx
+from omegaconf import DictConfig
+from langchain_core.documents import Document
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; GenMentor/1.0)"
+TEXT_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+DEFAULT_MAX_BYTES = 5 * 2**20
+
+
+@dataclass
+class PageFetchResult:
+    url: str
+    status: Optional[int] = None
+    document: Optional[Document] = None
+    error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    elapsed: float = 0.0
+
+
+def html_to_document(url: str, html: str) -> Document:
+    """Extract visible text and basic metadata the way ``WebBaseLoader`` does."""
+    import bs4
+
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    metadata: Dict[str, Any] = {"source": url}
+    if soup.title and soup.title.string:
+        metadata["title"] = soup.title.string.strip()
+    description = soup.find("meta", attrs={"name": "description"})
+    if description and description.get("content"):
+        metadata["description"] = description.get("content")
+    html_tag = soup.find("html")
+    if html_tag and html_tag.get("lang"):
+        metadata["language"] = html_tag.get("lang")
+    return Document(page_content=soup.get_text(separator="\n", strip=True), metadata=metadata)
+
+
+class AsyncPageFetcher:
+    """Fetch many pages concurrently over a single pooled ``httpx.AsyncClient``.
+
+    The client lives on a private event loop in a daemon thread, so both sync
+    callers (``fetch``) and coroutines on any other loop (``afetch``) share one
+    connection pool. Concurrency is bounded overall and per host, the whole
+    batch is cut off at ``deadline`` seconds, and each URL succeeds or fails on
+    its own. Bodies are streamed: non-text responses are dropped after the
+    headers and reading stops once a body exceeds ``max_bytes``. Results are
+    keyed by URL.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        per_host_limit: int = 2,
+        timeout: float = 10.0,
+        deadline: float = 20.0,
+        max_connections: int = 20,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_connections = max_connections
+        self.max_bytes = max_bytes
+        self.user_agent = user_agent
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Union[DictConfig, Dict[str, Any]]) -> "AsyncPageFetcher":
+        config = ensure_config_dict(config or {})
+        return cls(
+            max_concurrency=config.get("max_concurrency", 10),
+            per_host_limit=config.get("per_host_limit", 2),
+            timeout=config.get("timeout", 10.0),
+            deadline=config.get("deadline", 20.0),
+            max_connections=config.get("max_connections", 20),
+            max_bytes=config.get("max_bytes", DEFAULT_MAX_BYTES),
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    headers={"User-Agent": self.user_agent},
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, name="page-fetcher", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            return loop
+
+    def fetch(self, urls: List[str], headers: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, PageFetchResult]:
+        """Fetch ``urls`` from a synchronous caller; ``headers`` optionally maps a URL to extra request headers."""
+        if not urls:
+            return {}
+        future = asyncio.run_coroutine_threadsafe(self._fetch_all(urls, headers or {}), self._ensure_loop())
+        return future.result()
+
+    async def afetch(self, urls: List[str], headers: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, PageFetchResult]:
+        if not urls:
+            return {}
+        future = asyncio.run_coroutine_threadsafe(self._fetch_all(urls, headers or {}), self._ensure_loop())
+        return await asyncio.wrap_future(future)
+
+    async def _fetch_all(self, urls: List[str], headers: Dict[str, Dict[str, str]]) -> Dict[str, PageFetchResult]:
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        async def bounded_fetch(url: str) -> PageFetchResult:
+            host = urlsplit(url).netloc.lower()
+            host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+            # Wait for the host slot first, so URLs queued behind a busy host
+            # do not hold global slots other hosts could use.
+            async with host_semaphore, semaphore:
+                return await self._fetch_one(url, headers.get(url, {}))
+
+        tasks = {url: asyncio.ensure_future(bounded_fetch(url)) for url in unique_urls}
+        await asyncio.wait(tasks.values(), timeout=self.deadline)
+        results: Dict[str, PageFetchResult] = {}
+        for url, task in tasks.items():
+            if task.done():
+                results[url] = task.result()
+            else:
+                task.cancel()
+                results[url] = PageFetchResult(url=url, error=f"Deadline of {self.deadline}s exceeded")
+        failed = sum(1 for result in results.values() if result.error)
+        if failed:
+            logger.info(f"Fetched {len(results) - failed}/{len(results)} pages; {failed} failed")
+        return results
+
+    async def _fetch_one(self, url: str, headers: Dict[str, str]) -> PageFetchResult:
+        start = time.perf_counter()
+        result = PageFetchResult(url=url)
+        try:
+            async with self._client.stream("GET", url, headers=headers) as response:
+                result.status = response.status_code
+                result.etag = response.headers.get("etag")
+                result.last_modified = response.headers.get("last-modified")
+                if response.status_code == 304:
+                    return result
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "text/html").split(";")[0].strip().lower()
+                if content_type not in TEXT_CONTENT_TYPES:
+                    result.error = f"Unsupported content type: {content_type}"
+                    return result
+                text = await self._read_text(response)
+            if text is None:
+                result.error = f"Response larger than {self.max_bytes} bytes"
+            elif content_type == "text/plain":
+                result.document = Document(page_content=text, metadata={"source": url})
+            else:
+                result.document = await asyncio.to_thread(html_to_document, url, text)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            logger.debug(f"Failed to fetch {url}: {result.error}")
+        finally:
+            result.elapsed = time.perf_counter() - start
+        return result
+
+    async def _read_text(self, response: httpx.Response) -> Optional[str]:
+        """Decode the streamed body, or None as soon as it exceeds ``max_bytes``."""
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            return None
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) > self.max_bytes:
+                return None
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._client = self._thread = None
@@ -43,6 +43,14 @@ class TextSplitterFactory:
 
 
 class VectorStoreFactory:
+    """
+    Factory class to create vectorstore instances based on specified type.
+
+    Supported vectorstore types:
+    - "chroma": Chroma persistent collection.
+    - "faiss": FAISS HNSW/IVF index with memory-mapped vectors (see ``AnnVectorStore``);
+      extra keyword arguments are passed through to it.
+    """
 
     @staticmethod
     def create(
@@ -50,6 +58,7 @@ class VectorStoreFactory:
         collection_name: str = "default",
         persist_directory: str = "./data/vectorstore",
         embedder: Optional[Embeddings] = None,
+        **kwargs,
     ) -> VectorStore:
         vectorstore_type = vectorstore_type.lower()
         if vectorstore_type in ["chroma"]:
@@ -59,7 +68,14 @@ class VectorStoreFactory:
                 embedding_function=embedder,
                 persist_directory=persist_directory,
             )
-            logger.info(f'There are {vectorstore._collection.count()} records in the collection')
+        elif vectorstore_type in ["faiss"]:
+            from base.ann_vectorstore import AnnVectorStore
+            vectorstore = AnnVectorStore(
+                embedder,
+                persist_directory=persist_directory,
+                collection_name=collection_name,
+                **kwargs,
+            )
         else:
             raise ValueError(f"Unsupported vectorstore type: {vectorstore_type}")
         return vectorstore
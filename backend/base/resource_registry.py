@@ -0,0 +1,196 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Union
+
+from omegaconf import DictConfig
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from langchain_text_splitters.base import TextSplitter
+
+from base.embedder_factory import EmbedderFactory
+from base.embedding_cache import CachedEmbeddings
+from base.embedding_batcher import BatchingEmbeddings, RemoteEmbeddings
+from base.searcher_factory import SearchRunner
+from base.rag_factory import TextSplitterFactory, VectorStoreFactory
+from base.search_rag import SearchRagManager
+from base.lexical_index import LexicalIndex
+from base.chunk_ledger import ChunkLedger
+from utils.config import ensure_config_dict
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceRegistry:
+    """Owns the heavyweight RAG resources (embedder, splitter, vectorstore, searcher) for one config.
+
+    Each resource is built on first access and then reused, so loading the
+    embedding model or opening the vectorstore happens once per process rather
+    than once per request. Construction is guarded by a lock, so concurrent
+    first accesses from worker threads build a resource only once.
+    """
+
+    def __init__(self, config: Union[DictConfig, Dict[str, Any]]) -> None:
+        self.config = ensure_config_dict(config)
+        self._lock = threading.RLock()
+        self._resources: Dict[str, Any] = {}
+
+    def _get_or_build(self, name: str, build) -> Any:
+        resource = self._resources.get(name)
+        if resource is not None:
+            return resource
+        with self._lock:
+            if name not in self._resources:
+                logger.info(f"Initializing shared {name}")
+                self._resources[name] = build()
+            return self._resources[name]
+
+    @property
+    def embedder(self) -> Embeddings:
+        def build():
+            # ``embedder`` is the legacy key; the shipped config uses ``embedding``.
+            embedding_config = self.config.get("embedding") or self.config.get("embedder") or {}
+            model_name = embedding_config.get("model_name", "sentence-transformers/all-mpnet-base-v2")
+            model_provider = embedding_config.get("provider", "huggingface")
+            batching_config = embedding_config.get("batching") or {}
+            if batching_config.get("server_address"):
+                embedder = RemoteEmbeddings(batching_config["server_address"])
+            else:
+                embedder = EmbedderFactory.create(
+                    model=model_name,
+                    model_provider=model_provider,
+                    **(embedding_config.get(model_provider) or {}),
+                )
+                if batching_config.get("enabled", False):
+                    embedder = BatchingEmbeddings.from_config(embedder, batching_config)
+            cache_config = embedding_config.get("cache") or {}
+            if not cache_config.get("enabled", False):
+                return embedder
+            cache_namespace = f"{model_provider}:{model_name}"
+            if (embedding_config.get(model_provider) or {}).get("quantize"):
+                cache_namespace += ":int8"
+            return CachedEmbeddings.from_config(embedder, cache_namespace, cache_config)
+        return self._get_or_build("embedder", build)
+
+    @property
+    def text_splitter(self) -> TextSplitter:
+        rag_config = self.config.get("rag", {})
+        return self._get_or_build("text_splitter", lambda: TextSplitterFactory.create(
+            splitter_type=rag_config.get("text_splitter_type", "recursive_character"),
+            chunk_size=rag_config.get("chunk_size", 1000),
+            chunk_overlap=rag_config.get("chunk_overlap", 0),
+        ))
+
+    @property
+    def vectorstore(self) -> VectorStore:
+        vectorstore_config = self.config.get("vectorstore", {})
+        return self._get_or_build("vectorstore", lambda: VectorStoreFactory.create(
+            vectorstore_type=vectorstore_config.get("type", "chroma"),
+            collection_name=vectorstore_config.get("collection_name", "default_collection"),
+            persist_directory=vectorstore_config.get("persist_directory", "./data/vectorstore"),
+            embedder=self.embedder,
+            **(vectorstore_config.get(vectorstore_config.get("type", "chroma")) or {}),
+        ))
+
+    @property
+    def lexical_index(self) -> Optional[LexicalIndex]:
+        hybrid_config = self.config.get("rag", {}).get("hybrid") or {}
+        if not hybrid_config.get("enabled", False):
+            return None
+        return self._get_or_build("lexical_index", lambda: LexicalIndex(path=hybrid_config.get("path")))
+
+    @property
+    def ledger(self) -> Optional[ChunkLedger]:
+        lifecycle_config = self.config.get("rag", {}).get("lifecycle") or {}
+        if not lifecycle_config.get("enabled", False):
+            return None
+        return self._get_or_build("ledger", lambda: ChunkLedger(path=lifecycle_config.get("ledger_path")))
+
+    @property
+    def vectorstore_maintainer(self) -> "VectorstoreMaintainer":
+        from base.vectorstore_maintenance import VectorstoreMaintainer
+        lifecycle_config = self.config.get("rag", {}).get("lifecycle") or {}
+        return self._get_or_build("vectorstore_maintainer", lambda: VectorstoreMaintainer.from_config(
+            self.search_rag_manager, lifecycle_config
+        ))
+
+    @property
+    def search_runner(self) -> SearchRunner:
+        return self._get_or_build("search_runner", lambda: SearchRunner.from_config(config=self.config))
+
+    @property
+    def search_rag_manager(self) -> SearchRagManager:
+        rag_config = self.config.get("rag", {})
+        return self._get_or_build("search_rag_manager", lambda: SearchRagManager(
+            embedder=self.embedder,
+            text_splitter=self.text_splitter,
+            vectorstore=self.vectorstore,
+            search_runner=self.search_runner,
+            max_retrieval_results=rag_config.get("num_retrieval_results", 5),
+            retrieval_first=rag_config.get("retrieval_first", False),
+            relevance_threshold=rag_config.get("relevance_threshold", 0.75),
+            background_refresh=rag_config.get("background_refresh", False),
+            lexical_index=self.lexical_index,
+            fusion=(rag_config.get("hybrid") or {}).get("fusion", "rrf"),
+            rrf_k=(rag_config.get("hybrid") or {}).get("rrf_k", 60),
+            dense_weight=(rag_config.get("hybrid") or {}).get("dense_weight", 0.5),
+            fetch_k=(rag_config.get("hybrid") or {}).get("fetch_k", 20),
+            context_budgets=rag_config.get("context_budgets"),
+            use_mmr=(rag_config.get("mmr") or {}).get("enabled", False),
+            mmr_lambda=(rag_config.get("mmr") or {}).get("lambda_mult", 0.5),
+            mmr_fetch_k=(rag_config.get("mmr") or {}).get("fetch_k", 20),
+            write_behind=(rag_config.get("write_behind") or {}).get("enabled", False),
+            write_queue_size=(rag_config.get("write_behind") or {}).get("max_queue_size", 64),
+            write_batch_size=(rag_config.get("write_behind") or {}).get("batch_size", 256),
+            write_max_wait_ms=(rag_config.get("write_behind") or {}).get("max_wait_ms", 200.0),
+            ledger=self.ledger,
+        ))
+
+    def warmup(self) -> bool:
+        """Build every resource up front; returns False (and logs) if any of them fails."""
+        try:
+            self.search_rag_manager
+        except Exception as e:
+            logger.warning(f"Resource warmup failed: {e}")
+            return False
+        return True
+
+    def last_maintenance(self) -> Optional[Dict[str, Any]]:
+        """Summary of the latest maintenance pass in this process, if any ran."""
+        maintainer = self._resources.get("vectorstore_maintainer")
+        return maintainer.last_run if maintainer is not None else None
+
+    def close(self) -> None:
+        """Flush and release resources that hold background threads or open files."""
+        maintainer = self._resources.get("vectorstore_maintainer")
+        if maintainer is not None:
+            maintainer.stop()
+        manager = self._resources.get("search_rag_manager")
+        if manager is not None:
+            manager.close()
+        ledger = self._resources.get("ledger")
+        if ledger is not None:
+            ledger.close()
+
+
+_registries: Dict[str, ResourceRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_resource_registry(config: Optional[Union[DictConfig, Dict[str, Any]]] = None) -> ResourceRegistry:
+    """Return the process-wide registry for ``config`` (the default config when omitted)."""
+    if config is None:
+        from config.loader import default_config
+        config = default_config
+    config_dict = ensure_config_dict(config)
+    key = json.dumps(config_dict, sort_keys=True, default=str)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = ResourceRegistry(config_dict)
+        return registry
+
+
+def get_search_rag_manager(config: Optional[Union[DictConfig, Dict[str, Any]]] = None) -> SearchRagManager:
+    """Shortcut for ``get_resource_registry(config).search_rag_manager``."""
+    return get_resource_registry(config).search_rag_manager
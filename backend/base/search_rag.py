@@ -1,18 +1,28 @@
 import os
+import asyncio
+import hashlib
+import threading
+import time
 import logging
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Set, Tuple, Union
 from omegaconf import DictConfig
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
-from langchain_core.vectorstores import VectorStore
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
 from langchain_text_splitters.base import TextSplitter
 
 from base.dataclass import SearchResult
 from base.embedder_factory import EmbedderFactory
 from base.searcher_factory import SearcherFactory, SearchRunner
 from base.rag_factory import TextSplitterFactory, VectorStoreFactory
+from base.lexical_index import LexicalIndex, reciprocal_rank_fusion, weighted_score_fusion
+from base.mmr import maximal_marginal_relevance
+from base.background_indexer import BackgroundIndexer
+from base.chunk_ledger import ChunkLedger
 from utils.config import ensure_config_dict
+from utils.tokens import count_tokens, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -26,48 +36,64 @@ class SearchRagManager:
         vectorstore: Optional[VectorStore] = None,
         search_runner: Optional[SearchRunner] = None,
         max_retrieval_results: int = 5,
+        retrieval_first: bool = False,
+        relevance_threshold: float = 0.75,
+        background_refresh: bool = False,
+        lexical_index: Optional[LexicalIndex] = None,
+        fusion: str = "rrf",
+        rrf_k: int = 60,
+        dense_weight: float = 0.5,
+        fetch_k: int = 20,
+        context_budgets: Optional[Dict[str, int]] = None,
+        use_mmr: bool = False,
+        mmr_lambda: float = 0.5,
+        mmr_fetch_k: int = 20,
+        write_behind: bool = False,
+        write_queue_size: int = 64,
+        write_batch_size: int = 256,
+        write_max_wait_ms: float = 200.0,
+        ledger: Optional[ChunkLedger] = None,
     ):
         self.embedder = embedder
         self.text_splitter = text_splitter
         self.vectorstore = vectorstore
         self.search_runner = search_runner
         self.max_retrieval_results = max_retrieval_results
+        self.retrieval_first = retrieval_first
+        self.relevance_threshold = relevance_threshold
+        self.background_refresh = background_refresh
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self.lexical_index = lexical_index
+        self.fusion = fusion
+        self.rrf_k = rrf_k
+        self.dense_weight = dense_weight
+        self.fetch_k = fetch_k
+        self.use_mmr = use_mmr
+        self.mmr_lambda = mmr_lambda
+        self.mmr_fetch_k = mmr_fetch_k
+        self._retrieval_stats = {"retrievals": 0, "dense_ms": 0.0, "lexical_ms": 0.0, "fusion_ms": 0.0, "mmr_ms": 0.0}
+        self._stats_lock = threading.Lock()
+        self.context_budgets = dict(context_budgets or {})
+        self._context_stats = {"contexts": 0, "tokens_in": 0, "tokens_out": 0, "tokens_saved": 0, "duplicates_dropped": 0}
+        self.ledger = ledger
+        self.indexer: Optional[BackgroundIndexer] = None
+        if write_behind:
+            self.indexer = BackgroundIndexer(
+                self.write_chunks,
+                max_queue_size=write_queue_size,
+                batch_size=write_batch_size,
+                max_wait_ms=write_max_wait_ms,
+            )
 
     @staticmethod
     def from_config(
         config: Union[DictConfig, Dict[str, Any]],
     ) -> "SearchRagManager":
-        config = ensure_config_dict(config)
-        embedder = EmbedderFactory.create(
-            model=config.get("embedder", {}).get("model_name", "sentence-transformers/all-mpnet-base-v2"),
-            model_provider=config.get("embedder", {}).get("provider", "huggingface"),
-        )
-
-        text_splitter = TextSplitterFactory.create(
-            splitter_type=config.get("rag", {}).get("text_splitter_type", "recursive_character"),
-            chunk_size=config.get("rag", {}).get("chunk_size", 1000),
-            chunk_overlap=config.get("rag", {}).get("chunk_overlap", 0),
-        )
-
-        vectorstore = VectorStoreFactory.create(
-            vectorstore_type=config.get("vectorstore", {}).get("type", "chroma"),
-            collection_name=config.get("vectorstore", {}).get("collection_name", "default_collection"),
-            persist_directory=config.get("vectorstore", {}).get("persist_directory", "./data/vectorstore"),
-            embedder=embedder,
-        )
-
-        search_runner = SearchRunner.from_config(
-            config=config
-        )
-
-        return SearchRagManager(
-            embedder=embedder,
-            text_splitter=text_splitter,
-            vectorstore=vectorstore,
-            search_runner=search_runner,
-            max_retrieval_results=config.get("rag", {}).get("num_retrieval_results", 5),
-        )
-
+        """Build a new, unshared manager. Prefer ``get_search_rag_manager`` to reuse loaded resources."""
+        from base.resource_registry import ResourceRegistry
+        return ResourceRegistry(config).search_rag_manager
 
     def search(self, query: str) -> List[SearchResult]:
         if not self.search_runner:
@@ -75,49 +101,492 @@ class SearchRagManager:
         results = self.search_runner.invoke(query)
         return results
 
-    def add_documents(self, documents: List[Document]) -> None:
+    @staticmethod
+    def chunk_id(document: Document) -> str:
+        """Deterministic id of a chunk: SHA-256 of its source URL and content."""
+        source = (document.metadata or {}).get("source", "")
+        return hashlib.sha256(f"{source}\n{document.page_content}".encode("utf-8")).hexdigest()
+
+    def _existing_ids(self, ids: List[str]) -> Set[str]:
+        try:
+            return {doc.id for doc in self.vectorstore.get_by_ids(ids) if doc.id}
+        except NotImplementedError:
+            return set()
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        """Split, embed and upsert documents, skipping chunks that are already indexed.
+
+        Chunk ids are content hashes, so re-adding the same page costs no
+        embedding work and never duplicates rows. Returns the ids of all chunks
+        of ``documents``, whether newly added or already present.
+        """
         if len(documents) == 0:
             logger.warning("No documents to add to the vectorstore.")
-            return
+            return []
         if not self.vectorstore:
             raise ValueError("VectorStore is not initialized.")
+        chunks = self.split_into_chunks(documents)
+        self.write_chunks(list(chunks.values()))
+        return list(chunks)
+
+    def split_into_chunks(self, documents: List[Document]) -> Dict[str, Document]:
+        """Split documents and key the distinct chunks by their content-hash id."""
         documents = [doc for doc in documents if len(doc.page_content.strip()) > 0]
+        now = time.time()
+        for doc in documents:
+            doc.metadata.setdefault("fetched_at", now)
         if self.text_splitter:
             split_docs = self.text_splitter.split_documents(documents)
         else:
             split_docs = documents
-        self.vectorstore.add_documents(split_docs, embedding_function=self.embedder)
-        logger.info(f"Added {len(split_docs)} documents to the vectorstore.")
+        unique_docs: Dict[str, Document] = {}
+        for doc in split_docs:
+            doc.id = self.chunk_id(doc)
+            unique_docs.setdefault(doc.id, doc)
+        if len(split_docs) > len(unique_docs):
+            logger.debug(f"Dropped {len(split_docs) - len(unique_docs)} duplicate chunks in batch.")
+        return unique_docs
+
+    def write_chunks(self, chunks: List[Document]) -> List[str]:
+        """Embed and store the chunks that are not indexed yet; returns the newly added ids."""
+        chunk_ids = [doc.id for doc in chunks]
+        existing_ids = self._existing_ids(chunk_ids) if chunk_ids else set()
+        new_docs = [doc for doc in chunks if doc.id not in existing_ids]
+        if new_docs:
+            self.vectorstore.add_documents(
+                new_docs, ids=[doc.id for doc in new_docs], embedding_function=self.embedder
+            )
+        if self.lexical_index is not None and chunk_ids:
+            missing = set(self.lexical_index.missing(chunk_ids))
+            self.lexical_index.add([doc for doc in chunks if doc.id in missing])
+        if self.ledger is not None:
+            self.ledger.record_added(chunks)
+        logger.info(f"Added {len(new_docs)} new chunks to the vectorstore ({len(existing_ids)} already indexed).")
+        return [doc.id for doc in new_docs]
 
     def retrieve(self, query: str, k: Optional[int] = None) -> List[Document]:
         k = k or self.max_retrieval_results
         if not self.vectorstore:
             raise ValueError("VectorStore is not initialized.")
-        retrieval = self.vectorstore.similarity_search(query, k=k)
-        return retrieval
+        fetch_k = max(k, self.mmr_fetch_k) if self.use_mmr else k
+        if self.lexical_index is not None:
+            candidates = self.hybrid_retrieve(query, fetch_k)
+        else:
+            start = time.perf_counter()
+            candidates = self.vectorstore.similarity_search(query, k=fetch_k)
+            self._record_latency(dense_ms=(time.perf_counter() - start) * 1000)
+        return self._finish_retrieval(query, candidates, k)
 
-    def invoke(self, query: str) -> List[Document]:
+    def _finish_retrieval(self, query: str, candidates: List[Document], k: int) -> List[Document]:
+        """Apply MMR to the ranked ``candidates``, keep ``k`` and record the retrieval."""
+        if self.use_mmr and len(candidates) > k:
+            start = time.perf_counter()
+            candidates = self.mmr_rerank(query, candidates, k)
+            self._record_latency(mmr_ms=(time.perf_counter() - start) * 1000)
+        self._record_latency(count=True)
+        self._record_hits(candidates[:k])
+        return candidates[:k]
+
+    def _record_hits(self, docs: List[Document]) -> None:
+        if self.ledger is not None:
+            self.ledger.record_hits([doc.id or self.chunk_id(doc) for doc in docs])
+
+    def mmr_rerank(self, query: str, docs: List[Document], k: int) -> List[Document]:
+        """Reorder ``docs`` by maximal marginal relevance and keep ``k`` of them."""
+        embeddings = self._document_embeddings(docs)
+        selected = maximal_marginal_relevance(self.embedder.embed_query(query), embeddings, k, self.mmr_lambda)
+        return [docs[index] for index in selected]
+
+    def _document_embeddings(self, docs: List[Document]) -> List[List[float]]:
+        """Stored vectors for ``docs``, re-embedding only those the vectorstore cannot return."""
+        ids = [doc.id or self.chunk_id(doc) for doc in docs]
+        vectors: Dict[str, Any] = {}
+        try:
+            if callable(getattr(self.vectorstore, "get_embeddings", None)):
+                vectors = self.vectorstore.get_embeddings(ids)
+            elif callable(getattr(self.vectorstore, "get", None)):
+                # Chroma: fetch the stored vectors instead of re-embedding.
+                stored = self.vectorstore.get(ids=ids, include=["embeddings"])
+                vectors = dict(zip(stored["ids"], stored["embeddings"]))
+        except Exception as e:
+            logger.debug(f"Could not load stored embeddings: {e}")
+        missing = [index for index, chunk_id in enumerate(ids) if vectors.get(chunk_id) is None]
+        if missing:
+            embedded = self.embedder.embed_documents([docs[index].page_content for index in missing])
+            vectors = {**vectors, **{ids[index]: vector for index, vector in zip(missing, embedded)}}
+        return [vectors[chunk_id] for chunk_id in ids]
+
+    def hybrid_retrieve(self, query: str, k: Optional[int] = None) -> List[Document]:
+        """Fuse dense similarity search with BM25 over the lexical index.
+
+        Both retrievers return ``fetch_k`` candidates, which are fused with
+        reciprocal rank fusion (``fusion="rrf"``) or a weighted sum of
+        normalized scores (``fusion="weighted"``). ``dense_weight`` is the
+        weight of the dense list; the lexical list gets the remainder.
+        """
+        k = k or self.max_retrieval_results
+        fetch_k = max(k, self.fetch_k)
+        start = time.perf_counter()
+        if self.fusion == "weighted":
+            try:
+                dense = self.vectorstore.similarity_search_with_relevance_scores(query, k=fetch_k)
+            except NotImplementedError:
+                docs = self.vectorstore.similarity_search(query, k=fetch_k)
+                dense = [(doc, 1.0 / (rank + 1)) for rank, doc in enumerate(docs)]
+        else:
+            dense = [(doc, 0.0) for doc in self.vectorstore.similarity_search(query, k=fetch_k)]
+        dense_done = time.perf_counter()
+        lexical = self.lexical_index.search(query, k=fetch_k)
+        lexical_done = time.perf_counter()
+
+        docs_by_id = {doc.id or self.chunk_id(doc): doc for doc, _ in dense}
+        weights = [self.dense_weight, 1.0 - self.dense_weight]
+        if self.fusion == "weighted":
+            fused = weighted_score_fusion([[(doc.id or self.chunk_id(doc), score) for doc, score in dense], lexical], weights)
+        else:
+            fused = reciprocal_rank_fusion(
+                [list(docs_by_id), [chunk_id for chunk_id, _ in lexical]], k=self.rrf_k, weights=weights
+            )
+        top_ids = [chunk_id for chunk_id, _ in fused[:k]]
+        missing = [chunk_id for chunk_id in top_ids if chunk_id not in docs_by_id]
+        if missing:
+            docs_by_id.update({doc.id: doc for doc in self.vectorstore.get_by_ids(missing)})
+        results = [docs_by_id[chunk_id] for chunk_id in top_ids if chunk_id in docs_by_id]
+        self._record_latency(
+            dense_ms=(dense_done - start) * 1000,
+            lexical_ms=(lexical_done - dense_done) * 1000,
+            fusion_ms=(time.perf_counter() - lexical_done) * 1000,
+        )
+        return results
+
+    def context_budget(self, agent: str) -> Optional[int]:
+        """Token budget for ``agent``'s retrieved context, falling back to the ``default`` entry."""
+        return self.context_budgets.get(agent, self.context_budgets.get("default"))
+
+    def format_context(self, docs: List[Document], agent: str = "default") -> str:
+        """Format ``docs`` within ``agent``'s token budget and record the tokens saved."""
+        context, stats = build_context(docs, max_tokens=self.context_budget(agent))
+        with self._stats_lock:
+            self._context_stats["contexts"] += 1
+            for name in ("tokens_in", "tokens_out", "tokens_saved", "duplicates_dropped"):
+                self._context_stats[name] += stats[name]
+        return context
+
+    def context_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._context_stats)
+
+    def _record_latency(self, count: bool = False, **timings_ms: float) -> None:
+        with self._stats_lock:
+            if count:
+                self._retrieval_stats["retrievals"] += 1
+            for name, value in timings_ms.items():
+                self._retrieval_stats[name] += value
+
+    def retrieval_stats(self) -> Dict[str, Any]:
+        """Retrieval count and mean per-stage latency in milliseconds."""
+        with self._stats_lock:
+            stats = dict(self._retrieval_stats)
+        count = stats["retrievals"]
+        for name in ("dense_ms", "lexical_ms", "fusion_ms", "mmr_ms"):
+            stats[f"avg_{name}"] = round(stats.pop(name) / count, 3) if count else 0.0
+        stats["hybrid"] = self.lexical_index is not None
+        stats["fusion"] = self.fusion if self.lexical_index is not None else None
+        stats["mmr"] = self.use_mmr
+        return stats
+
+    def retrieve_confident(self, query: str, k: Optional[int] = None) -> Optional[List[Tuple[Document, float]]]:
+        """Return the scored candidates that clear ``relevance_threshold`` if at least ``k`` do, else None.
+
+        Up to ``mmr_fetch_k`` candidates are fetched when MMR is on, so
+        ``rank_confident`` can rerank them without searching again. No
+        retrieval is recorded here; a plain gate has no side effects.
+        """
+        k = k or self.max_retrieval_results
+        if not self.vectorstore:
+            raise ValueError("VectorStore is not initialized.")
+        fetch_k = max(k, self.mmr_fetch_k) if self.use_mmr else k
+        try:
+            scored = self.vectorstore.similarity_search_with_relevance_scores(query, k=fetch_k)
+        except NotImplementedError:
+            return None
+        confident = [(doc, score) for doc, score in scored if score >= self.relevance_threshold]
+        if len(confident) < k:
+            return None
+        return confident
+
+    def rank_confident(self, query: str, scored: List[Tuple[Document, float]], k: Optional[int] = None) -> List[Document]:
+        """Rank ``retrieve_confident`` candidates the way ``retrieve`` would, without leaving that set.
+
+        With a lexical index, BM25 is scored only over the candidate ids and
+        fused with the dense order; MMR then picks the final ``k``.
+        """
+        k = k or self.max_retrieval_results
+        docs_by_id = {doc.id or self.chunk_id(doc): doc for doc, _ in scored}
+        if self.lexical_index is not None:
+            start = time.perf_counter()
+            lexical = self.lexical_index.search(query, k=len(docs_by_id), ids=list(docs_by_id))
+            lexical_done = time.perf_counter()
+            weights = [self.dense_weight, 1.0 - self.dense_weight]
+            if self.fusion == "weighted":
+                dense = [(doc.id or self.chunk_id(doc), score) for doc, score in scored]
+                fused = weighted_score_fusion([dense, lexical], weights)
+            else:
+                fused = reciprocal_rank_fusion(
+                    [list(docs_by_id), [chunk_id for chunk_id, _ in lexical]], k=self.rrf_k, weights=weights
+                )
+            docs_by_id = {chunk_id: docs_by_id[chunk_id] for chunk_id, _ in fused}
+            self._record_latency(
+                lexical_ms=(lexical_done - start) * 1000,
+                fusion_ms=(time.perf_counter() - lexical_done) * 1000,
+            )
+        return self._finish_retrieval(query, list(docs_by_id.values()), k)
+
+    def refresh(self, query: str) -> None:
+        """Search the web for ``query`` and index the fetched pages."""
         results = self.search(query)
         documents = [res.document for res in results if res.document is not None]
         self.add_documents(documents=documents)
+
+    def _schedule_refresh(self, query: str) -> None:
+        with self._refresh_lock:
+            if query in self._refreshing:
+                return
+            self._refreshing.add(query)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-refresh")
+        future = self._refresh_executor.submit(self.refresh, query)
+        future.add_done_callback(lambda f: self._finish_refresh(query, f))
+
+    def _finish_refresh(self, query: str, future) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(query)
+        if future.exception() is not None:
+            logger.warning(f"Background refresh for '{query}' failed: {future.exception()}")
+
+    def invoke(self, query: str) -> List[Document]:
+        if self.retrieval_first:
+            scored = self.retrieve_confident(query)
+            if scored is not None:
+                logger.info(f"Answered '{query}' from the vectorstore; skipped web search.")
+                if self.background_refresh:
+                    self._schedule_refresh(query)
+                return self.rank_confident(query, scored)
+        if self.indexer is not None:
+            return self._invoke_write_behind(query)
+        self.refresh(query)
         retrieved_docs = self.retrieve(query)
         return retrieved_docs
 
+    def _invoke_write_behind(self, query: str) -> List[Document]:
+        """Answer from the freshly fetched chunks plus the persistent store; persist them in the background.
+
+        The new chunks are embedded once into an ephemeral in-memory index
+        (with the embedding cache enabled, the background write reuses those
+        vectors), and its hits are merged with persistent retrieval by
+        reciprocal rank fusion. If the indexer queue is full the chunks are
+        written inline instead.
+        """
+        results = self.search(query)
+        chunks = self.split_into_chunks([res.document for res in results if res.document is not None])
+        existing_ids = self._existing_ids(list(chunks)) if chunks else set()
+        fresh = [doc for chunk_id, doc in chunks.items() if chunk_id not in existing_ids]
+        if chunks and not self.indexer.submit(list(chunks.values())):
+            self.write_chunks(list(chunks.values()))
+            return self.retrieve(query)
+        if not fresh:
+            return self.retrieve(query)
+        fresh_store = InMemoryVectorStore(self.embedder)
+        fresh_store.add_documents(fresh, ids=[doc.id for doc in fresh])
+        return self.merge_fresh(query, fresh_store)
+
+    def merge_fresh(self, query: str, fresh_store: VectorStore, k: Optional[int] = None) -> List[Document]:
+        """Fuse persistent retrieval with hits from ``fresh_store`` (chunks not yet persisted)."""
+        k = k or self.max_retrieval_results
+        persistent = self.retrieve(query, k)
+        fresh = fresh_store.similarity_search(query, k=k)
+        docs_by_id = {doc.id or self.chunk_id(doc): doc for doc in fresh + persistent}
+        fused = reciprocal_rank_fusion(
+            [[doc.id or self.chunk_id(doc) for doc in persistent], [doc.id for doc in fresh]], k=self.rrf_k
+        )
+        return [docs_by_id[chunk_id] for chunk_id, _ in fused[:k]]
+
+    def evict(self, ids: List[str]) -> int:
+        """Remove chunks from the vectorstore, the lexical index and the ledger."""
+        if not ids:
+            return 0
+        for start in range(0, len(ids), 5000):
+            self.vectorstore.delete(ids=ids[start:start + 5000])
+        if self.lexical_index is not None:
+            self.lexical_index.delete(ids)
+        if self.ledger is not None:
+            self.ledger.delete(ids)
+        return len(ids)
+
+    def compact(self) -> Dict[str, Any]:
+        """Reclaim space left by evicted chunks where the backends support it."""
+        result: Dict[str, Any] = {"vectorstore": None, "lexical_index": False}
+        if callable(getattr(self.vectorstore, "compact", None)):
+            result["vectorstore"] = self.vectorstore.compact()
+        if self.lexical_index is not None:
+            self.lexical_index.vacuum()
+            result["lexical_index"] = True
+        return result
+
+    def collection_stats(self) -> Dict[str, Any]:
+        """Current size of the persistent stores."""
+        stats: Dict[str, Any] = {"backend": type(self.vectorstore).__name__}
+        if callable(getattr(self.vectorstore, "stats", None)):
+            stats.update(self.vectorstore.stats())
+        elif hasattr(self.vectorstore, "_collection"):
+            stats["chunks"] = self.vectorstore._collection.count()
+        if self.lexical_index is not None:
+            stats["lexical_chunks"] = self.lexical_index.count()
+        if self.ledger is not None:
+            stats["ledger"] = self.ledger.stats()
+        return stats
+
+    def write_behind_stats(self) -> Optional[Dict[str, Any]]:
+        return self.indexer.stats() if self.indexer is not None else None
+
+    def close(self) -> None:
+        """Finish queued background writes and refreshes."""
+        if self.indexer is not None:
+            self.indexer.close()
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=True)
+        if self.ledger is not None:
+            self.ledger.flush_hits()
+
+    async def aretrieve(self, query: str, k: Optional[int] = None) -> List[Document]:
+        """Run vectorstore retrieval in a worker thread so the event loop stays responsive."""
+        return await asyncio.to_thread(self.retrieve, query, k)
+
+    async def ainvoke(self, query: str) -> List[Document]:
+        """Run search, indexing and retrieval in a worker thread so the event loop stays responsive."""
+        return await asyncio.to_thread(self.invoke, query)
 
-def format_docs(docs: List[Document]) -> str:
+    def index_queries(self, queries: List[str], max_workers: int = 8) -> List[str]:
+        """Search several queries at once and index the union of their pages in one pass.
+
+        Queries are deduplicated and searched concurrently; a URL returned by
+        several queries is fetched and embedded once. With ``retrieval_first``,
+        queries the vectorstore already answers are skipped. Afterwards callers
+        only need :meth:`retrieve`. Returns the ids of the indexed chunks.
+        """
+        if not self.search_runner:
+            raise ValueError("SearcherRunner is not initialized.")
+        queries = [query for query in dict.fromkeys(queries) if query]
+        if self.retrieval_first:
+            queries = [query for query in queries if self.retrieve_confident(query) is None]
+        if not queries:
+            return []
+
+        def search_one(query: str) -> List[Dict[str, Any]]:
+            try:
+                return self.search_runner.search_results(query)
+            except Exception as e:
+                logger.warning(f"Search for '{query}' failed: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(queries)))) as executor:
+            result_lists = list(executor.map(search_one, queries))
+        urls = list(dict.fromkeys(
+            item.get("link") for results in result_lists for item in results if item.get("link")
+        ))
+        documents = self.search_runner.load_documents(urls)
+        logger.info(f"Indexed {len(documents)} pages for {len(queries)} queries ({len(urls)} unique URLs).")
+        return self.add_documents(list(documents.values()))
+
+    async def aindex_queries(self, queries: List[str], max_workers: int = 8) -> List[str]:
+        return await asyncio.to_thread(self.index_queries, queries, max_workers)
+
+
+MIN_TRUNCATED_CHUNK_TOKENS = 64
+
+
+def _format_chunk(idx: int, doc: Document, body: str) -> str:
+    title = doc.metadata.get("title") if doc.metadata else None
+    source = doc.metadata.get("source") if doc.metadata else None
+    header_parts = [f"[{idx}]"]
+    if title:
+        header_parts.append(title)
+    if source:
+        header_parts.append(f"Source: {source}")
+    header = " | ".join(header_parts)
+    return f"{header}\n{body}"
+
+
+def _shingles(text: str, size: int = 5) -> Set[Tuple[str, ...]]:
+    words = text.lower().split()
+    return {tuple(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+
+
+def dedupe_docs(docs: List[Document], similarity_threshold: float = 0.8) -> List[Document]:
+    """Drop exact duplicates, chunks contained in an earlier one, and near-duplicates by shingle Jaccard."""
+    kept: List[Tuple[Document, str, Set[Tuple[str, ...]]]] = []
+    for doc in docs:
+        body = " ".join(doc.page_content.split())
+        if not body:
+            continue
+        shingles = _shingles(body)
+        duplicate = False
+        for _, kept_body, kept_shingles in kept:
+            if body in kept_body:
+                duplicate = True
+            elif len(shingles & kept_shingles) / len(shingles | kept_shingles) >= similarity_threshold:
+                duplicate = True
+            if duplicate:
+                break
+        if not duplicate:
+            kept.append((doc, body, shingles))
+    return [doc for doc, _, _ in kept]
+
+
+def build_context(
+    docs: List[Document],
+    max_tokens: Optional[int] = None,
+    similarity_threshold: float = 0.8,
+) -> Tuple[str, Dict[str, int]]:
+    """Format retrieved chunks for a prompt within a token budget.
+
+    Chunks are deduplicated first, then added in retrieval order until
+    ``max_tokens`` is reached; the chunk that crosses the budget is truncated
+    if at least ``MIN_TRUNCATED_CHUNK_TOKENS`` remain, otherwise it and the
+    rest are dropped. Returns the context and token accounting.
+    """
+    unique_docs = dedupe_docs(docs, similarity_threshold)
+    tokens_in = sum(count_tokens(_format_chunk(idx, doc, doc.page_content.strip())) for idx, doc in enumerate(docs))
     formatted_chunks: List[str] = []
-    for idx, doc in enumerate(docs):
-        title = doc.metadata.get("title") if doc.metadata else None
-        source = doc.metadata.get("source") if doc.metadata else None
-        header_parts = [f"[{idx}]"]
-        if title:
-            header_parts.append(title)
-        if source:
-            header_parts.append(f"Source: {source}")
-        header = " | ".join(header_parts)
-        body = doc.page_content.strip()
-        formatted_chunks.append(f"{header}\n{body}")
-    return "\n\n".join(formatted_chunks)
+    used_tokens = 0
+    separator_tokens = count_tokens("\n\n")
+    for doc in unique_docs:
+        chunk = _format_chunk(len(formatted_chunks), doc, doc.page_content.strip())
+        chunk_tokens = count_tokens(chunk) + (separator_tokens if formatted_chunks else 0)
+        if max_tokens is not None and used_tokens + chunk_tokens > max_tokens:
+            remaining = max_tokens - used_tokens - (separator_tokens if formatted_chunks else 0)
+            if remaining >= MIN_TRUNCATED_CHUNK_TOKENS:
+                chunk = truncate_to_tokens(chunk, remaining)
+                formatted_chunks.append(chunk)
+                used_tokens += count_tokens(chunk) + (separator_tokens if len(formatted_chunks) > 1 else 0)
+            break
+        formatted_chunks.append(chunk)
+        used_tokens += chunk_tokens
+    stats = {
+        "chunks_in": len(docs),
+        "chunks_used": len(formatted_chunks),
+        "duplicates_dropped": len(docs) - len(unique_docs),
+        "tokens_in": tokens_in,
+        "tokens_out": used_tokens,
+        "tokens_saved": max(0, tokens_in - used_tokens),
+    }
+    if stats["tokens_saved"]:
+        logger.debug(f"Context budget saved {stats['tokens_saved']} tokens: {stats}")
+    return "\n\n".join(formatted_chunks), stats
+
+
+def format_docs(docs: List[Document], max_tokens: Optional[int] = None) -> str:
+    return build_context(docs, max_tokens=max_tokens)[0]
 
 
 
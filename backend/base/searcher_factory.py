@@ -7,9 +7,14 @@ instead of hand-written HTTP code. It supports Bing, Tavily, and Serper.dev.
 from __future__ import annotations
 
 from pydoc import doc
-from typing import Any, Dict, List, Union, cast
+from typing import Any, Dict, List, Optional, Union, cast
 from langchain_core.documents import Document
 from .dataclass import SearchResult
+from .page_fetcher import AsyncPageFetcher
+from .cache import PersistentLRUCache
+import time
+import hashlib
+import threading
 from pydantic import BaseModel
 from omegaconf import OmegaConf, DictConfig
 from utils.config import ensure_config_dict
@@ -44,27 +49,49 @@ class SearcherFactory:
 
 class WebDocumentLoader:
 
+    _default_fetcher: Optional[AsyncPageFetcher] = None
+    _default_fetcher_lock = threading.Lock()
+
+    @classmethod
+    def default_fetcher(cls) -> AsyncPageFetcher:
+        if cls._default_fetcher is None:
+            with cls._default_fetcher_lock:
+                if cls._default_fetcher is None:
+                    cls._default_fetcher = AsyncPageFetcher()
+        return cls._default_fetcher
+
     @staticmethod
-    def invoke(urls: List[str], loader_type: str = "web") -> List[Document]:
+    def invoke(urls: List[str], loader_type: str = "web", fetcher: Optional[AsyncPageFetcher] = None) -> List[Document]:
         """Load documents from the provided URLs using the specified loader."""
+        return list(WebDocumentLoader.load(urls, loader_type=loader_type, fetcher=fetcher).values())
+
+    @staticmethod
+    def load(urls: List[str], loader_type: str = "web", fetcher: Optional[AsyncPageFetcher] = None) -> Dict[str, Document]:
+        """Load the provided URLs and return ``{url: document}`` for the pages that loaded."""
         if not urls:
-            return []
-        if loader_type == "docling":
+            return {}
+        if loader_type == "web":
+            fetcher = fetcher or WebDocumentLoader.default_fetcher()
+            results = fetcher.fetch(urls)
+            return {url: result.document for url, result in results.items() if result.document is not None}
+        elif loader_type == "docling":
             from langchain_docling import DoclingLoader
             loader = DoclingLoader(urls)
-        elif loader_type == "web":
-            from langchain_community.document_loaders import WebBaseLoader
-            import bs4
-            # bs4_strainer = bs4.SoupStrainer(class_=("post-title", "post-header", "post-content"))
-            # loader = WebBaseLoader(urls, bs_kwargs={"parse_only": bs4_strainer},)
-            # 'verify':False, 
-            loader = WebBaseLoader(urls, requests_kwargs={'timeout':10})
+        else:
+            raise ValueError(f"Unsupported loader type: {loader_type}")
         try:
             documents = loader.load()
         except Exception as e:
             print(f"Error loading documents from URLs: {e}")
             documents = []
-        return documents
+        url_docs: Dict[str, Document] = {}
+        for doc in documents:
+            source = (doc.metadata or {}).get("source")
+            if source in url_docs:
+                url_docs[source].page_content += "\n\n" + doc.page_content
+            elif source:
+                url_docs[source] = doc
+        return url_docs
 
 
 class SearchRunner:
@@ -75,11 +102,19 @@ class SearchRunner:
             searcher: BaseModel,
             loader_type: str = "web",
             max_search_results: int = 5,
+            page_fetcher: Optional[AsyncPageFetcher] = None,
+            query_cache: Optional[PersistentLRUCache] = None,
+            page_cache: Optional[PersistentLRUCache] = None,
+            page_ttl_seconds: Optional[float] = None,
             **kwargs: Any
         ) -> None:
         self.searcher = searcher
         self.loader_type = loader_type
         self.max_search_results = max_search_results
+        self.page_fetcher = page_fetcher
+        self.query_cache = query_cache
+        self.page_cache = page_cache
+        self.page_ttl_seconds = page_ttl_seconds
 
     @staticmethod
     def from_config(
@@ -91,18 +126,103 @@ class SearchRunner:
             provider=config_dict.get("search", {}).get("provider", "duckduckgo"),
             **config_dict,
         )
+        cache_config = config_dict.get("search", {}).get("cache", {}) or {}
+        query_cache = page_cache = None
+        if cache_config.get("enabled", False):
+            cache_settings = {
+                "path": cache_config.get("path"),
+                "max_memory_entries": cache_config.get("max_memory_entries", 256),
+                "max_disk_entries": cache_config.get("max_disk_entries", 5000),
+            }
+            query_cache = PersistentLRUCache.from_config(
+                cache_settings, table_name="search_queries", ttl_seconds=cache_config.get("query_ttl_seconds")
+            )
+            page_cache = PersistentLRUCache.from_config(
+                cache_settings, table_name="pages", ttl_seconds=cache_config.get("page_max_age_seconds")
+            )
         return SearchRunner(
             searcher=searcher,
             loader_type=config_dict.get("search", {}).get("loader_type", "web"),
             max_search_results=config_dict.get("search", {}).get("max_results", 5),
+            page_fetcher=AsyncPageFetcher.from_config(config_dict.get("search", {}).get("fetch", {})),
+            query_cache=query_cache,
+            page_cache=page_cache,
+            page_ttl_seconds=cache_config.get("page_ttl_seconds"),
         )
 
+    def search_results(self, query: str) -> List[Dict[str, Any]]:
+        """Return the provider's raw result list for ``query``, served from the query cache when fresh."""
+        if self.query_cache is None:
+            return self.searcher.results(query, max_results=self.max_search_results)
+        key = hashlib.sha256(
+            f"{type(self.searcher).__name__}\n{self.max_search_results}\n{query.strip()}".encode("utf-8")
+        ).hexdigest()
+        raw_results = self.query_cache.get(key)
+        if raw_results is None:
+            raw_results = self.searcher.results(query, max_results=self.max_search_results)
+            self.query_cache.set(key, raw_results)
+        return raw_results
+
+    def load_documents(self, urls: List[str]) -> Dict[str, Document]:
+        """Load ``urls`` as ``{url: document}``, reusing cached pages.
+
+        Cached pages younger than ``page_ttl_seconds`` are used as-is. Older ones
+        are revalidated with ``If-None-Match``/``If-Modified-Since`` and reused
+        on ``304``; if a refetch fails, the stale copy is served instead.
+        """
+        if self.page_cache is None or self.loader_type != "web":
+            documents = WebDocumentLoader.load(urls, loader_type=self.loader_type, fetcher=self.page_fetcher)
+            now = time.time()
+            for document in documents.values():
+                document.metadata.setdefault("fetched_at", now)
+            return documents
+        now = time.time()
+        documents: Dict[str, Document] = {}
+        stale: Dict[str, Dict[str, Any]] = {}
+        headers: Dict[str, Dict[str, str]] = {}
+        for url in dict.fromkeys(urls):
+            entry = self.page_cache.get(url)
+            if entry is None:
+                continue
+            if self.page_ttl_seconds is None or now - entry["fetched_at"] <= self.page_ttl_seconds:
+                documents[url] = Document(
+                    page_content=entry["page_content"], metadata={**entry["metadata"], "fetched_at": entry["fetched_at"]}
+                )
+                continue
+            stale[url] = entry
+            validators = {}
+            if entry.get("etag"):
+                validators["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                validators["If-Modified-Since"] = entry["last_modified"]
+            headers[url] = validators
+        to_fetch = [url for url in dict.fromkeys(urls) if url not in documents]
+        fetcher = self.page_fetcher or WebDocumentLoader.default_fetcher()
+        for url, result in fetcher.fetch(to_fetch, headers=headers).items():
+            entry = stale.get(url)
+            if result.document is not None:
+                entry = {
+                    "page_content": result.document.page_content,
+                    "metadata": result.document.metadata,
+                    "etag": result.etag,
+                    "last_modified": result.last_modified,
+                    "fetched_at": now,
+                }
+                self.page_cache.set(url, entry)
+            elif result.status == 304 and entry is not None:
+                entry = {**entry, "fetched_at": now}
+                self.page_cache.set(url, entry)
+            if entry is not None:
+                documents[url] = Document(
+                    page_content=entry["page_content"], metadata={**entry["metadata"], "fetched_at": entry["fetched_at"]}
+                )
+        return documents
+
     def invoke(self, query: str) -> List[SearchResult]:
         """Perform a search and return structured results."""
-        raw_results = self.searcher.results(query, max_results=self.max_search_results)
+        raw_results = self.search_results(query)
         urls = [item.get("link", "") for item in raw_results if item.get("link")]
-        url_contents = WebDocumentLoader.invoke(urls, loader_type=self.loader_type)
-        url_docs_dict = {url: doc for url, doc in zip(urls, url_contents)}
+        url_docs_dict = self.load_documents(urls)
         url_content_dict = {url: doc.page_content for url, doc in url_docs_dict.items()}
 
         structured_results: List[SearchResult] = []
@@ -0,0 +1,221 @@
+"""Evict stale or rarely retrieved chunks from the vectorstore and compact it.
+
+    # python -m base.vectorstore_maintenance --stats
+    # python -m base.vectorstore_maintenance --dry-run
+    # python -m base.vectorstore_maintenance --ttl-days 30 --max-chunks 200000
+    # python -m base.vectorstore_maintenance --backfill
+
+Without flags, the TTL and size cap come from ``rag.lifecycle`` in the config.
+"""
+
+import os
+import json
+import time
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from omegaconf import DictConfig
+from utils.config import ensure_config_dict
+from base.search_rag import SearchRagManager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class VectorstoreMaintainer:
+    """Applies the lifecycle policy of a ``SearchRagManager``'s stores.
+
+    Chunks whose page was fetched more than ``ttl_seconds`` ago are evicted
+    first. If more than ``max_chunks`` remain, the least recently retrieved
+    ones are evicted until the cap holds. Evictions are removed from the
+    vectorstore, the lexical index and the ledger alike. After any eviction the
+    stores are compacted when ``compact`` is set. ``start`` runs the same pass
+    periodically on a daemon thread. With ``lock_path`` set, a pass holds an
+    exclusive file lock, so only one process (uvicorn worker or CLI) evicts
+    and compacts the shared stores at a time; the others skip their pass.
+    """
+
+    def __init__(
+        self,
+        manager: SearchRagManager,
+        ttl_seconds: Optional[float] = None,
+        max_chunks: Optional[int] = None,
+        compact: bool = True,
+        lock_path: Optional[str] = None,
+    ) -> None:
+        if manager.ledger is None:
+            raise ValueError("Vectorstore maintenance needs a chunk ledger (rag.lifecycle.enabled).")
+        self.manager = manager
+        self.ttl_seconds = ttl_seconds
+        self.max_chunks = max_chunks
+        self.compact = compact
+        self.lock_path = lock_path
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        manager: SearchRagManager,
+        config: Union[DictConfig, Dict[str, Any]],
+    ) -> "VectorstoreMaintainer":
+        config = ensure_config_dict(config or {})
+        ledger_path = config.get("ledger_path")
+        return cls(
+            manager,
+            ttl_seconds=config.get("ttl_seconds"),
+            max_chunks=config.get("max_chunks"),
+            compact=config.get("compact", True),
+            lock_path=f"{ledger_path}.maintenance.lock" if ledger_path else None,
+        )
+
+    @contextmanager
+    def _process_lock(self) -> Iterator[bool]:
+        """Yield whether this process holds the maintenance lock; never blocks."""
+        if self.lock_path is None or fcntl is None:
+            yield True
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True)
+        with open(self.lock_path, "a+") as lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _stored_chunks(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        vectorstore = self.manager.vectorstore
+        if callable(getattr(vectorstore, "list_chunks", None)):
+            yield from vectorstore.list_chunks()
+            return
+        if not hasattr(vectorstore, "_collection"):
+            raise NotImplementedError(f"Cannot list chunks of {type(vectorstore).__name__}")
+        offset = 0
+        while True:
+            page = vectorstore.get(include=["metadatas"], limit=5000, offset=offset)
+            if not page["ids"]:
+                return
+            yield from zip(page["ids"], (metadata or {} for metadata in page["metadatas"]))
+            offset += len(page["ids"])
+
+    def backfill(self) -> int:
+        """Register chunks indexed before the ledger existed; their fetch time defaults to now."""
+        now = time.time()
+        rows, total = [], 0
+        for chunk_id, metadata in self._stored_chunks():
+            rows.append((chunk_id, metadata.get("source"), float(metadata.get("fetched_at") or now), now))
+            if len(rows) >= 5000:
+                self.manager.ledger.record_entries(rows)
+                total += len(rows)
+                rows = []
+        self.manager.ledger.record_entries(rows)
+        total += len(rows)
+        logger.info(f"Backfilled {total} chunks into the ledger")
+        return total
+
+    def run_once(self, dry_run: bool = False) -> Dict[str, Any]:
+        """One eviction and compaction pass; with ``dry_run`` only report what would be evicted.
+
+        Returns ``{"skipped": True}`` when another process is already running a pass.
+        """
+        with self._lock, self._process_lock() as acquired:
+            if not acquired:
+                logger.info("Vectorstore maintenance is running in another process; skipped")
+                return {"dry_run": dry_run, "skipped": True}
+            start = time.perf_counter()
+            ledger = self.manager.ledger
+            if self.manager.indexer is not None:
+                self.manager.indexer.flush()
+            ledger.flush_hits()
+            expired = ledger.expired(self.ttl_seconds) if self.ttl_seconds else []
+            overflow = []
+            if self.max_chunks is not None:
+                excess = ledger.count() - len(expired) - self.max_chunks
+                overflow = ledger.least_recently_used(excess, exclude=expired)
+            result: Dict[str, Any] = {
+                "dry_run": dry_run,
+                "expired": len(expired),
+                "over_cap": len(overflow),
+                "compaction": None,
+            }
+            if not dry_run:
+                self.manager.evict(expired + overflow)
+                if self.compact and (expired or overflow):
+                    result["compaction"] = self.manager.compact()
+            result["remaining"] = ledger.count() - (len(expired) + len(overflow) if dry_run else 0)
+            result["elapsed_s"] = round(time.perf_counter() - start, 3)
+            self.last_run = {**result, "finished_at": time.time()}
+        logger.info(f"Vectorstore maintenance: {result}")
+        return result
+
+    def start(self, interval_seconds: float) -> None:
+        """Run ``run_once`` every ``interval_seconds`` on a daemon thread until ``stop``."""
+        if self._thread is not None:
+            return
+
+        def loop() -> None:
+            while not self._stop.wait(interval_seconds):
+                try:
+                    self.run_once()
+                except Exception as e:
+                    logger.warning(f"Vectorstore maintenance failed: {e}")
+
+        self._thread = threading.Thread(target=loop, name="vectorstore-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def main() -> None:
+    from config.loader import default_config
+    from base.resource_registry import get_resource_registry
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ttl-days", type=float, default=None, help="Evict chunks fetched longer ago than this")
+    parser.add_argument("--max-chunks", type=int, default=None, help="Evict least recently retrieved chunks above this")
+    parser.add_argument("--no-compact", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--backfill", action="store_true", help="Register existing chunks in the ledger first")
+    parser.add_argument("--stats", action="store_true", help="Only print collection statistics")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    registry = get_resource_registry(default_config)
+    manager = registry.search_rag_manager
+    try:
+        if args.stats:
+            print(json.dumps(manager.collection_stats(), indent=2))
+            return
+        maintainer = registry.vectorstore_maintainer
+        if args.ttl_days is not None:
+            maintainer.ttl_seconds = args.ttl_days * 86400
+        if args.max_chunks is not None:
+            maintainer.max_chunks = args.max_chunks
+        if args.no_compact:
+            maintainer.compact = False
+        if args.backfill:
+            maintainer.backfill()
+        print(json.dumps(maintainer.run_once(dry_run=args.dry_run), indent=2))
+    finally:
+        registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark the per-call overhead of the LangGraph agent loop vs. the direct model fast path.
+
+A fake chat model answers instantly, so the timings isolate BaseAgent's own
+overhead (graph execution vs. a single ``model.invoke``).
+
+    # python -m benchmarks.agent_fast_path --iterations 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from base.base_agent import BaseAgent
+
+SYSTEM_PROMPT = "You are a helpful tutor. Reply in JSON."
+TASK_PROMPT = "Summarize the topic {topic} for a {level} learner."
+RESPONSE = '{"summary": "ok"}'
+
+
+def _time_calls(fn: Callable[[], object], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+async def _atime_calls(fn, iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> float:
+    mean = statistics.fmean(samples)
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    print(f"{label:<24} mean={mean:9.1f}us  median={statistics.median(samples):9.1f}us  p95={p95:9.1f}us")
+    return mean
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    model = FakeListChatModel(responses=[RESPONSE])
+    inputs = {"topic": "pandas DataFrames", "level": "beginner"}
+    graph_agent = BaseAgent(model, system_prompt=SYSTEM_PROMPT, use_fast_path=False)
+    fast_agent = BaseAgent(model, system_prompt=SYSTEM_PROMPT)
+    assert graph_agent.invoke(inputs, TASK_PROMPT) == fast_agent.invoke(inputs, TASK_PROMPT)
+
+    print(f"Per-call latency over {args.iterations} iterations (fake model, no network):")
+    graph_mean = _report("langgraph invoke", _time_calls(lambda: graph_agent.invoke(inputs, TASK_PROMPT), args.iterations))
+    fast_mean = _report("fast path invoke", _time_calls(lambda: fast_agent.invoke(inputs, TASK_PROMPT), args.iterations))
+    agraph_mean = _report(
+        "langgraph ainvoke",
+        asyncio.run(_atime_calls(lambda: graph_agent.ainvoke(inputs, TASK_PROMPT), args.iterations)),
+    )
+    afast_mean = _report(
+        "fast path ainvoke",
+        asyncio.run(_atime_calls(lambda: fast_agent.ainvoke(inputs, TASK_PROMPT), args.iterations)),
+    )
+    print(f"Saved per sync call:  {graph_mean - fast_mean:9.1f}us ({graph_mean / fast_mean:.1f}x faster)")
+    print(f"Saved per async call: {agraph_mean - afast_mean:9.1f}us ({agraph_mean / afast_mean:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare PyTorch and ONNX Runtime (fp32 and int8) embedding backends on CPU.
+
+Checks that the ONNX vectors match the PyTorch ``HuggingFaceEmbeddings``
+vectors (minimum cosine similarity over the sample) and reports throughput in
+chunks per second. The run fails if a backend falls below its parity floor.
+
+    # python -m benchmarks.onnx_embeddings --chunks 512 --threads 4
+"""
+
+import time
+import argparse
+from typing import Dict, List
+
+import numpy as np
+
+from base.onnx_embeddings import OnnxEmbeddings
+
+PARITY_FLOOR = {"onnx-fp32": 0.999, "onnx-int8": 0.95}
+SAMPLE_SENTENCES = [
+    "A DataFrame is a two-dimensional labeled data structure with columns of potentially different types.",
+    "Gradient descent updates parameters in the direction of the negative gradient of the loss.",
+    "Use pandas.read_csv to load a comma-separated values file into a DataFrame.",
+    "Recursion solves a problem by reducing it to smaller instances of the same problem.",
+    "The learning rate controls how large each optimization step is.",
+    "SQL joins combine rows from two or more tables based on a related column.",
+    "A hash map offers average constant-time lookups by key.",
+    "Overfitting happens when a model memorizes noise in the training data.",
+]
+
+
+def _chunks(count: int) -> List[str]:
+    # Mix short and long chunks, like a text splitter's output over web pages.
+    return [" ".join(SAMPLE_SENTENCES[(i + j) % len(SAMPLE_SENTENCES)] for j in range(1 + i % 8)) for i in range(count)]
+
+
+def _throughput(embedder, texts: List[str]) -> float:
+    embedder.embed_documents(texts[:8])
+    start = time.perf_counter()
+    embedder.embed_documents(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def _min_cosine(reference: np.ndarray, candidate: np.ndarray) -> float:
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    return float(np.min(np.sum(reference * candidate, axis=1)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="sentence-transformers/all-mpnet-base-v2")
+    parser.add_argument("--chunks", type=int, default=256)
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op threads")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--cache-dir", default="data/models/onnx")
+    args = parser.parse_args()
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    texts = _chunks(args.chunks)
+    backends: Dict[str, object] = {
+        "pytorch": HuggingFaceEmbeddings(
+            model_name=args.model, encode_kwargs={"batch_size": args.batch_size, "normalize_embeddings": True}
+        ),
+        "onnx-fp32": OnnxEmbeddings(
+            args.model, cache_dir=args.cache_dir, intra_op_threads=args.threads, batch_size=args.batch_size
+        ),
+        "onnx-int8": OnnxEmbeddings(
+            args.model, cache_dir=args.cache_dir, quantize=True, intra_op_threads=args.threads, batch_size=args.batch_size
+        ),
+    }
+    parity_texts = texts[:64]
+    reference = np.asarray(backends["pytorch"].embed_documents(parity_texts))
+    failures = []
+    print(f"{args.model}, {len(texts)} chunks")
+    for name, embedder in backends.items():
+        rate = _throughput(embedder, texts)
+        if name == "pytorch":
+            print(f"{name:<10} {rate:8.1f} chunks/s")
+            continue
+        cosine = _min_cosine(reference, np.asarray(embedder.embed_documents(parity_texts)))
+        print(f"{name:<10} {rate:8.1f} chunks/s  min cosine vs pytorch={cosine:.5f}")
+        if cosine < PARITY_FLOOR[name]:
+            failures.append(f"{name} parity {cosine:.5f} < {PARITY_FLOOR[name]}")
+    if failures:
+        raise SystemExit("; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
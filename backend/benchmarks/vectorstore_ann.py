@@ -0,0 +1,141 @@
+"""Benchmark the FAISS-backed AnnVectorStore against Chroma on synthetic chunk vectors.
+
+Vectors are clustered random embeddings inserted directly (no embedding
+model), so the timings isolate the stores themselves: bulk insert throughput,
+query latency, recall@k against exact search, and disk usage.
+
+    # python -m benchmarks.vectorstore_ann --sizes 10000 100000 1000000
+    # python -m benchmarks.vectorstore_ann --sizes 10000 --stores faiss-hnsw faiss-ivf
+    # python -m benchmarks.vectorstore_ann --sizes 100000 --stores faiss-hnsw faiss-hnsw-sq8 faiss-ivf-pq
+
+Store labels are ``chroma`` or ``faiss-<hnsw|ivf>[-<fp16|sq8|pq>]``.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from base.ann_vectorstore import AnnVectorStore
+
+INSERT_BATCH = 5000
+
+
+def _clustered_vectors(count: int, dim: int, rng: np.random.Generator, clusters: int = 256) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, size=count)] + 0.5 * rng.normal(size=(count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _exact_top_k(vectors: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_rows = np.zeros((len(queries), k), dtype=np.int64)
+    for start in range(0, len(vectors), 100000):
+        scores = queries @ vectors[start:start + 100000].T
+        rows = np.arange(start, start + scores.shape[1])
+        merged_scores = np.concatenate([best_scores, scores], axis=1)
+        merged_rows = np.concatenate([best_rows, np.broadcast_to(rows, scores.shape)], axis=1)
+        top = np.argsort(-merged_scores, axis=1)[:, :k]
+        best_scores = np.take_along_axis(merged_scores, top, axis=1)
+        best_rows = np.take_along_axis(merged_rows, top, axis=1)
+    return [{f"c{row}" for row in rows} for rows in best_rows]
+
+
+def _directory_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def _bench_faiss(index_type: str, quantization: str, directory: str, vectors: np.ndarray, k: int) -> Dict[str, object]:
+    settings = {"index_type": index_type, "quantization": quantization}
+    store = AnnVectorStore(None, directory, "bench", fold_every=len(vectors) + 1, **settings)
+    start = time.perf_counter()
+    for offset in range(0, len(vectors), INSERT_BATCH):
+        batch = vectors[offset:offset + INSERT_BATCH]
+        store.add_vectors(batch, [""] * len(batch), ids=[f"c{offset + i}" for i in range(len(batch))])
+    store.flush()
+    insert_s = time.perf_counter() - start
+    store.close()
+    # Search from a fresh read-only handle, as a uvicorn worker would.
+    reader = AnnVectorStore(None, directory, "bench", read_only=True, **settings)
+    return {
+        "insert_s": insert_s,
+        "search": lambda query: [doc.id for doc, _ in reader.similarity_search_with_score_by_vector(query, k)],
+        "index_mb": reader.memory_footprint()["index_bytes"] / 2**20,
+    }
+
+
+def _bench_chroma(directory: str, vectors: np.ndarray, k: int) -> Dict[str, object]:
+    import chromadb
+
+    collection = chromadb.PersistentClient(path=directory).get_or_create_collection(
+        "bench", metadata={"hnsw:space": "cosine"}
+    )
+    start = time.perf_counter()
+    for offset in range(0, len(vectors), INSERT_BATCH):
+        batch = vectors[offset:offset + INSERT_BATCH]
+        collection.add(
+            ids=[f"c{offset + i}" for i in range(len(batch))], embeddings=batch.tolist(), documents=[""] * len(batch)
+        )
+    insert_s = time.perf_counter() - start
+    return {
+        "insert_s": insert_s,
+        "search": lambda query: collection.query(query_embeddings=[query.tolist()], n_results=k)["ids"][0],
+    }
+
+
+def _run(label: str, build: Callable[[str], Dict[str, object]], queries: np.ndarray, truth: List[set], k: int, count: int) -> None:
+    directory = tempfile.mkdtemp(prefix=f"bench-{label}-")
+    try:
+        result = build(directory)
+        search = result["search"]
+        search(queries[0])
+        latencies, hits = [], 0
+        for query, expected in zip(queries, truth):
+            start = time.perf_counter()
+            found = search(query)
+            latencies.append((time.perf_counter() - start) * 1000)
+            hits += len(expected.intersection(found))
+        latencies.sort()
+        print(
+            f"{label:<16} n={count:<9} insert={count / result['insert_s']:9.0f} vec/s  "
+            f"p50={statistics.median(latencies):7.2f}ms  p95={latencies[int(len(latencies) * 0.95) - 1]:7.2f}ms  "
+            f"recall@{k}={hits / (k * len(queries)):.3f}  disk={_directory_bytes(directory) / 2**20:8.1f}MB"
+            + (f"  index={result['index_mb']:8.1f}MB" if "index_mb" in result else "")
+        )
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--stores", nargs="+", default=["chroma", "faiss-hnsw", "faiss-ivf", "faiss-hnsw-sq8"])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for count in args.sizes:
+        vectors = _clustered_vectors(count, args.dim, rng)
+        queries = vectors[rng.integers(0, count, size=args.queries)] + 0.1 * rng.normal(size=(args.queries, args.dim))
+        queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(np.float32)
+        truth = _exact_top_k(vectors, queries, args.k)
+        for label in args.stores:
+            if label == "chroma":
+                build = lambda directory: _bench_chroma(directory, vectors, args.k)
+            else:
+                _, index_type, *quantization = label.split("-")
+                build = lambda directory, index_type=index_type, quantization=(quantization or ["none"])[0]: _bench_faiss(
+                    index_type, quantization, directory, vectors, args.k
+                )
+            _run(label, build, queries, truth, args.k, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, Optional
+
+
+@dataclass
+class LLMClientPoolConfig:
+    """Process-wide chat client registry and per-client HTTP connection pool limits."""
+    max_size: int = 16
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
 
 
 @dataclass
@@ -10,24 +19,148 @@ class LLMConfig:
     provider: str = "deepseek"  # e.g., openai, azure-openai, ollama, anthropic, groq
     model_name: str = "deepseek-chat"
     base_url: Optional[str] = None
+    client_pool: LLMClientPoolConfig = field(default_factory=LLMClientPoolConfig)
+
+
+@dataclass
+class LLMCacheConfig:
+    """Content-addressed cache of deterministic (temperature=0) LLM responses."""
+    enabled: bool = True
+    path: Optional[str] = "data/cache/llm_responses.sqlite3"
+    max_memory_entries: int = 512
+    max_disk_entries: Optional[int] = 20000
+    ttl_seconds: Optional[float] = 604800
+
+
+@dataclass
+class EmbeddingCacheConfig:
+    """Persistent cache of embedding vectors keyed by (model, text hash)."""
+    enabled: bool = True
+    path: Optional[str] = "data/cache/embeddings.sqlite3"
+    max_memory_entries: int = 4096
+
+
+@dataclass
+class EmbeddingBatchingConfig:
+    """Cross-request micro-batching of embedding calls."""
+    enabled: bool = True
+    max_batch_size: int = 64
+    max_wait_ms: float = 5.0
+    batch_queries: bool = True
+    server_address: Optional[str] = None
+
+
+@dataclass
+class OnnxEmbeddingConfig:
+    """ONNX Runtime CPU backend for sentence-transformers models."""
+    cache_dir: str = "data/models/onnx"
+    quantize: bool = False
+    intra_op_threads: Optional[int] = None
+    batch_size: int = 32
+    max_length: int = 384
 
 
 @dataclass
 class EmbeddingConfig:
     provider: str = "huggingface"
     model_name: str = "sentence-transformers/all-mpnet-base-v2"
+    onnx: OnnxEmbeddingConfig = field(default_factory=OnnxEmbeddingConfig)
+    cache: EmbeddingCacheConfig = field(default_factory=EmbeddingCacheConfig)
+    batching: EmbeddingBatchingConfig = field(default_factory=EmbeddingBatchingConfig)
+
+
+@dataclass
+class PageFetchConfig:
+    """Concurrent page fetching for web search results."""
+    max_concurrency: int = 10
+    per_host_limit: int = 2
+    timeout: float = 10.0
+    deadline: float = 20.0
+    max_connections: int = 20
+    max_bytes: int = 5242880
+
+
+@dataclass
+class SearchCacheConfig:
+    """Query -> results and URL -> page caches used by SearchRunner."""
+    enabled: bool = True
+    path: Optional[str] = "data/cache/search.sqlite3"
+    query_ttl_seconds: Optional[float] = 86400
+    page_ttl_seconds: Optional[float] = 86400
+    page_max_age_seconds: Optional[float] = 2592000
+    max_memory_entries: int = 256
+    max_disk_entries: Optional[int] = 5000
 
 
 @dataclass
 class SearchConfig:
     provider: str = "duckduckgo"  # tavily, serper, bing, duckduckgo, brave, searx, you
     max_results: int = 5
+    fetch: PageFetchConfig = field(default_factory=PageFetchConfig)
+    cache: SearchCacheConfig = field(default_factory=SearchCacheConfig)
+
+
+@dataclass
+class FaissVectorstoreConfig:
+    """ANN index settings for ``vectorstore.type: faiss``."""
+    index_type: str = "hnsw"  # hnsw | ivf
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    ef_search: int = 64
+    nlist: int = 1024
+    nprobe: int = 16
+    fold_every: int = 10000
+    read_only: bool = False
+    quantization: str = "none"  # none | fp16 | sq8 | pq
+    pq_m: int = 16
+    rescore_factor: int = 4
 
 
 @dataclass
 class VectorstoreConfig:
+    type: str = "chroma"  # chroma | faiss
     persist_directory: str = "data/vectorstore"
     collection_name: str = "genmentor"
+    faiss: FaissVectorstoreConfig = field(default_factory=FaissVectorstoreConfig)
+
+@dataclass
+class HybridRetrievalConfig:
+    """BM25 + dense retrieval fused over a shared chunk id space."""
+    enabled: bool = True
+    path: Optional[str] = "data/vectorstore/lexical_index.sqlite3"
+    fusion: str = "rrf"  # rrf | weighted
+    rrf_k: int = 60
+    dense_weight: float = 0.5
+    fetch_k: int = 20
+
+
+@dataclass
+class MMRConfig:
+    """Maximal-marginal-relevance reranking of retrieved chunks."""
+    enabled: bool = True
+    lambda_mult: float = 0.5
+    fetch_k: int = 20
+
+
+@dataclass
+class WriteBehindConfig:
+    """Background indexing of fetched chunks."""
+    enabled: bool = True
+    max_queue_size: int = 64
+    batch_size: int = 256
+    max_wait_ms: float = 200.0
+
+
+@dataclass
+class LifecycleConfig:
+    """Chunk ledger and eviction policy for the persistent stores."""
+    enabled: bool = True
+    ledger_path: Optional[str] = "data/vectorstore/chunk_ledger.sqlite3"
+    ttl_seconds: Optional[float] = 2592000
+    max_chunks: Optional[int] = 200000
+    compact: bool = True
+    interval_seconds: Optional[float] = None
+
 
 @dataclass
 class RAGConfig:
@@ -35,6 +168,24 @@ class RAGConfig:
     num_retrieval_results: int = 5
     allow_parallel: bool = True
     max_workers: int = 3
+    retrieval_first: bool = False
+    relevance_threshold: float = 0.75
+    background_refresh: bool = False
+    hybrid: HybridRetrievalConfig = field(default_factory=HybridRetrievalConfig)
+    mmr: MMRConfig = field(default_factory=MMRConfig)
+    write_behind: WriteBehindConfig = field(default_factory=WriteBehindConfig)
+    lifecycle: LifecycleConfig = field(default_factory=LifecycleConfig)
+    context_budgets: Dict[str, int] = field(
+        default_factory=lambda: {"default": 2000, "knowledge_drafter": 2000, "tutor": 1500}
+    )
+
+
+@dataclass
+class JobsConfig:
+    """Background job queue for long-running content generation."""
+    db_path: str = "data/jobs/jobs.sqlite3"
+    max_workers: int = 2
+    max_pending: int = 100
 
 
 @dataclass
@@ -44,6 +195,8 @@ class AppConfig:
     log_level: str = "INFO"
 
     llm: LLMConfig = field(default_factory=LLMConfig)
+    llm_cache: LLMCacheConfig = field(default_factory=LLMCacheConfig)
     search: SearchConfig = field(default_factory=SearchConfig)
     vectorstore: VectorstoreConfig = field(default_factory=VectorstoreConfig)
     rag: RAGConfig = field(default_factory=RAGConfig)
+    jobs: JobsConfig = field(default_factory=JobsConfig)
@@ -1,27 +1,51 @@
 import ast
 import json
+import asyncio
 import time
 import uvicorn
 import hydra
+from contextlib import asynccontextmanager
 from omegaconf import DictConfig, OmegaConf
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI, HTTPException, File, UploadFile, Form
-from base.llm_factory import LLMFactory
+from base.llm_factory import LLMFactory, llm_client_pool
+from base.base_agent import configure_llm_response_cache, get_llm_response_cache
 from base.searcher_factory import SearchRunner
-from base.search_rag import SearchRagManager
+from base.resource_registry import get_resource_registry
+from base.embedding_cache import CachedEmbeddings
+from base.job_manager import JobManager, JobQueueFullError, JobStatus
 from utils.preprocess import extract_text_from_pdf
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from modules.skill_gap_identification import *
 from modules.adaptive_learner_modeling import *
 from modules.personalized_resource_delivery import *
-from modules.ai_chatbot_tutor import chat_with_tutor_with_llm
+from modules.ai_chatbot_tutor import achat_with_tutor_with_llm, astream_chat_with_tutor_with_llm
+from utils.sse import format_sse, with_heartbeat
+from utils.single_flight import SingleFlight
 from api_schemas import *
 from config import load_config
 
 app_config = load_config(config_name="main")
-search_rag_manager = SearchRagManager.from_config(app_config)
+resources = get_resource_registry(app_config)
+configure_llm_response_cache(app_config)
+job_manager = JobManager.from_config(app_config)
+single_flight = SingleFlight()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(LLMFactory.warmup, app_config)
+    await asyncio.to_thread(resources.warmup)
+    lifecycle_config = app_config.get("rag", {}).get("lifecycle") or {}
+    if lifecycle_config.get("enabled", False) and lifecycle_config.get("interval_seconds"):
+        resources.vectorstore_maintainer.start(lifecycle_config.get("interval_seconds"))
+    yield
+    job_manager.shutdown(wait=False)
+    await asyncio.to_thread(resources.close)
+    await asyncio.to_thread(llm_client_pool.close)
+
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -35,6 +59,11 @@ def get_llm(model_provider: str | None = None, model_name: str | None = None, **
     model_name = model_name or "deepseek-chat"
     return LLMFactory.create(model=model_name, model_provider=model_provider, **kwargs)
 
+async def deduplicated(name: str, request, fn):
+    """Share one computation between concurrent identical requests to ``name``."""
+    key = SingleFlight.make_key(name, request.model_dump())
+    return await single_flight.do(key, fn)
+
 UPLOAD_LOCATION = "/mnt/datadrive/tfwang/code/llm-mentor/data/cv/"
 
 @app.get("/list-llm-models")
@@ -49,6 +78,44 @@ async def list_llm_models():
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
 
+@app.get("/llm-cache/stats")
+async def llm_cache_stats():
+    cache = get_llm_response_cache()
+    return {
+        "enabled": cache is not None,
+        **(cache.stats() if cache is not None else {}),
+        "single_flight": single_flight.stats(),
+    }
+
+@app.get("/embedding-cache/stats")
+async def embedding_cache_stats():
+    embedder = resources.embedder
+    if not isinstance(embedder, CachedEmbeddings):
+        return {"enabled": False}
+    return {"enabled": True, **embedder.stats()}
+
+@app.get("/embedding-batcher/stats")
+async def embedding_batcher_stats():
+    embedder = resources.embedder
+    if isinstance(embedder, CachedEmbeddings):
+        embedder = embedder.underlying
+    stats = getattr(embedder, "stats", None)
+    if stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **await asyncio.to_thread(stats)}
+
+@app.get("/rag/stats")
+async def rag_stats():
+    manager = resources.search_rag_manager
+    stats = {
+        **manager.retrieval_stats(),
+        "context": manager.context_stats(),
+        "write_behind": manager.write_behind_stats(),
+        "collection": await asyncio.to_thread(manager.collection_stats),
+    }
+    stats["last_maintenance"] = resources.last_maintenance()
+    return stats
+
 @app.post("/chat-with-tutor")
 async def chat_with_autor(request: ChatWithAutorRequest):
     llm = get_llm(request.model_provider, request.model_name)
@@ -58,22 +125,63 @@ async def chat_with_autor(request: ChatWithAutorRequest):
             converted_messages = ast.literal_eval(request.messages)
         else:
             return JSONResponse(status_code=400, content={"detail": "messages must be a JSON array string"})
-        response = chat_with_tutor_with_llm(
+        response = await achat_with_tutor_with_llm(
             llm,
             converted_messages,
             learner_profile,
-            search_rag_manager=search_rag_manager,
+            search_rag_manager=resources.search_rag_manager,
             use_search=True,
         )
         return {"response": response}
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
 
+@app.post("/chat-with-tutor-stream")
+async def chat_with_autor_stream(request: ChatWithAutorRequest):
+    """Stream the tutor reply over Server-Sent Events.
+
+    Emits ``data: {"delta": ...}`` messages as tokens arrive, then a ``done``
+    event carrying the full response, or an ``error`` event on failure.
+    """
+    llm = get_llm(request.model_provider, request.model_name)
+    if not (isinstance(request.messages, str) and request.messages.strip().startswith("[")):
+        return JSONResponse(status_code=400, content={"detail": "messages must be a JSON array string"})
+    try:
+        converted_messages = ast.literal_eval(request.messages)
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"detail": str(e)})
+
+    async def event_stream():
+        response = ""
+        try:
+            async for delta in astream_chat_with_tutor_with_llm(
+                llm,
+                converted_messages,
+                request.learner_profile,
+                search_rag_manager=resources.search_rag_manager,
+                use_search=True,
+            ):
+                response += delta
+                yield format_sse({"delta": delta})
+            yield format_sse({"response": response}, event="done")
+        except Exception as e:
+            yield format_sse({"detail": str(e)}, event="error")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.post("/refine-learning-goal")
 async def refine_learning_goal(request: LearningGoalRefinementRequest):
     llm = get_llm(request.model_provider, request.model_name)
     try:
-        refined_learning_goal = refine_learning_goal_with_llm(llm, request.learning_goal, request.learner_information)
+        refined_learning_goal = await deduplicated(
+            "refine-learning-goal",
+            request,
+            lambda: arefine_learning_goal_with_llm(llm, request.learning_goal, request.learner_information),
+        )
         return refined_learning_goal
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
@@ -89,8 +197,10 @@ async def identify_skill_gap_with_info(request: SkillGapIdentificationRequest):
             skill_requirements = ast.literal_eval(skill_requirements)
         if not isinstance(skill_requirements, dict):
             skill_requirements = None
-        skill_gaps, skill_requirements = identify_skill_gap_with_llm(
-            llm, learning_goal, learner_information, skill_requirements
+        skill_gaps, skill_requirements = await deduplicated(
+            "identify-skill-gap-with-info",
+            request,
+            lambda: aidentify_skill_gap_with_llm(llm, learning_goal, learner_information, skill_requirements),
         )
         results = {**skill_gaps, **skill_requirements}
         return results
@@ -110,11 +220,11 @@ async def identify_skill_gap(goal: str = Form(...), cv: UploadFile = File(...),
         with open(file_location, "wb") as file_object:
             file_object.write(await cv.read())
         # print(file_location)
-        cv_text = extract_text_from_pdf(file_location)  
-        skill_requirements = mapper.map_goal_to_skill({
+        cv_text = await asyncio.to_thread(extract_text_from_pdf, file_location)
+        skill_requirements = await mapper.amap_goal_to_skill({
             "learning_goal": goal
         })
-        skill_gaps = skill_gap_identifier.identify_skill_gap({
+        skill_gaps = await skill_gap_identifier.aidentify_skill_gap({
             "learning_goal": goal,
             "skill_requirements": skill_requirements,
             "learner_information": cv_text
@@ -141,8 +251,10 @@ async def create_learner_profile_with_info(request: LearnerProfileInitialization
                 skill_gaps = ast.literal_eval(skill_gaps)
             except Exception:
                 skill_gaps = {"raw": skill_gaps}
-        learner_profile = initialize_learner_profile_with_llm(
-            llm, learning_goal, learner_information, skill_gaps
+        learner_profile = await deduplicated(
+            "create-learner-profile-with-info",
+            request,
+            lambda: ainitialize_learner_profile_with_llm(llm, learning_goal, learner_information, skill_gaps),
         )
         return {"learner_profile": learner_profile}
     except Exception as e:
@@ -152,7 +264,7 @@ async def create_learner_profile_with_info(request: LearnerProfileInitialization
 async def create_learner_profile(request: LearnerProfileInitializationRequest):
     llm = get_llm(request.model_provider, request.model_name)
     file_location = f"{UPLOAD_LOCATION}{request.cv_path}"
-    learner_information = extract_text_from_pdf(file_location)
+    learner_information = await asyncio.to_thread(extract_text_from_pdf, file_location)
     learning_goal = request.learning_goal
     skill_gaps = request.skill_gaps
     try:
@@ -161,7 +273,7 @@ async def create_learner_profile(request: LearnerProfileInitializationRequest):
                 skill_gaps = ast.literal_eval(skill_gaps)
             except Exception:
                 skill_gaps = {"raw": skill_gaps}
-        learner_profile = initialize_learner_profile_with_llm(
+        learner_profile = await ainitialize_learner_profile_with_llm(
             llm, learning_goal, {"raw": learner_information}, skill_gaps
         )
         return {"learner_profile": learner_profile}
@@ -184,7 +296,7 @@ async def update_learner_profile(request: LearnerProfileUpdateRequest):
                 except Exception:
                     if name != "session_information":
                         locals()[name] = {"raw": val}
-        learner_profile = update_learner_profile_with_llm(
+        learner_profile = await aupdate_learner_profile_with_llm(
             llm,
             locals()["learner_profile"],
             locals()["learner_interactions"],
@@ -205,7 +317,11 @@ async def schedule_learning_path(request: LearningPathSchedulingRequest):
             learner_profile = ast.literal_eval(learner_profile)
         if not isinstance(learner_profile, dict):
             learner_profile = {}
-        learning_path = schedule_learning_path_with_llm(llm, learner_profile, session_count)
+        learning_path = await deduplicated(
+            "schedule-learning-path",
+            request,
+            lambda: aschedule_learning_path_with_llm(llm, learner_profile, session_count),
+        )
         return learning_path
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -229,7 +345,7 @@ async def reschedule_learning_path(request: LearningPathReschedulingRequest):
                 other_feedback = ast.literal_eval(other_feedback)
             except Exception:
                 pass
-        learning_path = reschedule_learning_path_with_llm(
+        learning_path = await areschedule_learning_path_with_llm(
             llm, learning_path, learner_profile, session_count, other_feedback
         )
         return learning_path
@@ -249,7 +365,11 @@ async def explore_knowledge_points(request: KnowledgePointExplorationRequest):
     if isinstance(learning_session, str) and learning_session.strip():
         learning_session = ast.literal_eval(learning_session)
     try:
-        knowledge_points = explore_knowledge_points_with_llm(llm, learner_profile, learning_path, learning_session)
+        knowledge_points = await deduplicated(
+            "explore-knowledge-points",
+            request,
+            lambda: aexplore_knowledge_points_with_llm(llm, learner_profile, learning_path, learning_session),
+        )
         return knowledge_points
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -264,7 +384,10 @@ async def draft_knowledge_point(request: KnowledgePointDraftingRequest):
     knowledge_point = request.knowledge_point
     use_search = request.use_search
     try:
-        knowledge_draft = draft_knowledge_point_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_point, use_search)
+        knowledge_draft = await adraft_knowledge_point_with_llm(
+            llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_point, use_search,
+            search_rag_manager=resources.search_rag_manager,
+        )
         return {"knowledge_draft": knowledge_draft}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -279,7 +402,14 @@ async def draft_knowledge_points(request: KnowledgePointsDraftingRequest):
     use_search = request.use_search
     allow_parallel = request.allow_parallel
     try:
-        knowledge_drafts = draft_knowledge_points_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, allow_parallel, use_search)
+        knowledge_drafts = await deduplicated(
+            "draft-knowledge-points",
+            request,
+            lambda: adraft_knowledge_points_with_llm(
+                llm, learner_profile, learning_path, learning_session, knowledge_points, allow_parallel, use_search,
+                search_rag_manager=resources.search_rag_manager,
+            ),
+        )
         return {"knowledge_drafts": knowledge_drafts}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -294,7 +424,7 @@ async def integrate_learning_document(request: LearningDocumentIntegrationReques
     knowledge_drafts = request.knowledge_drafts
     output_markdown = request.output_markdown
     try:
-        learning_document = integrate_learning_document_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts, output_markdown)
+        learning_document = await aintegrate_learning_document_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts, output_markdown)
         return {"learning_document": learning_document}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -309,7 +439,7 @@ async def generate_document_quizzes(request: KnowledgeQuizGenerationRequest):
     true_false_count = request.true_false_count
     short_answer_count = request.short_answer_count
     try:
-        document_quiz = generate_document_quizzes_with_llm(llm, learner_profile, learning_document, single_choice_count, multiple_choice_count, true_false_count, short_answer_count)
+        document_quiz = await agenerate_document_quizzes_with_llm(llm, learner_profile, learning_document, single_choice_count, multiple_choice_count, true_false_count, short_answer_count)
         return {"document_quiz": document_quiz}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -324,13 +454,147 @@ async def tailor_knowledge_content(request: TailoredContentGenerationRequest):
     allow_parallel = request.allow_parallel
     with_quiz = request.with_quiz
     try:
-        tailored_content = create_learning_content_with_llm(
-            llm, learner_profile, learning_path, learning_session, allow_parallel=allow_parallel, with_quiz=with_quiz, use_search=use_search
+        tailored_content = await deduplicated(
+            "tailor-knowledge-content",
+            request,
+            lambda: acreate_learning_content_with_llm(
+                llm, learner_profile, learning_path, learning_session, allow_parallel=allow_parallel, with_quiz=with_quiz, use_search=use_search,
+                search_rag_manager=resources.search_rag_manager,
+            ),
         )
         return {"tailored_content": tailored_content}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    
+
+@app.post("/tailor-knowledge-content-stream")
+async def tailor_knowledge_content_stream(request: TailoredContentGenerationRequest):
+    """Stream stage-progress events of the content pipeline over Server-Sent Events.
+
+    Event names are ``knowledge_points``, ``knowledge_draft`` (one per point),
+    ``document``, ``quizzes`` and ``done`` (full result), or ``error``.
+    Keep-alive comments are sent while a stage is still running.
+    """
+    llm = get_llm()
+    learning_path = request.learning_path
+    learner_profile = request.learner_profile
+    learning_session = request.learning_session
+    try:
+        if isinstance(learning_session, str) and learning_session.strip():
+            learning_session = ast.literal_eval(learning_session)
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"detail": str(e)})
+
+    async def event_stream():
+        try:
+            async for event in astream_learning_content_with_llm(
+                llm,
+                learner_profile,
+                learning_path,
+                learning_session,
+                allow_parallel=request.allow_parallel,
+                with_quiz=request.with_quiz,
+                use_search=request.use_search,
+                search_rag_manager=resources.search_rag_manager,
+            ):
+                yield format_sse(event["data"], event=event["event"])
+        except Exception as e:
+            yield format_sse({"detail": str(e)}, event="error")
+
+    return StreamingResponse(
+        with_heartbeat(event_stream(), interval=float(app_config.get("server", {}).get("sse_heartbeat_seconds", 15))),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def submit_job(kind: str, request, fn, *args, **kwargs):
+    try:
+        job_id = job_manager.submit(kind, fn, *args, params=request.model_dump(), **kwargs)
+    except JobQueueFullError as e:
+        return JSONResponse(status_code=429, content={"detail": str(e)})
+    return JSONResponse(status_code=202, content={"job_id": job_id, "status": JobStatus.PENDING})
+
+@app.post("/jobs/tailor-knowledge-content")
+async def submit_tailor_knowledge_content_job(request: TailoredContentGenerationRequest):
+    llm = get_llm()
+    learning_session = request.learning_session
+    try:
+        if isinstance(learning_session, str) and learning_session.strip():
+            learning_session = ast.literal_eval(learning_session)
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"detail": str(e)})
+    return submit_job(
+        "tailor-knowledge-content",
+        request,
+        create_learning_content_with_llm,
+        llm,
+        request.learner_profile,
+        request.learning_path,
+        learning_session,
+        allow_parallel=request.allow_parallel,
+        with_quiz=request.with_quiz,
+        use_search=request.use_search,
+        search_rag_manager=resources.search_rag_manager,
+    )
+
+@app.post("/jobs/draft-knowledge-points")
+async def submit_draft_knowledge_points_job(request: KnowledgePointsDraftingRequest):
+    llm = get_llm()
+    return submit_job(
+        "draft-knowledge-points",
+        request,
+        draft_knowledge_points_with_llm,
+        llm,
+        request.learner_profile,
+        request.learning_path,
+        request.learning_session,
+        request.knowledge_points,
+        request.allow_parallel,
+        request.use_search,
+        search_rag_manager=resources.search_rag_manager,
+    )
+
+@app.post("/jobs/schedule-learning-path")
+async def submit_schedule_learning_path_job(request: LearningPathSchedulingRequest):
+    llm = get_llm(request.model_provider, request.model_name)
+    learner_profile = request.learner_profile
+    try:
+        if isinstance(learner_profile, str) and learner_profile.strip():
+            learner_profile = ast.literal_eval(learner_profile)
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"detail": str(e)})
+    if not isinstance(learner_profile, dict):
+        learner_profile = {}
+    return submit_job("schedule-learning-path", request, schedule_learning_path_with_llm, llm, learner_profile, request.session_count)
+
+@app.get("/jobs")
+async def list_jobs(limit: int = 50):
+    return {"jobs": job_manager.list(limit)}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Return the job result; 202 while it is still queued or running, 409 if it failed or was cancelled."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job["status"] == JobStatus.SUCCEEDED:
+        return {**job, "result": job_manager.result(job_id)}
+    status_code = 409 if job["status"] in JobStatus.FINISHED else 202
+    return JSONResponse(status_code=status_code, content=job)
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    status = job_manager.cancel(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return {"job_id": job_id, "status": status}
+
 if __name__ == "__main__":
     server_cfg = app_config.get("server", {})
     host = app_config.get("server", {}).get("host", "127.0.0.1")
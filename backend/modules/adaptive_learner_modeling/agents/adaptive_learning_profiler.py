@@ -47,21 +47,50 @@ class AdaptiveLearnerProfiler(BaseAgent):
             jsonalize_output=True,
         )
 
+    @staticmethod
+    def _validate(raw_output: Any) -> Dict[str, Any]:
+        return LearnerProfile.model_validate(raw_output).model_dump()
+
     def initialize_profile(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Generate an initial learner profile using the provided onboarding information."""
-        task_prompt = adaptive_learner_profiler_task_prompt_initialization
         payload_dict = LearnerProfileInitializationPayload(**input_dict).model_dump()
-        raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-        validated_output = LearnerProfile.model_validate(raw_output)
-        return validated_output.model_dump()
+        raw_output = self.invoke(payload_dict, task_prompt=adaptive_learner_profiler_task_prompt_initialization)
+        return self._validate(raw_output)
 
     def update_profile(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing learner profile with fresh interaction data."""
-        task_prompt = adaptive_learner_profiler_task_prompt_update
         payload_dict = LearnerProfileUpdatePayload(**input_dict).model_dump()
-        raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-        validated_output = LearnerProfile.model_validate(raw_output)
-        return validated_output.model_dump()
+        raw_output = self.invoke(payload_dict, task_prompt=adaptive_learner_profiler_task_prompt_update)
+        return self._validate(raw_output)
+
+    async def ainitialize_profile(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of :meth:`initialize_profile`."""
+        payload_dict = LearnerProfileInitializationPayload(**input_dict).model_dump()
+        raw_output = await self.ainvoke(payload_dict, task_prompt=adaptive_learner_profiler_task_prompt_initialization)
+        return self._validate(raw_output)
+
+    async def aupdate_profile(self, input_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of :meth:`update_profile`."""
+        payload_dict = LearnerProfileUpdatePayload(**input_dict).model_dump()
+        raw_output = await self.ainvoke(payload_dict, task_prompt=adaptive_learner_profiler_task_prompt_update)
+        return self._validate(raw_output)
+
+
+def _initialization_input(learning_goal, learner_information, skill_gaps) -> Dict[str, Any]:
+    return {
+        "learning_goal": learning_goal,
+        "learner_information": learner_information,
+        "skill_gaps": skill_gaps,
+    }
+
+
+def _update_input(learner_profile, learner_interactions, learner_information, session_information) -> Dict[str, Any]:
+    return {
+        "learner_profile": learner_profile,
+        "learner_interactions": learner_interactions,
+        "learner_information": learner_information,
+        "session_information": session_information,
+    }
 
 
 def initialize_learner_profile_with_llm(
@@ -72,13 +101,7 @@ def initialize_learner_profile_with_llm(
 ) -> Dict[str, Any]:
     """Public helper for generating a learner profile with minimal boilerplate."""
     learner_profiler = AdaptiveLearnerProfiler(llm)
-    payload_dict = {
-        "learning_goal": learning_goal,
-        "learner_information": learner_information,
-        "skill_gaps": skill_gaps,
-    }
-    learner_profile = learner_profiler.initialize_profile(payload_dict)
-    return learner_profile
+    return learner_profiler.initialize_profile(_initialization_input(learning_goal, learner_information, skill_gaps))
 
 
 def update_learner_profile_with_llm(
@@ -91,13 +114,35 @@ def update_learner_profile_with_llm(
     """Public helper for updating an existing learner profile via the LLM backend."""
 
     learner_profiler = AdaptiveLearnerProfiler(llm)
-    payload_dict = {
-        "learner_profile": learner_profile,
-        "learner_interactions": learner_interactions,
-        "learner_information": learner_information,
-        "session_information": session_information,
-    }
-    return learner_profiler.update_profile(payload_dict)
+    return learner_profiler.update_profile(
+        _update_input(learner_profile, learner_interactions, learner_information, session_information)
+    )
+
+
+async def ainitialize_learner_profile_with_llm(
+    llm: Any,
+    learning_goal: str,
+    learner_information: Union[str, Mapping[str, Any]],
+    skill_gaps: Union[str, Mapping[str, Any], List[Any]],
+) -> Dict[str, Any]:
+    """Async counterpart of :func:`initialize_learner_profile_with_llm`."""
+    learner_profiler = AdaptiveLearnerProfiler(llm)
+    return await learner_profiler.ainitialize_profile(_initialization_input(learning_goal, learner_information, skill_gaps))
+
+
+async def aupdate_learner_profile_with_llm(
+    llm: Any,
+    learner_profile: Union[str, Mapping[str, Any]],
+    learner_interactions: Union[str, Mapping[str, Any]],
+    learner_information: Union[str, Mapping[str, Any]],
+    session_information: Optional[Union[str, Mapping[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Async counterpart of :func:`update_learner_profile_with_llm`."""
+
+    learner_profiler = AdaptiveLearnerProfiler(llm)
+    return await learner_profiler.aupdate_profile(
+        _update_input(learner_profile, learner_interactions, learner_information, session_information)
+    )
 
 if __name__ == "__main__":
     from base.llm_factory import LLMFactory
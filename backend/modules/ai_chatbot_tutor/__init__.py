@@ -1,7 +1,15 @@
-from .agents.ai_chatbot_tutor import AITutorChatbot, TutorChatPayload, chat_with_tutor_with_llm
+from .agents.ai_chatbot_tutor import (
+    AITutorChatbot,
+    TutorChatPayload,
+    chat_with_tutor_with_llm,
+    achat_with_tutor_with_llm,
+    astream_chat_with_tutor_with_llm,
+)
 
 __all__ = [
     "AITutorChatbot",
     "TutorChatPayload",
     "chat_with_tutor_with_llm",
+    "achat_with_tutor_with_llm",
+    "astream_chat_with_tutor_with_llm",
 ]
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import ast
-from typing import Any, List, Mapping, Optional, Sequence
+from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, field_validator
 
 from base import BaseAgent
-from base.search_rag import SearchRagManager, format_docs
+from base.search_rag import SearchRagManager
 from modules.ai_chatbot_tutor.prompts.ai_chatbot_tutor import (
 	ai_tutor_chatbot_system_prompt,
 	ai_tutor_chatbot_task_prompt,
@@ -74,39 +74,82 @@ class AITutorChatbot(BaseAgent):
 	name: str = "AITutorChatbot"
 
 	def __init__(self, model: Any, *, search_rag_manager: Optional[SearchRagManager] = None):
-		super().__init__(model=model, system_prompt=ai_tutor_chatbot_system_prompt, jsonalize_output=False)
+		# Conversational replies depend on live search context and rarely repeat, so skip the response cache.
+		super().__init__(model=model, system_prompt=ai_tutor_chatbot_system_prompt, jsonalize_output=False, use_cache=False)
 		self.search_rag_manager = search_rag_manager
 
-	def chat(self, payload: TutorChatPayload | Mapping[str, Any] | str):
-		if not isinstance(payload, TutorChatPayload):
-			payload = TutorChatPayload.model_validate(payload)
-
-		data = payload.model_dump()
-		messages = data.get("messages")
-		history_text = _stringify_history(messages)
-		query = _last_user_query(messages)
+	def _format_context(self, docs: Optional[List[Any]]) -> str:
+		if not docs:
+			return ""
+		return self.search_rag_manager.format_context(docs, agent="tutor")
 
+	@staticmethod
+	def _build_input_vars(data: Mapping[str, Any], context: str = "") -> dict:
 		external_context = data.get("external_resources") or ""
-		if self.search_rag_manager is not None and query:
-			try:
-				if data.get("use_search", True):
-					docs = self.search_rag_manager.invoke(query)
-				else:
-					# Vectorstore-only retrieval
-					docs = self.search_rag_manager.retrieve(query, k=max(1, int(data.get("top_k", 5))))
-				context = format_docs(docs)
-				if context:
-					external_context = f"{external_context}\n{context}" if external_context else context
-			except Exception:
-				pass
-
-		input_vars = {
+		if context:
+			external_context = f"{external_context}\n{context}" if external_context else context
+		return {
 			"learner_profile": data.get("learner_profile", ""),
-			"messages": history_text,
+			"messages": _stringify_history(data.get("messages")),
 			"external_resources": external_context,
 		}
-		raw_reply = self.invoke(input_vars, task_prompt=ai_tutor_chatbot_task_prompt)
-		return raw_reply
+
+	@staticmethod
+	def _chat_request(payload: TutorChatPayload | Mapping[str, Any] | str) -> Tuple[dict, str]:
+		"""Validate ``payload`` and return its data and the query used for retrieval."""
+		if not isinstance(payload, TutorChatPayload):
+			payload = TutorChatPayload.model_validate(payload)
+		data = payload.model_dump()
+		return data, _last_user_query(data.get("messages"))
+
+	def _retrieve(self, data: Mapping[str, Any], query: str) -> Optional[List[Any]]:
+		if self.search_rag_manager is None or not query:
+			return None
+		try:
+			if data.get("use_search", True):
+				return self.search_rag_manager.invoke(query)
+			# Vectorstore-only retrieval
+			return self.search_rag_manager.retrieve(query, k=max(1, int(data.get("top_k", 5))))
+		except Exception:
+			return None
+
+	async def _aretrieve(self, data: Mapping[str, Any], query: str) -> Optional[List[Any]]:
+		if self.search_rag_manager is None or not query:
+			return None
+		try:
+			if data.get("use_search", True):
+				return await self.search_rag_manager.ainvoke(query)
+			return await self.search_rag_manager.aretrieve(query, k=max(1, int(data.get("top_k", 5))))
+		except Exception:
+			return None
+
+	def chat(self, payload: TutorChatPayload | Mapping[str, Any] | str):
+		data, query = self._chat_request(payload)
+		input_vars = self._build_input_vars(data, self._format_context(self._retrieve(data, query)))
+		return self.invoke(input_vars, task_prompt=ai_tutor_chatbot_task_prompt)
+
+	async def _aprepare_input_vars(self, payload: TutorChatPayload | Mapping[str, Any] | str) -> dict:
+		data, query = self._chat_request(payload)
+		return self._build_input_vars(data, self._format_context(await self._aretrieve(data, query)))
+
+	async def achat(self, payload: TutorChatPayload | Mapping[str, Any] | str):
+		input_vars = await self._aprepare_input_vars(payload)
+		return await self.ainvoke(input_vars, task_prompt=ai_tutor_chatbot_task_prompt)
+
+	async def astream_chat(self, payload: TutorChatPayload | Mapping[str, Any] | str) -> AsyncIterator[str]:
+		"""Stream the tutor reply as text deltas once retrieval has finished."""
+		input_vars = await self._aprepare_input_vars(payload)
+		async for delta in self.astream(input_vars, task_prompt=ai_tutor_chatbot_task_prompt):
+			yield delta
+
+
+def _chat_payload(messages: Any, learner_profile: Any, use_search: bool, top_k: int) -> dict:
+	return {
+		"learner_profile": learner_profile,
+		"messages": messages,
+		"use_search": use_search,
+		"top_k": top_k,
+	}
 
 
 def chat_with_tutor_with_llm(
@@ -125,10 +168,33 @@ def chat_with_tutor_with_llm(
 	- If not provided, replies without external context.
 	"""
 	agent = AITutorChatbot(llm, search_rag_manager=search_rag_manager)
-	payload = {
-		"learner_profile": learner_profile,
-		"messages": messages,
-		"use_search": use_search,
-		"top_k": top_k,
-	}
-	return agent.chat(payload)
+	return agent.chat(_chat_payload(messages, learner_profile, use_search, top_k))
+
+
+async def achat_with_tutor_with_llm(
+	llm: Any,
+	messages: Optional[Sequence[Mapping[str, Any]]] | str = None,
+	learner_profile: Any = "",
+	*,
+	search_rag_manager: Optional[SearchRagManager] = None,
+	use_search: bool = True,
+	top_k: int = 5,
+):
+	"""Async counterpart of :func:`chat_with_tutor_with_llm`."""
+	agent = AITutorChatbot(llm, search_rag_manager=search_rag_manager)
+	return await agent.achat(_chat_payload(messages, learner_profile, use_search, top_k))
+
+
+async def astream_chat_with_tutor_with_llm(
+	llm: Any,
+	messages: Optional[Sequence[Mapping[str, Any]]] | str = None,
+	learner_profile: Any = "",
+	*,
+	search_rag_manager: Optional[SearchRagManager] = None,
+	use_search: bool = True,
+	top_k: int = 5,
+) -> AsyncIterator[str]:
+	"""Streaming counterpart of :func:`achat_with_tutor_with_llm` yielding text deltas."""
+	agent = AITutorChatbot(llm, search_rag_manager=search_rag_manager)
+	async for delta in agent.astream_chat(_chat_payload(messages, learner_profile, use_search, top_k)):
+		yield delta
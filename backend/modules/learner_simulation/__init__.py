@@ -1,9 +1,11 @@
-from .grounding_profile_creator import GroundTruthProfileCreator, create_ground_truth_profile_with_llm
-from .learner_behavior_simulator import LearnerInteractionSimulator, simulate_learner_interactions_with_llm
+from .grounding_profile_creator import GroundTruthProfileCreator, create_ground_truth_profile_with_llm, acreate_ground_truth_profile_with_llm
+from .learner_behavior_simulator import LearnerInteractionSimulator, simulate_learner_interactions_with_llm, asimulate_learner_interactions_with_llm
 
 __all__ = [
     "GroundTruthProfileCreator",
     "LearnerInteractionSimulator",
     "create_ground_truth_profile_with_llm",
     "simulate_learner_interactions_with_llm",
+    "acreate_ground_truth_profile_with_llm",
+    "asimulate_learner_interactions_with_llm",
 ]
\ No newline at end of file
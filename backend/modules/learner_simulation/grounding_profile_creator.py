@@ -71,12 +71,13 @@ class GroundTruthProfileCreator(BaseAgent):
             jsonalize_output=True,
         )
 
+    @staticmethod
+    def _validate(raw_output: Any) -> Dict[str, Any]:
+        return parse_ground_truth_profile_result(raw_output).model_dump()
+
     def create_profile(self, input_dict: Mapping[str, Any]) -> Dict[str, Any]:
         payload = GroundTruthProfileCreatePayload(**input_dict).model_dump()
-        task_prompt = ground_truth_profile_creator_task_prompt
-        raw_output = self.invoke(payload, task_prompt=task_prompt)
-        validated = parse_ground_truth_profile_result(raw_output)
-        return validated.model_dump()
+        return self._validate(self.invoke(payload, task_prompt=ground_truth_profile_creator_task_prompt))
 
     def progress_profile(self, input_dict: Mapping[str, Any]) -> Dict[str, Any]:
         """
@@ -88,10 +89,24 @@ class GroundTruthProfileCreator(BaseAgent):
                 - session_information (dict): Information about the current session.
         """
         payload = GroundTruthProfileProgressPayload(**input_dict).model_dump()
-        task_prompt = ground_truth_profile_creator_task_prompt_progress
-        raw_output = self.invoke(payload, task_prompt=task_prompt)
-        validated = parse_ground_truth_profile_result(raw_output)
-        return validated.model_dump()
+        return self._validate(self.invoke(payload, task_prompt=ground_truth_profile_creator_task_prompt_progress))
+
+    async def acreate_profile(self, input_dict: Mapping[str, Any]) -> Dict[str, Any]:
+        payload = GroundTruthProfileCreatePayload(**input_dict).model_dump()
+        return self._validate(await self.ainvoke(payload, task_prompt=ground_truth_profile_creator_task_prompt))
+
+    async def aprogress_profile(self, input_dict: Mapping[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of :meth:`progress_profile`."""
+        payload = GroundTruthProfileProgressPayload(**input_dict).model_dump()
+        return self._validate(await self.ainvoke(payload, task_prompt=ground_truth_profile_creator_task_prompt_progress))
+
+def _profile_input(learning_goal, learner_information, skill_requirements) -> Dict[str, Any]:
+    return {
+        "learning_goal": learning_goal,
+        "learner_information": learner_information,
+        "skill_requirements": skill_requirements,
+    }
+
 
 def create_ground_truth_profile_with_llm(
     llm: Any,
@@ -100,10 +115,14 @@ def create_ground_truth_profile_with_llm(
     skill_requirements: Optional[Union[str, Mapping[str, Any]]] = None,
 ) -> Dict[str, Any]:
     creator = GroundTruthProfileCreator(llm)
-    return creator.create_profile(
-        {
-            "learning_goal": learning_goal,
-            "learner_information": learner_information,
-            "skill_requirements": skill_requirements,
-        }
-    )
+    return creator.create_profile(_profile_input(learning_goal, learner_information, skill_requirements))
+
+
+async def acreate_ground_truth_profile_with_llm(
+    llm: Any,
+    learning_goal: str,
+    learner_information: Union[str, Mapping[str, Any]] = "",
+    skill_requirements: Optional[Union[str, Mapping[str, Any]]] = None,
+) -> Dict[str, Any]:
+    creator = GroundTruthProfileCreator(llm)
+    return await creator.acreate_profile(_profile_input(learning_goal, learner_information, skill_requirements))
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
 import ast
 import json
-import os
-from typing import Any, Dict, Mapping, Union
+import uuid
+import asyncio
+import logging
+from typing import Any, Dict, Mapping, Optional, Union
 
 from base import BaseAgent
 from .schemas import parse_learner_behavior_log
@@ -13,6 +16,10 @@ from .prompts import (
 )
 from pydantic import BaseModel, Field, field_validator
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BEHAVIOR_LOGS_PATH = os.path.join("data", "output", "behavior_logs.json")
+
 
 class LearnerInteractionPayload(BaseModel):
     """Payload for simulating learner interactions for a given session."""
@@ -58,36 +65,70 @@ class LearnerInteractionSimulator(BaseAgent):
                 - session_information (dict): Information about the current session.
         """
         payload = LearnerInteractionPayload(**input_dict).model_dump()
-        task_prompt = learner_interaction_simulator_task_prompt
-        raw_output = self.invoke(payload, task_prompt=task_prompt)
-        validated = parse_learner_behavior_log(raw_output)
-        return validated.model_dump()
+        raw_output = self.invoke(payload, task_prompt=learner_interaction_simulator_task_prompt)
+        return parse_learner_behavior_log(raw_output).model_dump()
+
+    async def asimulate_interactions(self, input_dict: Mapping[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of :meth:`simulate_interactions`."""
+        payload = LearnerInteractionPayload(**input_dict).model_dump()
+        raw_output = await self.ainvoke(payload, task_prompt=learner_interaction_simulator_task_prompt)
+        return parse_learner_behavior_log(raw_output).model_dump()
+
+
+def _session_input(ground_truth_profile: Union[str, Mapping[str, Any]], session_number: int) -> Dict[str, Any]:
+    return {"ground_truth_profile": ground_truth_profile, "session_number": session_number}
+
+
+def _save_behavior_logs(behavior_logs: list[Dict[str, Any]], output_path: Optional[str] = None) -> str:
+    """Write the logs to ``output_path`` (default ``data/output/behavior_logs.json``) and return the path.
+
+    The file is replaced atomically, so concurrent runs never leave a partly
+    written file; pass distinct paths to keep each run's logs.
+    """
+    out_path = output_path or DEFAULT_BEHAVIOR_LOGS_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = f"{out_path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(behavior_logs, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, out_path)
+    return out_path
 
 
 def simulate_learner_interactions_with_llm(
     llm: Any,
     ground_truth_profile: Union[str, Mapping[str, Any]],
     session_count: int = 5,
+    output_path: Optional[str] = None,
 ) -> list[Dict[str, Any]]:
     """Simulate interactions for multiple sessions and persist logs."""
 
-    print("==== Step 2: Simulate Learner Interactions ====")
+    logger.info("==== Step 2: Simulate Learner Interactions ====")
     learner_behavior_simulator = LearnerInteractionSimulator(llm)
     behavior_logs: list[Dict[str, Any]] = []
 
     for session in range(1, session_count + 1):
-        behavior_log = learner_behavior_simulator.simulate_interactions(
-            {
-                "ground_truth_profile": ground_truth_profile,
-                "session_number": session,
-            }
-        )
+        behavior_log = learner_behavior_simulator.simulate_interactions(_session_input(ground_truth_profile, session))
         behavior_logs.append(behavior_log)
 
-    # Save logs to data/output/behavior_logs.json
-    out_dir = os.path.join("data", "output")
-    os.makedirs(out_dir, exist_ok=True)
-    out_path = os.path.join(out_dir, "behavior_logs.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(behavior_logs, f, ensure_ascii=False, indent=2)
+    _save_behavior_logs(behavior_logs, output_path)
+    return behavior_logs
+
+
+async def asimulate_learner_interactions_with_llm(
+    llm: Any,
+    ground_truth_profile: Union[str, Mapping[str, Any]],
+    session_count: int = 5,
+    output_path: Optional[str] = None,
+) -> list[Dict[str, Any]]:
+    """Async counterpart of :func:`simulate_learner_interactions_with_llm`."""
+
+    logger.info("==== Step 2: Simulate Learner Interactions ====")
+    learner_behavior_simulator = LearnerInteractionSimulator(llm)
+    behavior_logs: list[Dict[str, Any]] = []
+
+    for session in range(1, session_count + 1):
+        behavior_log = await learner_behavior_simulator.asimulate_interactions(_session_input(ground_truth_profile, session))
+        behavior_logs.append(behavior_log)
+
+    await asyncio.to_thread(_save_behavior_logs, behavior_logs, output_path)
     return behavior_logs
@@ -23,23 +23,41 @@ class GoalOrientedKnowledgeExplorer(BaseAgent):
     def __init__(self, model: Any):
         super().__init__(model=model, system_prompt=goal_oriented_knowledge_explorer_system_prompt, jsonalize_output=True)
 
-    def explore(self, payload: KnowledgeExplorePayload | Mapping[str, Any] | str | dict):
+    @staticmethod
+    def _payload(payload: KnowledgeExplorePayload | Mapping[str, Any] | str | dict) -> dict:
         if not isinstance(payload, KnowledgeExplorePayload):
             payload = KnowledgeExplorePayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=goal_oriented_knowledge_explorer_task_prompt)
-        validated_output = KnowledgePoints.model_validate(raw_output)
-        return validated_output.model_dump()
+        return payload.model_dump()
 
+    @staticmethod
+    def _validate(raw_output: Any) -> dict:
+        return KnowledgePoints.model_validate(raw_output).model_dump()
 
-def explore_knowledge_points_with_llm(llm, learner_profile, learning_path, learning_session):
-    """Convenience wrapper to explore knowledge points for a session using the agent.
+    def explore(self, payload: KnowledgeExplorePayload | Mapping[str, Any] | str | dict):
+        return self._validate(self.invoke(self._payload(payload), task_prompt=goal_oriented_knowledge_explorer_task_prompt))
 
-    Mirrors the selected helper signature and behavior.
-    """
-    input_dict = {
+    async def aexplore(self, payload: KnowledgeExplorePayload | Mapping[str, Any] | str | dict):
+        return self._validate(await self.ainvoke(self._payload(payload), task_prompt=goal_oriented_knowledge_explorer_task_prompt))
+
+
+def _explore_input(learner_profile, learning_path, learning_session) -> dict:
+    return {
         "learner_profile": learner_profile,
         "learning_path": learning_path,
         "learning_session": learning_session,
     }
+
+
+def explore_knowledge_points_with_llm(llm, learner_profile, learning_path, learning_session):
+    """Convenience wrapper to explore knowledge points for a session using the agent.
+
+    Mirrors the selected helper signature and behavior.
+    """
+    explorer = GoalOrientedKnowledgeExplorer(llm)
+    return explorer.explore(_explore_input(learner_profile, learning_path, learning_session))
+
+
+async def aexplore_knowledge_points_with_llm(llm, learner_profile, learning_path, learning_session):
+    """Async counterpart of :func:`explore_knowledge_points_with_llm`."""
     explorer = GoalOrientedKnowledgeExplorer(llm)
-    return explorer.explore(input_dict)
+    return await explorer.aexplore(_explore_input(learner_profile, learning_path, learning_session))
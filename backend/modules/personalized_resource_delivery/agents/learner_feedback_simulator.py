@@ -42,18 +42,34 @@ class LearnerFeedbackSimulator(BaseAgent):
         super().__init__(model=model, jsonalize_output=True)
         self.system_prompt = learner_feedback_simulator_system_prompt
 
-    def feedback_path(self, payload: LearningPathFeedbackPayload | Mapping[str, Any] | str):
-        task_prompt = learner_feedback_simulator_task_prompt_path
+    @staticmethod
+    def _path_payload(payload: LearningPathFeedbackPayload | Mapping[str, Any] | str) -> dict:
         if not isinstance(payload, LearningPathFeedbackPayload):
             payload = LearningPathFeedbackPayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=task_prompt)
-        validated_output = LearnerFeedback.model_validate(raw_output)
-        return validated_output.model_dump()
+        return payload.model_dump()
 
-    def feedback_content(self, payload: LearningContentFeedbackPayload | Mapping[str, Any] | str):
-        task_prompt = learner_feedback_simulator_task_prompt_content
+    @staticmethod
+    def _content_payload(payload: LearningContentFeedbackPayload | Mapping[str, Any] | str) -> dict:
         if not isinstance(payload, LearningContentFeedbackPayload):
             payload = LearningContentFeedbackPayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=task_prompt)
-        validated_output = LearnerFeedback.model_validate(raw_output)
-        return validated_output.model_dump()
\ No newline at end of file
+        return payload.model_dump()
+
+    @staticmethod
+    def _validate(raw_output: Any) -> dict:
+        return LearnerFeedback.model_validate(raw_output).model_dump()
+
+    def feedback_path(self, payload: LearningPathFeedbackPayload | Mapping[str, Any] | str):
+        raw_output = self.invoke(self._path_payload(payload), task_prompt=learner_feedback_simulator_task_prompt_path)
+        return self._validate(raw_output)
+
+    def feedback_content(self, payload: LearningContentFeedbackPayload | Mapping[str, Any] | str):
+        raw_output = self.invoke(self._content_payload(payload), task_prompt=learner_feedback_simulator_task_prompt_content)
+        return self._validate(raw_output)
+
+    async def afeedback_path(self, payload: LearningPathFeedbackPayload | Mapping[str, Any] | str):
+        raw_output = await self.ainvoke(self._path_payload(payload), task_prompt=learner_feedback_simulator_task_prompt_path)
+        return self._validate(raw_output)
+
+    async def afeedback_content(self, payload: LearningContentFeedbackPayload | Mapping[str, Any] | str):
+        raw_output = await self.ainvoke(self._content_payload(payload), task_prompt=learner_feedback_simulator_task_prompt_content)
+        return self._validate(raw_output)
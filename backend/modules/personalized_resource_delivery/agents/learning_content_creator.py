@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 from base import BaseAgent
 from base.search_rag import SearchRagManager, format_docs
+from base.resource_registry import get_search_rag_manager
 from modules.personalized_resource_delivery.prompts.learning_content_creator import (
     learning_content_creator_system_prompt,
     learning_content_creator_task_prompt_content,
@@ -15,6 +17,22 @@ from modules.personalized_resource_delivery.prompts.learning_content_creator imp
 from modules.personalized_resource_delivery.schemas import ContentOutline, KnowledgeDraft, LearningContent
 
 
+# Quiz mix attached to genmentor documents.
+DOCUMENT_QUIZ_COUNTS = {
+    "single_choice_count": 3,
+    "multiple_choice_count": 0,
+    "true_false_count": 0,
+    "short_answer_count": 0,
+}
+
+
+def _as_knowledge_point_list(knowledge_points: Any) -> Any:
+    """Unwrap the explorer's ``{"knowledge_points": [...]}`` output into the list the drafters iterate."""
+    if isinstance(knowledge_points, Mapping) and "knowledge_points" in knowledge_points:
+        return knowledge_points["knowledge_points"]
+    return knowledge_points
+
+
 class ContentBasePayload(BaseModel):
     learner_profile: Any
     learning_path: Any
@@ -29,40 +47,70 @@ class ContentDraftPayload(ContentBasePayload):
 class LearningContentCreator(BaseAgent):
     name: str = "LearningContentCreator"
 
+    # task -> (payload model, task prompt, output schema)
+    _TASKS = {
+        "outline": (ContentBasePayload, learning_content_creator_task_prompt_outline, ContentOutline),
+        "draft": (ContentDraftPayload, learning_content_creator_task_prompt_draft, KnowledgeDraft),
+        "content": (ContentBasePayload, learning_content_creator_task_prompt_content, LearningContent),
+    }
+
     def __init__(self, model: Any, *, search_rag_manager: Optional[SearchRagManager] = None):
         super().__init__(model=model, system_prompt=learning_content_creator_system_prompt, jsonalize_output=True)
         self.search_rag_manager = search_rag_manager
 
+    def _request(self, task: str, payload: BaseModel | Mapping[str, Any] | str):
+        payload_model, task_prompt, _ = self._TASKS[task]
+        if not isinstance(payload, payload_model):
+            payload = payload_model.model_validate(payload)
+        return payload.model_dump(), task_prompt
+
+    def _validate(self, task: str, raw_output: Any):
+        return self._TASKS[task][2].model_validate(raw_output).model_dump()
+
+    def _run(self, task: str, payload):
+        data, task_prompt = self._request(task, payload)
+        return self._validate(task, self.invoke(data, task_prompt=task_prompt))
+
+    async def _arun(self, task: str, payload):
+        data, task_prompt = self._request(task, payload)
+        return self._validate(task, await self.ainvoke(data, task_prompt=task_prompt))
+
     def prepare_outline(self, payload: ContentBasePayload | Mapping[str, Any] | str):
-        if not isinstance(payload, ContentBasePayload):
-            payload = ContentBasePayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=learning_content_creator_task_prompt_outline)
-        validated_output = ContentOutline.model_validate(raw_output)
-        return validated_output.model_dump()
+        return self._run("outline", payload)
 
     def draft_section(self, payload: ContentDraftPayload | Mapping[str, Any] | str):
-        if not isinstance(payload, ContentDraftPayload):
-            payload = ContentDraftPayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=learning_content_creator_task_prompt_draft)
-        validated_output = KnowledgeDraft.model_validate(raw_output)
-        return validated_output.model_dump()
+        return self._run("draft", payload)
 
     def create_content(self, payload: ContentBasePayload | Mapping[str, Any] | str):
-        if not isinstance(payload, ContentBasePayload):
-            payload = ContentBasePayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=learning_content_creator_task_prompt_content)
-        validated_output = LearningContent.model_validate(raw_output)
-        return validated_output.model_dump()
+        return self._run("content", payload)
 
+    async def aprepare_outline(self, payload: ContentBasePayload | Mapping[str, Any] | str):
+        return await self._arun("outline", payload)
 
-def prepare_content_outline_with_llm(llm, learner_profile, learning_path, learning_session, *, search_rag_manager: Optional[SearchRagManager] = None):
-    creator = LearningContentCreator(llm, search_rag_manager=search_rag_manager)
-    payload = {
+    async def adraft_section(self, payload: ContentDraftPayload | Mapping[str, Any] | str):
+        return await self._arun("draft", payload)
+
+    async def acreate_content(self, payload: ContentBasePayload | Mapping[str, Any] | str):
+        return await self._arun("content", payload)
+
+
+def _session_input(learner_profile, learning_path, learning_session, **extra) -> dict:
+    return {
         "learner_profile": learner_profile,
         "learning_path": learning_path,
         "learning_session": learning_session,
+        **extra,
     }
-    return creator.prepare_outline(payload)
+
+
+def prepare_content_outline_with_llm(llm, learner_profile, learning_path, learning_session, *, search_rag_manager: Optional[SearchRagManager] = None):
+    creator = LearningContentCreator(llm, search_rag_manager=search_rag_manager)
+    return creator.prepare_outline(_session_input(learner_profile, learning_path, learning_session))
+
+
+async def aprepare_content_outline_with_llm(llm, learner_profile, learning_path, learning_session, *, search_rag_manager: Optional[SearchRagManager] = None):
+    creator = LearningContentCreator(llm, search_rag_manager=search_rag_manager)
+    return await creator.aprepare_outline(_session_input(learner_profile, learning_path, learning_session))
 
 
 def create_learning_content_with_llm(
@@ -86,9 +134,9 @@ def create_learning_content_with_llm(
     from .document_quiz_generator import generate_document_quizzes_with_llm
 
     if method_name == "genmentor":
-        knowledge_points = explore_knowledge_points_with_llm(
+        knowledge_points = _as_knowledge_point_list(explore_knowledge_points_with_llm(
             llm, learner_profile, learning_path, learning_session
-        )
+        ))
         knowledge_drafts = draft_knowledge_points_with_llm(
             llm,
             learner_profile,
@@ -110,34 +158,161 @@ def create_learning_content_with_llm(
             output_markdown=output_markdown,
         )
         learning_content = {"document": learning_document}
-        if not with_quiz:
-            return learning_content
-        document_quiz = generate_document_quizzes_with_llm(
+        if with_quiz:
+            learning_content["quizzes"] = generate_document_quizzes_with_llm(
+                llm, learner_profile, learning_document, **DOCUMENT_QUIZ_COUNTS
+            )
+        return learning_content
+    else:
+        creator = LearningContentCreator(llm, search_rag_manager=search_rag_manager)
+        if document_outline is None:
+            document_outline = prepare_content_outline_with_llm(
+                llm,
+                learner_profile,
+                learning_path,
+                learning_session,
+                search_rag_manager=search_rag_manager,
+            )
+        return creator.create_content(
+            _session_input(learner_profile, learning_path, learning_session, external_resources="")
+        )
+
+
+async def acreate_learning_content_with_llm(
+    llm,
+    learner_profile,
+    learning_path,
+    learning_session,
+    document_outline=None,
+    allow_parallel=True,
+    with_quiz=True,
+    max_workers=3,
+    use_search=True,
+    output_markdown=True,
+    method_name="genmentor",
+    *,
+    search_rag_manager: Optional[SearchRagManager] = None,
+):
+    """Async counterpart of :func:`create_learning_content_with_llm`.
+
+    The genmentor path drains :func:`astream_learning_content_with_llm` and
+    returns the payload of its ``done`` event.
+    """
+    if method_name == "genmentor":
+        learning_content = None
+        async for event in astream_learning_content_with_llm(
             llm,
             learner_profile,
-            learning_document,
-            single_choice_count=3,
-            multiple_choice_count=0,
-            true_false_count=0,
-            short_answer_count=0,
-        )
-        learning_content["quizzes"] = document_quiz
+            learning_path,
+            learning_session,
+            allow_parallel=allow_parallel,
+            with_quiz=with_quiz,
+            max_workers=max_workers,
+            use_search=use_search,
+            output_markdown=output_markdown,
+            search_rag_manager=search_rag_manager,
+        ):
+            if event["event"] == "done":
+                learning_content = event["data"]["tailored_content"]
         return learning_content
     else:
         creator = LearningContentCreator(llm, search_rag_manager=search_rag_manager)
         if document_outline is None:
-            document_outline = prepare_content_outline_with_llm(
+            document_outline = await aprepare_content_outline_with_llm(
                 llm,
                 learner_profile,
                 learning_path,
                 learning_session,
                 search_rag_manager=search_rag_manager,
             )
-        outline = document_outline if isinstance(document_outline, dict) else document_outline
-        payload = {
-            "learner_profile": learner_profile,
-            "learning_path": learning_path,
-            "learning_session": learning_session,
-            "external_resources": "",
-        }
-        return creator.create_content(payload)
+        return await creator.acreate_content(
+            _session_input(learner_profile, learning_path, learning_session, external_resources="")
+        )
+
+
+async def astream_learning_content_with_llm(
+    llm,
+    learner_profile,
+    learning_path,
+    learning_session,
+    allow_parallel=True,
+    with_quiz=True,
+    max_workers=3,
+    use_search=True,
+    output_markdown=True,
+    *,
+    search_rag_manager: Optional[SearchRagManager] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run the genmentor content pipeline and yield a progress event after each stage.
+
+    Events are ``{"event": name, "data": {...}}`` dicts, in order:
+    ``knowledge_points``, one ``knowledge_draft`` per point as it completes
+    (in completion order, tagged with its ``index``), ``document``,
+    ``quizzes`` (when ``with_quiz``) and finally ``done`` with the same
+    payload :func:`create_learning_content_with_llm` returns.
+    """
+    from .goal_oriented_knowledge_explorer import aexplore_knowledge_points_with_llm
+    from .search_enhanced_knowledge_drafter import adraft_knowledge_point_with_llm, build_knowledge_point_queries
+    from .learning_document_integrator import aintegrate_learning_document_with_llm
+    from .document_quiz_generator import agenerate_document_quizzes_with_llm
+
+    knowledge_points = _as_knowledge_point_list(await aexplore_knowledge_points_with_llm(
+        llm, learner_profile, learning_path, learning_session
+    ))
+    yield {"event": "knowledge_points", "data": {"knowledge_points": knowledge_points}}
+
+    if search_rag_manager is None and use_search:
+        search_rag_manager = await asyncio.to_thread(get_search_rag_manager)
+    if use_search:
+        await search_rag_manager.aindex_queries(build_knowledge_point_queries(learning_session, knowledge_points))
+    semaphore = asyncio.Semaphore(max(1, max_workers) if allow_parallel else 1)
+
+    async def draft_one(index: int, knowledge_point: Any):
+        async with semaphore:
+            draft = await adraft_knowledge_point_with_llm(
+                llm,
+                learner_profile,
+                learning_path,
+                learning_session,
+                knowledge_points,
+                knowledge_point,
+                use_search=use_search,
+                search_rag_manager=search_rag_manager,
+                retrieve_only=True,
+            )
+        return index, draft
+
+    knowledge_drafts: List[Any] = [None] * len(knowledge_points)
+    tasks = [asyncio.create_task(draft_one(i, kp)) for i, kp in enumerate(knowledge_points)]
+    try:
+        for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+            index, draft = await next_done
+            knowledge_drafts[index] = draft
+            yield {
+                "event": "knowledge_draft",
+                "data": {"index": index, "knowledge_draft": draft, "completed": completed, "total": len(tasks)},
+            }
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    learning_document = await aintegrate_learning_document_with_llm(
+        llm,
+        learner_profile,
+        learning_path,
+        learning_session,
+        knowledge_points,
+        knowledge_drafts,
+        output_markdown=output_markdown,
+    )
+    learning_content = {"document": learning_document}
+    yield {"event": "document", "data": {"document": learning_document}}
+
+    if with_quiz:
+        document_quiz = await agenerate_document_quizzes_with_llm(
+            llm, learner_profile, learning_document, **DOCUMENT_QUIZ_COUNTS
+        )
+        learning_content["quizzes"] = document_quiz
+        yield {"event": "quizzes", "data": {"quizzes": document_quiz}}
+
+    yield {"event": "done", "data": {"tailored_content": learning_content}}
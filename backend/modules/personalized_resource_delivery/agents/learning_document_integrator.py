@@ -37,31 +37,53 @@ class LearningDocumentIntegrator(BaseAgent):
     def __init__(self, model: Any):
         super().__init__(model=model, system_prompt=integrated_document_generator_system_prompt, jsonalize_output=True)
 
-    def integrate(self, payload: IntegratedDocPayload | Mapping[str, Any] | str):
+    @staticmethod
+    def _payload(payload: IntegratedDocPayload | Mapping[str, Any] | str) -> dict:
         if not isinstance(payload, IntegratedDocPayload):
             payload = IntegratedDocPayload.model_validate(payload)
-        raw_output = self.invoke(payload.model_dump(), task_prompt=integrated_document_generator_task_prompt)
-        validated_output = DocumentStructure.model_validate(raw_output)
-        return validated_output.model_dump()
+        return payload.model_dump()
 
+    @staticmethod
+    def _validate(raw_output: Any) -> dict:
+        return DocumentStructure.model_validate(raw_output).model_dump()
 
-def integrate_learning_document_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts, output_markdown=True):
+    def integrate(self, payload: IntegratedDocPayload | Mapping[str, Any] | str):
+        return self._validate(self.invoke(self._payload(payload), task_prompt=integrated_document_generator_task_prompt))
+
+    async def aintegrate(self, payload: IntegratedDocPayload | Mapping[str, Any] | str):
+        return self._validate(await self.ainvoke(self._payload(payload), task_prompt=integrated_document_generator_task_prompt))
+
+
+def _integration_input(learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts) -> dict:
     logger.info(f'Integrating learning document with {len(knowledge_points)} knowledge points and {len(knowledge_drafts)} drafts...')
-    input_dict = {
+    return {
         'learner_profile': learner_profile,
         'learning_path': learning_path,
         'learning_session': learning_session,
         'knowledge_points': knowledge_points,
         'knowledge_drafts': knowledge_drafts
     }
-    learning_document_integrator = LearningDocumentIntegrator(llm)
-    document_structure = learning_document_integrator.integrate(input_dict)
+
+
+def _finish_document(document_structure, knowledge_points, knowledge_drafts, output_markdown):
     if not output_markdown:
         return document_structure
     logger.info('Preparing markdown document...')
     return prepare_markdown_document(document_structure, knowledge_points, knowledge_drafts)
 
 
+def integrate_learning_document_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts, output_markdown=True):
+    input_dict = _integration_input(learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts)
+    document_structure = LearningDocumentIntegrator(llm).integrate(input_dict)
+    return _finish_document(document_structure, knowledge_points, knowledge_drafts, output_markdown)
+
+
+async def aintegrate_learning_document_with_llm(llm, learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts, output_markdown=True):
+    input_dict = _integration_input(learner_profile, learning_path, learning_session, knowledge_points, knowledge_drafts)
+    document_structure = await LearningDocumentIntegrator(llm).aintegrate(input_dict)
+    return _finish_document(document_structure, knowledge_points, knowledge_drafts, output_markdown)
+
+
 def prepare_markdown_document(document_structure, knowledge_points, knowledge_drafts):
     """Render a markdown learning document from the integrated structure and drafts.
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Mapping, Optional, Protocol, Sequence, Union, runtime_checkable
+from typing import Any, Dict, Mapping, Optional, Protocol, Sequence, Tuple, Union, runtime_checkable
 from pydantic import BaseModel, Field, field_validator
 
 from base import BaseAgent
@@ -49,30 +49,59 @@ class LearningPathScheduler(BaseAgent):
             jsonalize_output=True,
         )
 
+    # Task name -> (payload model, task prompt), shared by the sync and async methods.
+    _TASKS = {
+        "session": (SessionSchedulePayload, learning_path_scheduler_task_prompt_session),
+        "reflexion": (LearningPathRefinementPayload, learning_path_scheduler_task_prompt_reflexion),
+        "reschedule": (LearningPathReschedulePayload, learning_path_scheduler_task_prompt_reschedule),
+    }
+
+    def _request(self, task: str, input_dict: Dict[str, Any]) -> Tuple[JSONDict, str]:
+        payload_model, task_prompt = self._TASKS[task]
+        return payload_model(**input_dict).model_dump(), task_prompt
+
+    @staticmethod
+    def _validate(raw_output: Any) -> JSONDict:
+        return LearningPath.model_validate(raw_output).model_dump()
+
     def schedule_session(self, input_dict: Dict[str, Any]) -> JSONDict:
         """Schedule sessions based on learner profile and desired count."""
-        payload_dict = SessionSchedulePayload(**input_dict).model_dump()
-        task_prompt = learning_path_scheduler_task_prompt_session
-        raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-        validated_output = LearningPath.model_validate(raw_output)
-        return validated_output.model_dump()
+        payload_dict, task_prompt = self._request("session", input_dict)
+        return self._validate(self.invoke(payload_dict, task_prompt=task_prompt))
 
     def reflexion(self, input_dict: Dict[str, Any]) -> JSONDict:
         """Refine the learning path based on evaluator feedback."""
-        payload_dict = LearningPathRefinementPayload(**input_dict).model_dump()
-        task_prompt = learning_path_scheduler_task_prompt_reflexion
-        raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-        validated = LearningPath.model_validate(raw_output)
-        return validated.model_dump()
+        payload_dict, task_prompt = self._request("reflexion", input_dict)
+        return self._validate(self.invoke(payload_dict, task_prompt=task_prompt))
 
     def reschedule(self, input_dict: Dict[str, Any]) -> JSONDict:
         """Reschedule the learning path with optional new session_count/feedback."""
+        payload_dict, task_prompt = self._request("reschedule", input_dict)
+        return self._validate(self.invoke(payload_dict, task_prompt=task_prompt))
+
+    async def aschedule_session(self, input_dict: Dict[str, Any]) -> JSONDict:
+        """Async counterpart of :meth:`schedule_session`."""
+        payload_dict, task_prompt = self._request("session", input_dict)
+        return self._validate(await self.ainvoke(payload_dict, task_prompt=task_prompt))
+
+    async def areflexion(self, input_dict: Dict[str, Any]) -> JSONDict:
+        """Async counterpart of :meth:`reflexion`."""
+        payload_dict, task_prompt = self._request("reflexion", input_dict)
+        return self._validate(await self.ainvoke(payload_dict, task_prompt=task_prompt))
+
+    async def areschedule(self, input_dict: Dict[str, Any]) -> JSONDict:
+        """Async counterpart of :meth:`reschedule`."""
+        payload_dict, task_prompt = self._request("reschedule", input_dict)
+        return self._validate(await self.ainvoke(payload_dict, task_prompt=task_prompt))
 
-        payload_dict = LearningPathReschedulePayload(**input_dict).model_dump()
-        task_prompt = learning_path_scheduler_task_prompt_reschedule
-        raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-        validated = LearningPath.model_validate(raw_output)
-        return validated.model_dump()
+
+def _reschedule_input(learning_path, learner_profile, session_count, other_feedback) -> JSONDict:
+    return {
+        "learner_profile": learner_profile,
+        "learning_path": learning_path,
+        "session_count": session_count,
+        "other_feedback": other_feedback,
+    }
 
 
 def schedule_learning_path_with_llm(
@@ -83,11 +112,7 @@ def schedule_learning_path_with_llm(
     """Convenience helper to create a scheduler and produce a new learning path."""
 
     learning_path_scheduler = LearningPathScheduler(llm)
-    payload_dict = {
-        "learner_profile": learner_profile,
-        "session_count": session_count,
-    }
-    return learning_path_scheduler.schedule_session(payload_dict)
+    return learning_path_scheduler.schedule_session({"learner_profile": learner_profile, "session_count": session_count})
 
 
 def reschedule_learning_path_with_llm(
@@ -103,13 +128,9 @@ def reschedule_learning_path_with_llm(
     """Convenience helper to reschedule an existing learning path via the scheduler."""
 
     learning_path_scheduler = LearningPathScheduler(llm)
-    payload_dict = {
-        "learner_profile": learner_profile,
-        "learning_path": learning_path,
-        "session_count": session_count,
-        "other_feedback": other_feedback,
-    }
-    return learning_path_scheduler.reschedule(payload_dict)
+    return learning_path_scheduler.reschedule(
+        _reschedule_input(learning_path, learner_profile, session_count, other_feedback)
+    )
 
 
 def refine_learning_path_with_llm(
@@ -123,11 +144,52 @@ def refine_learning_path_with_llm(
     """Convenience helper around :meth:`LearningPathScheduler.reflexion`."""
 
     learning_path_scheduler = LearningPathScheduler(llm)
-    payload_dict = {
-        "learning_path": learning_path,
-        "feedback": feedback,
-    }
-    return learning_path_scheduler.reflexion(payload_dict)
+    return learning_path_scheduler.reflexion({"learning_path": learning_path, "feedback": feedback})
+
+
+async def aschedule_learning_path_with_llm(
+    llm: Any,
+    learner_profile: Mapping[str, Any],
+    session_count: int = 0,
+) -> JSONDict:
+    """Async counterpart of :func:`schedule_learning_path_with_llm`."""
+
+    learning_path_scheduler = LearningPathScheduler(llm)
+    return await learning_path_scheduler.aschedule_session(
+        {"learner_profile": learner_profile, "session_count": session_count}
+    )
+
+
+async def areschedule_learning_path_with_llm(
+    llm: Any,
+    learning_path: Sequence[Any],
+    learner_profile: Mapping[str, Any],
+    session_count: Optional[int] = None,
+    other_feedback: Optional[Union[str, Mapping[str, Any]]] = None,
+    *,
+    system_prompt: str = learning_path_scheduler_system_prompt,
+    task_prompt: str = learning_path_scheduler_task_prompt_reschedule,
+) -> JSONDict:
+    """Async counterpart of :func:`reschedule_learning_path_with_llm`."""
+
+    learning_path_scheduler = LearningPathScheduler(llm)
+    return await learning_path_scheduler.areschedule(
+        _reschedule_input(learning_path, learner_profile, session_count, other_feedback)
+    )
+
+
+async def arefine_learning_path_with_llm(
+    llm: Any,
+    learning_path: Sequence[Any],
+    feedback: Mapping[str, Any],
+    *,
+    system_prompt: str = learning_path_scheduler_system_prompt,
+    task_prompt: str = learning_path_scheduler_task_prompt_reflexion,
+) -> JSONDict:
+    """Async counterpart of :func:`refine_learning_path_with_llm`."""
+
+    learning_path_scheduler = LearningPathScheduler(llm)
+    return await learning_path_scheduler.areflexion({"learning_path": learning_path, "feedback": feedback})
 
 
 __all__ = [
@@ -138,4 +200,7 @@ __all__ = [
     "schedule_learning_path_with_llm",
     "refine_learning_path_with_llm",
     "reschedule_learning_path_with_llm",
+    "aschedule_learning_path_with_llm",
+    "arefine_learning_path_with_llm",
+    "areschedule_learning_path_with_llm",
 ]
\ No newline at end of file
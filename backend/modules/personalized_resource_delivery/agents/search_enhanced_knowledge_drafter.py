@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import ast
-from typing import Any, Mapping, Optional, List
+import asyncio
+from typing import Any, Mapping, Optional, List, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from pydantic import BaseModel, field_validator
 
 from base import BaseAgent
-from base.search_rag import SearchRagManager, format_docs
+from base.search_rag import SearchRagManager
+from base.resource_registry import get_search_rag_manager
 from modules.personalized_resource_delivery.prompts.search_enhanced_knowledge_drafter import (
     search_enhanced_knowledge_drafter_system_prompt,
     search_enhanced_knowledge_drafter_task_prompt,
 )
 from modules.personalized_resource_delivery.schemas import KnowledgeDraft
-from config.loader import default_config
 
 
 class KnowledgeDraftPayload(BaseModel):
@@ -40,30 +41,100 @@ class SearchEnhancedKnowledgeDrafter(BaseAgent):
 
     name: str = "SearchEnhancedKnowledgeDrafter"
 
-    def __init__(self, model: Any, *, search_rag_manager: Optional[SearchRagManager] = None, use_search: bool = True):
+    def __init__(
+        self,
+        model: Any,
+        *,
+        search_rag_manager: Optional[SearchRagManager] = None,
+        use_search: bool = True,
+        retrieve_only: bool = False,
+    ):
         super().__init__(model=model, system_prompt=search_enhanced_knowledge_drafter_system_prompt, jsonalize_output=True)
-        self.search_rag_manager = search_rag_manager or SearchRagManager.from_config(default_config)
+        if search_rag_manager is None and use_search:
+            search_rag_manager = get_search_rag_manager()
+        self.search_rag_manager = search_rag_manager
         self.use_search = use_search
+        # Set when the session's pages were already indexed via ``index_queries``.
+        self.retrieve_only = retrieve_only
 
-    def draft(self, payload: KnowledgeDraftPayload | Mapping[str, Any] | str):
+    @staticmethod
+    def _build_search_query(data: Mapping[str, Any]) -> str:
+        session = data.get("learning_session") or {}
+        session_title = str(session.get("title", "")).strip() or "learning_session"
+        knowledge_point = data.get("knowledge_point") or {}
+        knowledge_point_name = str(knowledge_point.get('name', '')).strip()
+        return f"{session_title} {knowledge_point_name}".strip()
+
+    @staticmethod
+    def _attach_context(data: dict, context: str) -> None:
+        if context:
+            ext = data.get("external_resources") or ""
+            data["external_resources"] = f"{ext}{context}"
+
+    def _draft_request(self, payload: KnowledgeDraftPayload | Mapping[str, Any] | str) -> Tuple[dict, Optional[str]]:
+        """Validate ``payload``; also return the search query, or None when search is off."""
         if not isinstance(payload, KnowledgeDraftPayload):
             payload = KnowledgeDraftPayload.model_validate(payload)
         data = payload.model_dump()
+        if not self.use_search or self.search_rag_manager is None:
+            return data, None
+        return data, self._build_search_query(data)
+
+    def _with_context(self, data: dict, docs: Any) -> dict:
+        self._attach_context(data, self.search_rag_manager.format_context(docs, agent="knowledge_drafter"))
+        return data
+
+    @staticmethod
+    def _validate(raw_output: Any) -> dict:
+        return KnowledgeDraft.model_validate(raw_output).model_dump()
+
+    def draft(self, payload: KnowledgeDraftPayload | Mapping[str, Any] | str):
+        data, query = self._draft_request(payload)
         # Optionally enrich external resources using the search RAG manager
-        if self.use_search and self.search_rag_manager is not None:
-            session = data.get("learning_session") or {}
-            session_title = str(session.get("title", "")).strip() or "learning_session"
-            knowledge_point = data.get("knowledge_point") or {}
-            knowledge_point_name = str(knowledge_point.get('name', '')).strip()
-            query = f"{session_title} {knowledge_point_name}".strip()
-            docs = self.search_rag_manager.invoke(query)
-            context = format_docs(docs)
-            if context:
-                ext = data.get("external_resources") or ""
-                data["external_resources"] = f"{ext}{context}"
-        raw_output = self.invoke(data, task_prompt=search_enhanced_knowledge_drafter_task_prompt)
-        validated_output = KnowledgeDraft.model_validate(raw_output)
-        return validated_output.model_dump()
+        if query is not None:
+            if self.retrieve_only:
+                docs = self.search_rag_manager.retrieve(query)
+            else:
+                docs = self.search_rag_manager.invoke(query)
+            data = self._with_context(data, docs)
+        return self._validate(self.invoke(data, task_prompt=search_enhanced_knowledge_drafter_task_prompt))
+
+    async def adraft(self, payload: KnowledgeDraftPayload | Mapping[str, Any] | str):
+        data, query = self._draft_request(payload)
+        if query is not None:
+            if self.retrieve_only:
+                docs = await self.search_rag_manager.aretrieve(query)
+            else:
+                docs = await self.search_rag_manager.ainvoke(query)
+            data = self._with_context(data, docs)
+        return self._validate(await self.ainvoke(data, task_prompt=search_enhanced_knowledge_drafter_task_prompt))
+
+
+def build_knowledge_point_queries(learning_session, knowledge_points) -> List[str]:
+    """Search queries the drafter would issue for each knowledge point of a session."""
+    return [
+        SearchEnhancedKnowledgeDrafter._build_search_query({"learning_session": learning_session, "knowledge_point": kp})
+        for kp in knowledge_points
+    ]
+
+
+def _draft_input(learner_profile, learning_path, learning_session, knowledge_points, knowledge_point) -> dict:
+    return {
+        "learner_profile": learner_profile,
+        "learning_path": learning_path,
+        "learning_session": learning_session,
+        "knowledge_points": knowledge_points,
+        "knowledge_point": knowledge_point,
+    }
+
+
+def _parse_session_and_points(learning_session, knowledge_points):
+    if isinstance(learning_session, str):
+        learning_session = ast.literal_eval(learning_session)
+    if isinstance(knowledge_points, str):
+        knowledge_points = ast.literal_eval(knowledge_points)
+    return learning_session, knowledge_points
+
 
 def draft_knowledge_point_with_llm(
     llm,
@@ -75,17 +146,13 @@ def draft_knowledge_point_with_llm(
     use_search: bool = True,
     *,
     search_rag_manager: Optional[SearchRagManager] = None,
+    retrieve_only: bool = False,
 ):
     """Draft a single knowledge point using the agent, optionally enriching with a SearchRagManager."""
-    drafter = SearchEnhancedKnowledgeDrafter(llm, search_rag_manager=search_rag_manager, use_search=use_search)
-    payload = {
-        "learner_profile": learner_profile,
-        "learning_path": learning_path,
-        "learning_session": learning_session,
-        "knowledge_points": knowledge_points,
-        "knowledge_point": knowledge_point,
-    }
-    return drafter.draft(payload)
+    drafter = SearchEnhancedKnowledgeDrafter(
+        llm, search_rag_manager=search_rag_manager, use_search=use_search, retrieve_only=retrieve_only
+    )
+    return drafter.draft(_draft_input(learner_profile, learning_path, learning_session, knowledge_points, knowledge_point))
 
 
 def draft_knowledge_points_with_llm(
@@ -101,12 +168,11 @@ def draft_knowledge_points_with_llm(
     search_rag_manager: Optional[SearchRagManager] = None,
 ):
     """Draft multiple knowledge points in parallel or sequentially using the agent."""
-    if isinstance(learning_session, str):
-        learning_session = ast.literal_eval(learning_session)
-    if isinstance(knowledge_points, str):
-        knowledge_points = ast.literal_eval(knowledge_points)
+    learning_session, knowledge_points = _parse_session_and_points(learning_session, knowledge_points)
     if search_rag_manager is None and use_search:
-        search_rag_manager = SearchRagManager.from_config(default_config)
+        search_rag_manager = get_search_rag_manager()
+    if use_search:
+        search_rag_manager.index_queries(build_knowledge_point_queries(learning_session, knowledge_points))
     def draft_one(kp):
         return draft_knowledge_point_with_llm(
             llm,
@@ -117,6 +183,7 @@ def draft_knowledge_points_with_llm(
             kp,
             use_search=use_search,
             search_rag_manager=search_rag_manager,
+            retrieve_only=True,
         )
 
     if allow_parallel:
@@ -129,13 +196,84 @@ def draft_knowledge_points_with_llm(
         return results
 
 
+async def adraft_knowledge_point_with_llm(
+    llm,
+    learner_profile,
+    learning_path,
+    learning_session,
+    knowledge_points,
+    knowledge_point,
+    use_search: bool = True,
+    *,
+    search_rag_manager: Optional[SearchRagManager] = None,
+    retrieve_only: bool = False,
+):
+    """Async counterpart of :func:`draft_knowledge_point_with_llm`."""
+    if search_rag_manager is None and use_search:
+        search_rag_manager = await asyncio.to_thread(get_search_rag_manager)
+    drafter = SearchEnhancedKnowledgeDrafter(
+        llm, search_rag_manager=search_rag_manager, use_search=use_search, retrieve_only=retrieve_only
+    )
+    return await drafter.adraft(_draft_input(learner_profile, learning_path, learning_session, knowledge_points, knowledge_point))
+
+
+async def adraft_knowledge_points_with_llm(
+    llm,
+    learner_profile,
+    learning_path,
+    learning_session,
+    knowledge_points,
+    allow_parallel: bool = True,
+    use_search: bool = True,
+    max_workers: int = 8,
+    *,
+    search_rag_manager: Optional[SearchRagManager] = None,
+):
+    """Draft multiple knowledge points concurrently on the event loop.
+
+    At most ``max_workers`` drafts are in flight at once; results keep the order of ``knowledge_points``.
+    """
+    learning_session, knowledge_points = _parse_session_and_points(learning_session, knowledge_points)
+    if search_rag_manager is None and use_search:
+        search_rag_manager = await asyncio.to_thread(get_search_rag_manager)
+    if use_search:
+        await search_rag_manager.aindex_queries(build_knowledge_point_queries(learning_session, knowledge_points))
+
+    async def draft_one(kp):
+        return await adraft_knowledge_point_with_llm(
+            llm,
+            learner_profile,
+            learning_path,
+            learning_session,
+            knowledge_points,
+            kp,
+            use_search=use_search,
+            search_rag_manager=search_rag_manager,
+            retrieve_only=True,
+        )
+
+    if allow_parallel:
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def bounded_draft(kp):
+            async with semaphore:
+                return await draft_one(kp)
+
+        return list(await asyncio.gather(*(bounded_draft(kp) for kp in knowledge_points)))
+    else:
+        results: List[Any] = []
+        for kp in knowledge_points:
+            results.append(await draft_one(kp))
+        return results
+
+
 if __name__ == "__main__":
     from config.loader import default_config
     from base.llm_factory import LLMFactory
     import logging
 
     llm = LLMFactory.from_config(default_config.llm)
-    search_rag_manager = SearchRagManager.from_config(default_config)
+    search_rag_manager = get_search_rag_manager(default_config)
     logging.basicConfig(level=default_config.log_level)
     logger = logging.getLogger(__name__)
 
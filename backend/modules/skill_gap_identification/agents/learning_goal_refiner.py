@@ -26,6 +26,10 @@ class LearningGoalRefiner(BaseAgent):
 	def __init__(self, model: Any) -> None:
 		super().__init__(model=model, system_prompt=learning_goal_refiner_system_prompt, jsonalize_output=True)
 
+	@staticmethod
+	def _validate(raw_output: Any) -> JSONDict:
+		return RefinedLearningGoal.model_validate(raw_output).model_dump()
+
 	def refine_goal(
 		self,
 		input_dict: Mapping[str, Any],
@@ -33,10 +37,16 @@ class LearningGoalRefiner(BaseAgent):
 		"""Refine a learner's goal using contextual learner information."""
 
 		payload_dict = RefineGoalPayload(**input_dict).model_dump()
-		task_prompt = learning_goal_refiner_task_prompt
-		raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-		validated = RefinedLearningGoal.model_validate(raw_output)
-		return validated.model_dump()
+		return self._validate(self.invoke(payload_dict, task_prompt=learning_goal_refiner_task_prompt))
+
+	async def arefine_goal(
+		self,
+		input_dict: Mapping[str, Any],
+	) -> JSONDict:
+		"""Async counterpart of :meth:`refine_goal`."""
+
+		payload_dict = RefineGoalPayload(**input_dict).model_dump()
+		return self._validate(await self.ainvoke(payload_dict, task_prompt=learning_goal_refiner_task_prompt))
 
 def refine_learning_goal_with_llm(
 	llm: Any,
@@ -46,9 +56,15 @@ def refine_learning_goal_with_llm(
 	"""Refine a learner's goal using the provided LLM."""
 
 	refiner = LearningGoalRefiner(llm)
-	return refiner.refine_goal(
-		{
-			"learning_goal": learning_goal,
-			"learner_information": learner_information,
-		}
-	)
+	return refiner.refine_goal({"learning_goal": learning_goal, "learner_information": learner_information})
+
+
+async def arefine_learning_goal_with_llm(
+	llm: Any,
+	learning_goal: str,
+	learner_information: str = "",
+) -> JSONDict:
+	"""Async counterpart of :func:`refine_learning_goal_with_llm`."""
+
+	refiner = LearningGoalRefiner(llm)
+	return await refiner.arefine_goal({"learning_goal": learning_goal, "learner_information": learner_information})
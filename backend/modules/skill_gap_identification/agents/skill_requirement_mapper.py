@@ -29,15 +29,25 @@ class SkillRequirementMapper(BaseAgent):
 			jsonalize_output=True,
 		)
 
+	@staticmethod
+	def _validate(raw_output: Any) -> JSONDict:
+		return SkillRequirements.model_validate(raw_output).model_dump()
+
 	def map_goal_to_skill(self, input_dict: Mapping[str, Any]) -> JSONDict:
 		payload_dict = Goal2SkillPayload(**input_dict).model_dump()
-		task_prompt = skill_requirement_mapper_task_prompt
-		raw_output = self.invoke(payload_dict, task_prompt=task_prompt)
-		validated = SkillRequirements.model_validate(raw_output)
-		return validated.model_dump()
+		return self._validate(self.invoke(payload_dict, task_prompt=skill_requirement_mapper_task_prompt))
+
+	async def amap_goal_to_skill(self, input_dict: Mapping[str, Any]) -> JSONDict:
+		payload_dict = Goal2SkillPayload(**input_dict).model_dump()
+		return self._validate(await self.ainvoke(payload_dict, task_prompt=skill_requirement_mapper_task_prompt))
 
 
 def map_goal_to_skills_with_llm(llm: Any, learning_goal: str) -> JSONDict:
 	mapper = SkillRequirementMapper(llm)
 	return mapper.map_goal_to_skill({"learning_goal": learning_goal})
 
+
+async def amap_goal_to_skills_with_llm(llm: Any, learning_goal: str) -> JSONDict:
+	mapper = SkillRequirementMapper(llm)
+	return await mapper.amap_goal_to_skill({"learning_goal": learning_goal})
+
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from base.ann_vectorstore import AnnVectorStore
+
+DIM = 8
+
+
+def _one_hot(position: int) -> list:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[position] = 1.0
+    return vector.tolist()
+
+
+def _search_ids(store: AnnVectorStore, position: int, k: int = 2) -> list:
+    return [doc.id for doc, _ in store.similarity_search_with_score_by_vector(_one_hot(position), k)]
+
+
+def test_add_search_delete_compact_search(tmp_path):
+    # fold_every=2 pushes the first rows into the HNSW index and leaves the last one to the exact scan.
+    store = AnnVectorStore(None, str(tmp_path), "tiny", fold_every=2)
+    try:
+        ids = [f"c{i}" for i in range(5)]
+        store.add_vectors([_one_hot(0), _one_hot(1)], ["zero", "one"], ids=ids[:2])
+        store.add_vectors([_one_hot(2), _one_hot(3)], ["two", "three"], ids=ids[2:4])
+        store.add_vectors([_one_hot(4)], ["four"], ids=ids[4:])
+
+        assert _search_ids(store, 1)[0] == "c1"
+        assert _search_ids(store, 4)[0] == "c4"
+
+        store.delete(["c1", "c4"])
+        assert "c1" not in _search_ids(store, 1, k=5)
+        assert "c4" not in _search_ids(store, 4, k=5)
+
+        assert store.compact() == {"live_rows": 3, "dropped_rows": 2}
+        assert sorted(_search_ids(store, 0, k=5)) == ["c0", "c2", "c3"]
+        assert _search_ids(store, 3)[0] == "c3"
+    finally:
+        store.close()
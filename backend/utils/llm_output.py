@@ -64,3 +64,56 @@ def preprocess_response(response, only_text=True, exclude_think=False, json_outp
             raise e
     return response
 
+
+class ThinkTagFilter:
+    """Incrementally strip ``<think>...</think>`` blocks from streamed text.
+
+    Tags may be split across chunks, so a possible partial tag at the end of a
+    chunk is held back until the next chunk arrives. Leading whitespace of the
+    visible answer is dropped, matching :func:`extract_think_and_result`.
+    """
+
+    OPEN_TAG = "<think>"
+    CLOSE_TAG = "</think>"
+
+    def __init__(self):
+        self._buffer = ""
+        self._inside_think = False
+        self._started = False
+
+    @staticmethod
+    def _partial_tag_length(text, tag):
+        for size in range(min(len(text), len(tag) - 1), 0, -1):
+            if text.endswith(tag[:size]):
+                return size
+        return 0
+
+    def _emit(self, text):
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
+    def feed(self, chunk):
+        self._buffer += chunk
+        output = ""
+        while self._buffer:
+            tag = self.CLOSE_TAG if self._inside_think else self.OPEN_TAG
+            idx = self._buffer.find(tag)
+            if idx >= 0:
+                if not self._inside_think:
+                    output += self._buffer[:idx]
+                self._buffer = self._buffer[idx + len(tag):]
+                self._inside_think = not self._inside_think
+                continue
+            keep = self._partial_tag_length(self._buffer, tag)
+            if not self._inside_think:
+                output += self._buffer[:len(self._buffer) - keep]
+            self._buffer = self._buffer[len(self._buffer) - keep:]
+            break
+        return self._emit(output)
+
+    def flush(self):
+        remaining = "" if self._inside_think else self._buffer
+        self._buffer = ""
+        return self._emit(remaining)
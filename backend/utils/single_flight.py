@@ -0,0 +1,52 @@
+import json
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one shared computation.
+
+    The first caller for a key starts the work; callers arriving with the same
+    key while it is still running await the same task and receive its result
+    (or exception). Each waiter is shielded, so a disconnecting client does not
+    cancel the computation for the others. Keys are forgotten once the task
+    finishes, so later calls run afresh.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = {"started": 0, "shared": 0}
+
+    @staticmethod
+    def make_key(name: str, payload: Any) -> str:
+        """Hash ``name`` and a normalized JSON form of ``payload``."""
+        normalized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(f"{name}\n{normalized}".encode("utf-8")).hexdigest()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self._stats["started"] += 1
+            task.add_done_callback(lambda finished: self._finish(key, finished))
+        else:
+            self._stats["shared"] += 1
+            logger.debug(f"Joining in-flight call {key[:12]}")
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away.
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "inflight": len(self._inflight)}
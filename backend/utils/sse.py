@@ -0,0 +1,38 @@
+import json
+import asyncio
+from typing import Any, AsyncIterator, Optional
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """Encode one Server-Sent Events message with a JSON payload."""
+    lines = []
+    if event:
+        lines.append(f"event: {event}")
+    payload = json.dumps(data, ensure_ascii=False)
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+async def with_heartbeat(messages: AsyncIterator[str], interval: float = 15.0) -> AsyncIterator[str]:
+    """Relay SSE messages, inserting a comment line whenever ``interval`` seconds pass without one.
+
+    Long pipeline stages can be silent for minutes; the comments keep proxies
+    and load balancers from closing the idle connection.
+    """
+    iterator = messages.__aiter__()
+    pending = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=interval)
+            if not done:
+                yield ": keep-alive\n\n"
+                continue
+            try:
+                message = pending.result()
+            except StopAsyncIteration:
+                return
+            yield message
+            pending = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        if not pending.done():
+            pending.cancel()
@@ -1,6 +1,6 @@
 import streamlit as st
 from streamlit_float import *
-from utils.request_api import chat_with_tutor
+from utils.request_api import stream_chat_with_tutor
 from utils.state import index_goal_by_id
 
 
@@ -20,11 +20,13 @@ def ask_autor_chatbot():
     if prompt := st.chat_input("Ask me anything"):
         messages.chat_message("user").write(prompt)
         st.session_state["tutor_messages"].append({"role": "user", "content": prompt})
-        response = chat_with_tutor(
-            st.session_state["tutor_messages"][-20:], 
-            learner_profile,
-            st.session_state["llm_type"])
-        messages.chat_message("assistant").write(response)
+        response = messages.chat_message("assistant").write_stream(
+            stream_chat_with_tutor(
+                st.session_state["tutor_messages"][-20:],
+                learner_profile,
+                st.session_state["llm_type"],
+            )
+        )
         st.session_state["tutor_messages"].append({"role": "assistant", "content": response})
         # messages.chat_message("assistant").write(f"Echo: {prompt}")
 
@@ -5,6 +5,7 @@ from config import backend_endpoint, use_mock_data, use_search
 
 API_NAMES = {
     "chat_with_tutor": "chat-with-tutor",
+    "chat_with_tutor_stream": "chat-with-tutor-stream",
     "refine_goal": "refine-learning-goal",
     "identify_skill_gap": "identify-skill-gap-with-info",
     "create_profile": "create-learner-profile-with-info",
@@ -65,6 +66,39 @@ def chat_with_tutor(chat_messages, learner_profile, llm_type="gpt4o", method_nam
     response = make_post_request(API_NAMES["chat_with_tutor"], data, "./assets/data_example/ai)tutor_chat.json")
     return response.get("response") if response else None
 
+def stream_chat_with_tutor(chat_messages, learner_profile, llm_type="gpt4o", method_name="genmentor", timeout=500):
+    """Yield tutor reply deltas from the SSE endpoint as they arrive."""
+    if use_mock_data:
+        yield chat_with_tutor(chat_messages, learner_profile, llm_type, method_name) or ""
+        return
+    data = {
+        "messages": str(chat_messages),
+        "learner_profile": str(learner_profile),
+        "llm_type": str(llm_type),
+        "method_name": str(method_name),
+    }
+    backend_url = f"{backend_endpoint}{API_NAMES['chat_with_tutor_stream']}"
+    try:
+        with httpx.stream("POST", backend_url, json=data, timeout=timeout) as response:
+            if response.status_code != 200:
+                st.write("Failed to fetch data. Status code:", response.status_code)
+                return
+            event = None
+            for line in response.iter_lines():
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    payload = json.loads(line[len("data:"):].strip())
+                    if event == "error":
+                        st.write("Failed to fetch data. Error:", payload.get("detail"))
+                        return
+                    if event is None and payload.get("delta"):
+                        yield payload["delta"]
+                elif not line:
+                    event = None
+    except Exception as e:
+        st.write("Failed to fetch data. Error:", e)
+
 def refine_learning_goal(learning_goal, learner_information, llm_type="gpt4o", method_name="genmentor"):
     data = {
         "learning_goal": str(learning_goal),